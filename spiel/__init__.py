@@ -1,12 +1,19 @@
-from spiel.app import SuspendType, present
-from spiel.constants import __version__
-from spiel.deck import Deck
-from spiel.slide import Slide
-from spiel.transitions.protocol import Direction, Transition
-from spiel.transitions.swipe import Swipe
-from spiel.triggers import Triggers
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from spiel.app import SuspendType, present
+    from spiel.constants import __version__
+    from spiel.deck import Deck
+    from spiel.slide import Slide
+    from spiel.transitions.protocol import CompositingTransition, Direction, Transition
+    from spiel.transitions.swipe import Swipe
+    from spiel.triggers import Triggers
 
 __all__ = [
+    "CompositingTransition",
     "Deck",
     "Direction",
     "Slide",
@@ -17,3 +24,33 @@ __all__ = [
     "__version__",
     "present",
 ]
+
+# The public API is imported on first use,
+# so that importing a submodule (e.g., the CLI) doesn't also import Textual.
+_LAZY = {
+    "CompositingTransition": "spiel.transitions.protocol",
+    "Deck": "spiel.deck",
+    "Direction": "spiel.transitions.protocol",
+    "Slide": "spiel.slide",
+    "SuspendType": "spiel.app",
+    "Swipe": "spiel.transitions.swipe",
+    "Transition": "spiel.transitions.protocol",
+    "Triggers": "spiel.triggers",
+    "__version__": "spiel.constants",
+    "present": "spiel.app",
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -7,7 +7,8 @@ import importlib.util
 import os
 import sys
 from asyncio import wait
-from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, redirect_stderr, redirect_stdout
 from functools import cached_property, partial
 from pathlib import Path
 from time import monotonic
@@ -18,13 +19,17 @@ from rich.text import Text
 from textual import log
 from textual.app import App
 from textual.binding import Binding
-from textual.events import Resize
-from textual.reactive import reactive
+from textual.events import Event, InputEvent, Key, Resize
+from textual.reactive import reactive, var
 from watchfiles import awatch
 
+from spiel import background, instrumentation, quality
 from spiel.constants import DECK, RELOAD_MESSAGE_TIME_FORMAT
 from spiel.deck import Deck
+from spiel.disk_cache import DiskCache, caching, default_directory
 from spiel.exceptions import NoDeckFound
+from spiel.performance import ByteCounter
+from spiel.scheduling import Clock, Subscription
 from spiel.screens.deck import DeckScreen
 from spiel.screens.help import HelpScreen
 from spiel.screens.slide import SlideScreen
@@ -34,32 +39,39 @@ from spiel.triggers import Triggers
 from spiel.utils import clamp
 from spiel.widgets.slide import SlideWidget
 
+SETTLE_DELAY = 0.3
+
 
 def load_deck(path: Path) -> Deck:
-    module_name = "__deck"
-    spec = importlib.util.spec_from_file_location(module_name, path)
+    with instrumentation.span("load_deck", "deck", path=path):
+        module_name = "__deck"
+        spec = importlib.util.spec_from_file_location(module_name, path)
 
-    if spec is None:
-        raise NoDeckFound(f"{path.resolve()} does not appear to be an importable Python module.")
+        if spec is None:
+            raise NoDeckFound(
+                f"{path.resolve()} does not appear to be an importable Python module."
+            )
 
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
 
-    loader = spec.loader
-    assert loader is not None
-    loader.exec_module(module)
+        loader = spec.loader
+        assert loader is not None
+        loader.exec_module(module)
 
-    try:
-        deck = getattr(module, DECK)
-    except AttributeError:
-        raise NoDeckFound(f"The module at {path} does not have an attribute named {DECK}.")
+        try:
+            deck = getattr(module, DECK)
+        except AttributeError:
+            raise NoDeckFound(f"The module at {path} does not have an attribute named {DECK}.")
 
-    if not isinstance(deck, Deck):
-        raise NoDeckFound(
-            f"The module at {path} has an attribute named {DECK}, but it is a {type(deck).__name__}, not a {Deck.__name__}."
-        )
+        if not isinstance(deck, Deck):
+            raise NoDeckFound(
+                f"The module at {path} has an attribute named {DECK}, but it is a {type(deck).__name__}, not a {Deck.__name__}."
+            )
 
-    return deck
+        deck.compile()
+
+        return deck
 
 
 SuspendType = Callable[[], ContextManager[None]]
@@ -72,16 +84,28 @@ class SpielApp(App[None]):
         Binding("question_mark", "push_screen('help')", "Go to the Help view."),
         Binding("i", "repl", "Switch to the REPL."),
         Binding("p", "screenshot", "Take a screenshot."),
+        Binding("f", "toggle_performance", "Toggle the performance overlay."),
     ]
 
     deck = reactive(Deck(name="New Deck"))
     current_slide_idx = reactive(0)
     message = reactive(Text(""))
+    deck_miniatures = reactive(False)
+    over_budget = reactive(False)
+    show_performance = reactive(False)
+    last_activity: float = var(monotonic)  # type: ignore[assignment,arg-type]
+    settling = var(False)
+    """\
+    Whether expensive content (like images) is being rendered at preview quality,
+    because the terminal is being resized or a transition is running.
+    """
 
     def __init__(
         self,
         deck_path: Path,
         watch_path: Path | None = None,
+        idle_timeout: float | None = None,
+        thumbnail_workers: int | None = None,
         _show_messages: bool = True,
         _fixed_time: datetime.datetime | None = None,
         _fixed_triggers: Triggers | None = None,
@@ -92,6 +116,13 @@ class SpielApp(App[None]):
 
         self.deck_path = deck_path
         self.watch_path = watch_path
+        self.idle_timeout = idle_timeout
+        self.thumbnail_executor = (
+            ThreadPoolExecutor(max_workers=thumbnail_workers, thread_name_prefix="thumbnails")
+            if thumbnail_workers != 0
+            else None
+        )
+        self.image_executor = ThreadPoolExecutor(thread_name_prefix="images")
 
         self.show_messages = _show_messages
         self.fixed_time = _fixed_time
@@ -99,7 +130,19 @@ class SpielApp(App[None]):
         self.enable_transitions = _enable_transitions
         self.slide_refresh_rate = _slide_refresh_rate
 
+        self.clock = Clock(self)
+        self.output: ByteCounter | None = None
+        self._settle_timer: Subscription | None = None
+
     async def on_mount(self) -> None:
+        loop = asyncio.get_running_loop()
+        background.install(
+            background.Workers(
+                executor=self.image_executor,
+                on_ready=partial(loop.call_soon_threadsafe, self.on_background_work_ready),
+            )
+        )
+
         self.deck = load_deck(self.deck_path)
         self.reloader = asyncio.create_task(self.reload())
 
@@ -117,7 +160,8 @@ class SpielApp(App[None]):
             change_msg = "\n  ".join([""] + [f"{k.raw_str()}: {v}" for k, v in changes])
             log(f"Reloading deck from {self.deck_path} due to detected file changes:{change_msg}")
             try:
-                self.deck = load_deck(self.deck_path)
+                with instrumentation.span("reload_deck", "deck", path=self.deck_path):
+                    self.deck = load_deck(self.deck_path)
                 self.current_slide_idx = clamp(self.current_slide_idx, 0, len(self.deck))
                 self.set_message_temporarily(
                     Text(
@@ -135,11 +179,68 @@ class SpielApp(App[None]):
                     delay=10,
                 )
 
+    async def on_event(self, event: Event) -> None:
+        if isinstance(event, InputEvent):
+            self.last_activity = monotonic()
+
+        if isinstance(event, Key):
+            with instrumentation.span("key", "input", key=event.key):
+                await super().on_event(event)
+        else:
+            await super().on_event(event)
+
+    @property
+    def idle(self) -> bool:
+        """Whether there has been no user input for longer than the idle timeout."""
+        return (
+            self.idle_timeout is not None and monotonic() - self.last_activity > self.idle_timeout
+        )
+
     def on_resize(self, event: Resize) -> None:
+        self.settle_later()
+
         self.set_message_temporarily(
             message=Text(f"Screen resized to {event.size}", style=Style(dim=True)), delay=2
         )
 
+    def settle_later(self, delay: float = SETTLE_DELAY) -> None:
+        """
+        Render at preview quality until nothing has called this for `delay` seconds.
+        """
+        self.settling = True
+
+        if self._settle_timer is not None:
+            self.clock.cancel(self._settle_timer)
+        self._settle_timer = self.clock.at(monotonic() + delay, self.settle)
+
+    def settle(self) -> None:
+        if self._settle_timer is not None:
+            self.clock.cancel(self._settle_timer)
+            self._settle_timer = None
+
+        self.settling = False
+
+    def on_unmount(self) -> None:
+        # settling and the background workers are global, so they shouldn't outlive the app
+        quality.set_settling(False)
+        background.install(None)
+
+        # however the app exits, don't leave thumbnails and images rendering behind it
+        if self.thumbnail_executor is not None:
+            self.thumbnail_executor.shutdown(wait=False, cancel_futures=True)
+        self.image_executor.shutdown(wait=False, cancel_futures=True)
+
+    def watch_settling(self, settling: bool) -> None:
+        quality.set_settling(settling)
+
+        if not settling:
+            # re-render whatever was rendered at preview quality
+            self.screen.query("*").refresh()
+
+    def on_background_work_ready(self) -> None:
+        # re-render whatever was displayed as a placeholder
+        self.screen.query("*").refresh()
+
     def set_message_temporarily(self, message: Text, delay: float) -> None:
         if not self.show_messages:
             return
@@ -182,20 +283,41 @@ class SpielApp(App[None]):
             direction=direction,
             transition=transition,
         )
+        self.settling = True
+
+        started = instrumentation.now()
+        instrumentation.record(
+            "transition_start",
+            started,
+            category="transition",
+            transition=type(transition_screen.transition).__name__,
+        )
         await self.switch_screen(transition_screen)
         transition_screen.animate(
             "progress",
             value=100,
             delay=0,
             duration=0.75,
-            on_complete=lambda: self.finalize_transition(new_slide_idx),
+            on_complete=lambda: self.finalize_transition(new_slide_idx, started),
         )
 
-    async def finalize_transition(self, new_slide_idx: int) -> None:
+    async def finalize_transition(self, new_slide_idx: int, started: float | None = None) -> None:
         await self.switch_screen("slide")
 
         self.current_slide_idx = new_slide_idx
 
+        # unless the terminal is also being resized
+        if self._settle_timer is None:
+            self.settle()
+
+        if started is not None:
+            instrumentation.record(
+                "transition", started, instrumentation.now(), category="transition"
+            )
+            instrumentation.record(
+                "transition_finish", instrumentation.now(), category="transition"
+            )
+
     def action_next_row(self) -> None:
         self.current_slide_idx = clamp(
             self.current_slide_idx + self.deck_grid_width, 0, len(self.deck) - 1
@@ -206,11 +328,28 @@ class SpielApp(App[None]):
             self.current_slide_idx - self.deck_grid_width, 0, len(self.deck) - 1
         )
 
+    def action_toggle_performance(self) -> None:
+        if self.output is None:
+            # count the bytes of the screen updates that are written to the terminal
+            self.output = ByteCounter(self.console.file)
+            self.console.file = self.output  # type: ignore[assignment]
+
+        self.show_performance = not self.show_performance
+
+    def post_display_hook(self) -> None:
+        # the screen is written in several parts, so the size of the update is only known here
+        if self.output is not None:
+            self.output.end_update()
+
+    def action_toggle_deck_miniatures(self) -> None:
+        self.deck_miniatures = not self.deck_miniatures
+
     def watch_deck(self, new_deck: Deck) -> None:
         self.title = new_deck.name
 
     def watch_current_slide_idx(self, new_current_slide_idx: int) -> None:
         self.query_one(SlideWidget).triggers = self.fixed_triggers or Triggers.new()
+        self.over_budget = False
         self.sub_title = self.deck[new_current_slide_idx].title
 
     def action_trigger(self) -> None:
@@ -261,7 +400,14 @@ class SpielApp(App[None]):
         return max(self.size.width // 35, 1)
 
 
-def present(deck_path: Path | str, watch_path: Path | str | None = None) -> None:
+def present(
+    deck_path: Path | str,
+    watch_path: Path | str | None = None,
+    idle_timeout: float | None = None,
+    thumbnail_workers: int | None = None,
+    trace: Path | str | None = None,
+    disk_cache: bool = False,
+) -> None:
     """
     Present the deck defined in the given `deck_path`.
 
@@ -269,10 +415,36 @@ def present(deck_path: Path | str, watch_path: Path | str | None = None) -> None
         deck_path: The file to look for a deck in.
         watch_path: When filesystem changes are detected below this path (recursively), reload the deck from the `deck_path`.
             If `None` (the default), use the parent directory of the `deck_path`.
+        idle_timeout: Stop re-rendering animated slides after this many seconds without any user input,
+            until the next key press.
+            If `None` (the default), animated slides are always re-rendered.
+        thumbnail_workers: The number of threads to render Deck view thumbnails in.
+            If `None` (the default), use a number of threads based on the number of CPUs.
+            If `0`, render thumbnails as they are displayed, without a worker pool.
+        trace: If not `None`, record how long loading the deck, rendering slides and thumbnails,
+            transitions, and handling key presses take,
+            and write them to this file in the Chrome trace event format when the presentation ends.
+        disk_cache: If `True`, cache converted images on disk (in Spiel's XDG cache directory),
+            so that they can be displayed right away the next time the deck is presented.
     """
     os.environ["TEXTUAL"] = ",".join(sorted({"debug", "devtools"}))
 
     deck_path = Path(deck_path).resolve()
     watch_path = Path(watch_path or deck_path.parent).resolve()
 
-    SpielApp(deck_path=deck_path, watch_path=watch_path).run()
+    app = SpielApp(
+        deck_path=deck_path,
+        watch_path=watch_path,
+        idle_timeout=idle_timeout,
+        thumbnail_workers=thumbnail_workers,
+    )
+
+    with ExitStack() as stack:
+        if disk_cache:
+            stack.enter_context(caching(DiskCache(default_directory())))
+
+        if trace is not None:
+            tracer = stack.enter_context(instrumentation.tracing(instrumentation.Tracer()))
+            stack.callback(tracer.write_chrome_trace, Path(trace))
+
+        app.run()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import ContextManager
+
+from spiel.utils import Installed
+
+
+@dataclass(frozen=True)
+class Workers:
+    """
+    Where renderables can do slow work (like decoding images)
+    instead of blocking the thread that is displaying them.
+    """
+
+    executor: Executor
+
+    on_ready: Callable[[], object]
+    """\
+    Called (from any thread) when some work has finished,
+    so that whatever was displayed in the meantime can be re-rendered.
+    """
+
+    thread: int = field(default_factory=threading.get_ident)
+    """\
+    The thread that must not be blocked (e.g., the one running the app's event loop).
+    Work that is requested from any other thread is already off that thread,
+    so it can just be done right away.
+    """
+
+    def should_defer(self) -> bool:
+        """Whether work requested from the current thread should be done by the workers."""
+        return threading.get_ident() == self.thread
+
+
+_installed: Installed[Workers] = Installed()
+
+
+def install(workers: Workers | None) -> None:
+    """
+    Start doing slow work with the given workers,
+    or do it right away if `workers` is `None`.
+    """
+    _installed.install(workers)
+
+
+def installed() -> Workers | None:
+    """The workers that slow work should be done by, if there are any."""
+    return _installed.value
+
+
+def working(workers: Workers) -> ContextManager[Workers]:
+    """
+    Do slow work with the given workers within the `with` block.
+    """
+    return _installed.using(workers)
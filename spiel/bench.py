@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass
+from io import StringIO
+from math import ceil
+from pathlib import Path
+from time import perf_counter
+
+from rich.console import Console
+from rich.style import Style
+from rich.table import Column, Table
+from rich.text import Text
+
+from spiel.deck import Deck
+from spiel.renderables import animated, image
+from spiel.renderables.cached import Lines, RenderedLines
+from spiel.renderables.image import image_cache
+from spiel.slide import Slide, lay_out
+from spiel.triggers import Triggers
+
+Size = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Result:
+    """
+    How long a slide took to render at one size and trigger step,
+    and how much it wrote to the terminal.
+    """
+
+    slide: int
+    """The number of the slide in the deck, starting from `1`."""
+    title: str
+    size: Size
+    step: int
+    """The number of times the slide had been triggered, not counting the initial trigger."""
+    min: float
+    """The fastest render time, in seconds."""
+    p50: float
+    """The median render time, in seconds."""
+    p99: float
+    """The 99th percentile render time, in seconds."""
+    output_bytes: int
+    """The number of bytes written to the terminal to display the slide."""
+    failed: bool = False
+
+    @property
+    def key(self) -> tuple[int, Size, int]:
+        """Identifies the measurement, for comparing it to a baseline."""
+        return self.slide, self.size, self.step
+
+
+@dataclass(frozen=True)
+class Regression:
+    result: Result
+    baseline: Result
+
+    @property
+    def slowdown(self) -> float:
+        """How many times slower the median render time is than the baseline's."""
+        return self.result.p50 / self.baseline.p50 if self.baseline.p50 > 0 else float("inf")
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    The `q`-th percentile of the values, using the nearest-rank method.
+    """
+    ordered = sorted(values)
+    rank = ceil((q / 100) * len(ordered))
+    return ordered[min(max(rank - 1, 0), len(ordered) - 1)]
+
+
+def parse_size(size: str) -> Size:
+    """
+    Parse a terminal size like `80x24` into a width and height.
+    """
+    try:
+        width, height = (int(part) for part in size.lower().split("x"))
+    except ValueError:
+        raise ValueError(f"Invalid size {size!r}, expected WIDTHxHEIGHT (e.g., 80x24)")
+
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Invalid size {size!r}, width and height must be positive")
+
+    return width, height
+
+
+def trigger_steps(slide: Slide, steps: int) -> Iterator[tuple[int, Triggers]]:
+    """
+    The triggers to render the slide with: the initial trigger,
+    then (if the slide takes triggers) after each of up to `steps` more triggers.
+    """
+    start = 0.0
+    for step in range(steps + 1 if slide.takes_triggers else 1):
+        times = tuple(start + t for t in range(step + 1))
+        yield step, Triggers(now=times[-1], _times=times)
+
+
+def bench_console(size: Size) -> Console:
+    width, height = size
+    return Console(
+        file=StringIO(),
+        width=width,
+        height=height,
+        force_terminal=True,
+        color_system="truecolor",
+        legacy_windows=False,
+    )
+
+
+def output_bytes(lines: Lines, console: Console) -> int:
+    """
+    The number of bytes that displaying the lines writes to the console's terminal.
+    """
+    with console.capture() as capture:
+        console.print(RenderedLines(lines), end="")
+    return len(capture.get().encode("utf-8"))
+
+
+def clear_caches() -> None:
+    """
+    Empty the caches that images are rendered through (which outlive any one slide),
+    so that every render of a slide with images pays the full cost of rendering them.
+    """
+    image.clear_caches()
+    animated.clear_caches()
+    image_cache.clear()
+
+
+def bench_slide(
+    slide_idx: int,
+    slide: Slide,
+    sizes: Iterable[Size],
+    iterations: int,
+    steps: int = 0,
+) -> Iterator[Result]:
+    """
+    Render a slide at each size and trigger step, `iterations` times each.
+
+    The slide's content function is called for every render,
+    bypassing the caches that Spiel uses while presenting,
+    so that the results measure the full cost of rendering the slide.
+    """
+    for size in sizes:
+        console = bench_console(size)
+        for step, triggers in trigger_steps(slide, steps):
+            times = []
+            lines: Lines = []
+            try:
+                for _ in range(iterations):
+                    clear_caches()
+                    start = perf_counter()
+                    lines = lay_out(slide.render(triggers=triggers), console, size)
+                    times.append(perf_counter() - start)
+            except Exception:
+                yield Result(
+                    slide=slide_idx + 1,
+                    title=slide.title,
+                    size=size,
+                    step=step,
+                    min=0,
+                    p50=0,
+                    p99=0,
+                    output_bytes=0,
+                    failed=True,
+                )
+                continue
+
+            yield Result(
+                slide=slide_idx + 1,
+                title=slide.title,
+                size=size,
+                step=step,
+                min=min(times),
+                p50=percentile(times, 50),
+                p99=percentile(times, 99),
+                output_bytes=output_bytes(lines, console),
+            )
+
+
+def bench_deck(
+    deck: Deck,
+    sizes: Iterable[Size],
+    iterations: int,
+    steps: int = 0,
+) -> list[Result]:
+    """
+    Render every slide in the deck headlessly and measure how long it takes.
+
+    Args:
+        deck: The deck to benchmark.
+        sizes: The terminal sizes (width and height) to render the slides at.
+        iterations: The number of times to render each slide at each size and trigger step.
+        steps: For slides that take triggers, also render them after being triggered
+            up to this many times.
+
+    Returns:
+        One result per slide, size, and trigger step.
+    """
+    sizes = list(sizes)
+    return [
+        result
+        for slide_idx, slide in enumerate(deck)
+        for result in bench_slide(slide_idx, slide, sizes, iterations=iterations, steps=steps)
+    ]
+
+
+def save_results(results: Iterable[Result], path: Path) -> None:
+    path.write_text(json.dumps({"results": [asdict(result) for result in results]}, indent=2))
+
+
+def load_results(path: Path) -> list[Result]:
+    results = json.loads(path.read_text())["results"]
+    return [Result(**{**result, "size": tuple(result["size"])}) for result in results]
+
+
+def find_regressions(
+    results: Iterable[Result], baseline: Iterable[Result], threshold: float
+) -> list[Regression]:
+    """
+    Find the results whose median render time is more than `threshold`
+    (as a fraction, e.g. `0.2` for 20%) slower than the matching baseline result.
+    Results without a matching (and successful) baseline result are never regressions.
+    """
+    baselines = {b.key: b for b in baseline if not b.failed}
+    return [
+        Regression(result=result, baseline=b)
+        for result in results
+        if (b := baselines.get(result.key)) is not None
+        and (result.failed or result.p50 > b.p50 * (1 + threshold))
+    ]
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f} ms"
+
+
+def results_table(results: Iterable[Result], regressions: Iterable[Regression] = ()) -> Table:
+    regressed = {regression.result.key: regression for regression in regressions}
+
+    table = Table(
+        Column("Slide"),
+        Column("Size", justify="right", no_wrap=True),
+        Column("Triggers", justify="right", no_wrap=True),
+        Column("Min", justify="right", no_wrap=True),
+        Column("p50", justify="right", no_wrap=True),
+        Column("p99", justify="right", no_wrap=True),
+        Column("Output", justify="right", no_wrap=True),
+        Column("Baseline", justify="right", no_wrap=True),
+        title="Render Times",
+    )
+
+    for result in results:
+        width, height = result.size
+        regression = regressed.get(result.key)
+
+        if result.failed:
+            timings = [Text("failed", style=Style(color="red"))] * 3 + [Text("-")]
+        else:
+            timings = [
+                Text(_ms(result.min)),
+                Text(_ms(result.p50)),
+                Text(_ms(result.p99)),
+                Text(f"{result.output_bytes:,} B"),
+            ]
+
+        if regression is None:
+            comparison = Text("")
+        elif result.failed:
+            comparison = Text("now fails", style=Style(color="red"))
+        else:
+            comparison = Text(f"{regression.slowdown:.2f}x slower", style=Style(color="red"))
+
+        table.add_row(
+            f"{result.slide} | {result.title}",
+            f"{width}x{height}",
+            str(result.step),
+            *timings,
+            comparison,
+        )
+
+    return table
@@ -1,27 +1,46 @@
 import shutil
 from pathlib import Path
 from textwrap import dedent
-from typing import Optional
+from typing import Any, List, Optional
 
-import typer.rich_utils as ru
 from click.exceptions import Exit
 from rich.console import Console
 from rich.style import Style
-from rich.syntax import Syntax
 from rich.text import Text
-from typer import Argument, Option, Typer
+from typer import Argument, BadParameter, Option, Typer
+from typer.core import TyperCommand, TyperGroup
 
-from spiel.app import present
-from spiel.constants import DEMO_DIR, DEMO_FILE, PACKAGE_DIR, PACKAGE_NAME, __version__
-from spiel.renderables.debug import DebugTable
+from spiel.constants import DEMO_DIR, DEMO_FILE, PACKAGE_DIR, PACKAGE_NAME
 
-ru.STYLE_HELPTEXT = ""
+# Only import what the commands need when they are run (especially Textual, through spiel.app),
+# so that quick commands like `spiel version` start quickly.
 
 console = Console()
 
 
+def _plain_help_text() -> None:
+    # Typer's help formatting imports a lot of Rich (e.g., for Markdown),
+    # so only import it when help is actually displayed.
+    import typer.rich_utils as ru  # noqa: PLC0415
+
+    ru.STYLE_HELPTEXT = ""
+
+
+class SpielGroup(TyperGroup):
+    def format_help(self, *args: Any, **kwargs: Any) -> None:
+        _plain_help_text()
+        super().format_help(*args, **kwargs)
+
+
+class SpielCommand(TyperCommand):
+    def format_help(self, *args: Any, **kwargs: Any) -> None:
+        _plain_help_text()
+        super().format_help(*args, **kwargs)
+
+
 cli = Typer(
     name=PACKAGE_NAME,
+    cls=SpielGroup,
     no_args_is_help=True,
     rich_markup_mode="rich",
     help=dedent(
@@ -39,7 +58,7 @@ cli = Typer(
 )
 
 
-@cli.command(name="present")
+@cli.command(name="present", cls=SpielCommand)
 def _present(
     path: Path = Argument(
         ...,
@@ -52,15 +71,137 @@ def _present(
         default=None,
         help="When filesystem changes are detected below this path (recursively), reload the deck from the deck path. Defaults to the parent directory of the deck path.",
     ),
+    idle_timeout: Optional[float] = Option(
+        default=None,
+        min=0,
+        help="Stop re-rendering animated slides after this many seconds without any key presses, until the next key press. By default, animated slides are always re-rendered.",
+    ),
+    thumbnail_workers: Optional[int] = Option(
+        default=None,
+        min=0,
+        help="The number of threads to render Deck view thumbnails in. Defaults to a number based on the number of CPUs. If 0, thumbnails are rendered as they are displayed.",
+    ),
+    trace: Optional[Path] = Option(
+        default=None,
+        dir_okay=False,
+        writable=True,
+        help="Record how long loading the deck, rendering, transitions, and key presses take, and write them to this file in the Chrome trace event format (viewable in Perfetto or chrome://tracing).",
+    ),
+    disk_cache: bool = Option(
+        default=False,
+        help="Cache converted images on disk (in $XDG_CACHE_HOME/spiel), so that they are displayed right away the next time the deck is presented.",
+    ),
 ) -> None:
     """
     Present a deck.
     """
-    present(deck_path=path, watch_path=watch)
+    from spiel.app import present  # noqa: PLC0415
+
+    present(
+        deck_path=path,
+        watch_path=watch,
+        idle_timeout=idle_timeout,
+        thumbnail_workers=thumbnail_workers,
+        trace=trace,
+        disk_cache=disk_cache,
+    )
+
+
+def _validate_sizes(sizes: List[str]) -> List[str]:
+    from spiel.bench import parse_size  # noqa: PLC0415
+
+    for size in sizes:
+        try:
+            parse_size(size)
+        except ValueError as e:
+            raise BadParameter(str(e))
+    return sizes
+
+
+@cli.command(cls=SpielCommand)
+def bench(
+    path: Path = Argument(
+        ...,
+        dir_okay=False,
+        exists=True,
+        readable=True,
+        help="The path to the slide deck file.",
+    ),
+    size: List[str] = Option(
+        default=["80x24"],
+        callback=_validate_sizes,
+        help="The terminal size to render the slides at, as WIDTHxHEIGHT. May be given multiple times.",
+    ),
+    iterations: int = Option(
+        default=20,
+        min=1,
+        help="The number of times to render each slide at each size.",
+    ),
+    triggers: int = Option(
+        default=0,
+        min=0,
+        help="Also render slides that use triggers after they have been triggered up to this many times.",
+    ),
+    save: Optional[Path] = Option(
+        default=None,
+        dir_okay=False,
+        writable=True,
+        help="Write the results to this file as JSON, for use as a baseline later.",
+    ),
+    baseline: Optional[Path] = Option(
+        default=None,
+        dir_okay=False,
+        exists=True,
+        readable=True,
+        help="Compare the results to a baseline written by --save, and fail if any slide has regressed.",
+    ),
+    threshold: float = Option(
+        default=0.2,
+        min=0,
+        help="How much slower (as a fraction) a slide's median render time may be than its baseline before it counts as a regression.",
+    ),
+) -> None:
+    """
+    Measure how long each slide in a deck takes to render, without presenting it.
+    """
+    from spiel.app import load_deck  # noqa: PLC0415
+    from spiel.bench import (  # noqa: PLC0415
+        bench_deck,
+        find_regressions,
+        load_results,
+        parse_size,
+        results_table,
+        save_results,
+    )
+
+    results = bench_deck(
+        load_deck(path), sizes=[parse_size(s) for s in size], iterations=iterations, steps=triggers
+    )
+
+    regressions = (
+        find_regressions(results, load_results(baseline), threshold=threshold)
+        if baseline is not None
+        else []
+    )
+
+    console.print(results_table(results, regressions))
+
+    if save is not None:
+        save_results(results, save)
+
+    if regressions:
+        console.print(
+            Text(
+                f"{len(regressions)} slide(s) regressed by more than {threshold:.0%} compared to the baseline",
+                style=Style(color="red"),
+            )
+        )
+        raise Exit(code=1)
 
 
 demo = Typer(
     name="demo",
+    cls=SpielGroup,
     no_args_is_help=True,
     rich_markup_mode="rich",
     help=dedent(
@@ -72,26 +213,30 @@ demo = Typer(
 cli.add_typer(demo)
 
 
-@demo.command(name="present")
+@demo.command(name="present", cls=SpielCommand)
 def present_demo() -> None:
     """
     Present the demo deck.
     """
+    from spiel.app import present  # noqa: PLC0415
+
     present(deck_path=DEMO_FILE, watch_path=PACKAGE_DIR)
 
 
-@demo.command()
+@demo.command(cls=SpielCommand)
 def source() -> None:
     """
     Display the source code for the demo deck in your PAGER.
     """
+    from rich.syntax import Syntax  # noqa: PLC0415
+
     console = Console()
 
     with console.pager(styles=True):
         console.print(Syntax(DEMO_FILE.read_text(encoding="utf-8"), lexer="python"))
 
 
-@demo.command()
+@demo.command(cls=SpielCommand)
 def copy(
     path: Path = Argument(
         default=...,
@@ -123,7 +268,7 @@ def copy(
     )
 
 
-@cli.command()
+@cli.command(cls=SpielCommand)
 def version(
     plain: bool = Option(
         default=False,
@@ -134,7 +279,11 @@ def version(
     Display version and debugging information.
     """
 
+    from spiel.constants import __version__  # noqa: PLC0415
+
     if plain:
         console.print(Text(__version__))
     else:
+        from spiel.renderables.debug import DebugTable  # noqa: PLC0415
+
         console.print(DebugTable())
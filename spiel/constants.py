@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import sys
-from importlib import metadata
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 PACKAGE_NAME = "spiel"
-__version__ = metadata.version(PACKAGE_NAME)
-__rich_version__ = metadata.version("rich")
-__textual_version__ = metadata.version("textual")
+
+if TYPE_CHECKING:
+    __version__: str
+    __rich_version__: str
+    __textual_version__: str
+
 __python_version__ = ".".join(map(str, sys.version_info))
 
 DECK = "deck"
@@ -18,3 +22,27 @@ DEMO_FILE = PACKAGE_DIR / "demo" / "demo.py"
 
 FOOTER_TIME_FORMAT = "%Y-%m-%d %I:%M %p"
 RELOAD_MESSAGE_TIME_FORMAT = "%I:%M:%S %p"
+
+# Looking up package versions reads their metadata from disk, which is slow,
+# so they are only looked up when they are used.
+_VERSIONS = {
+    "__version__": PACKAGE_NAME,
+    "__rich_version__": "rich",
+    "__textual_version__": "textual",
+}
+
+
+@cache
+def _version(package: str) -> str:
+    from importlib import metadata  # noqa: PLC0415
+
+    return metadata.version(package)
+
+
+def __getattr__(name: str) -> str:
+    try:
+        package = _VERSIONS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    return _version(package)
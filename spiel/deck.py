@@ -7,6 +7,7 @@ from typing import Type, overload
 from spiel.slide import Content, Slide
 from spiel.transitions.protocol import Transition
 from spiel.transitions.swipe import Swipe
+from spiel.triggers import Triggers
 
 
 @dataclass
@@ -26,6 +27,13 @@ class Deck(Sequence[Slide]):
     Set to `None` for no transition animation.
     """
 
+    render_budget: float | None = None
+    """\
+    The default render budget, in seconds;
+    used if a slide does not specify its own [`Slide.render_budget`][spiel.Slide.render_budget].
+    Set to `None` (the default) to not watch how long slides take to render.
+    """
+
     _slides: list[Slide] = field(default_factory=list)
 
     def slide(
@@ -33,6 +41,9 @@ class Deck(Sequence[Slide]):
         title: str = "",
         bindings: Mapping[str, Callable[..., None]] | None = None,
         transition: Type[Transition] | None = None,
+        fps: float | None = None,
+        next_change: Callable[[Triggers], float | None] | None = None,
+        render_budget: float | None = None,
     ) -> Callable[[Content], Content]:
         """
         A decorator that creates a new slide in the deck,
@@ -48,6 +59,16 @@ class Deck(Sequence[Slide]):
                 Set to `None` to use the
                 [`Deck.default_transition`][spiel.Deck.default_transition]
                 of the deck this slide is in.
+            fps: The target frame rate to re-render the slide at while it is displayed,
+                if its content function takes `triggers`.
+                Set to `None` to use the default frame rate.
+            next_change: An optional callable that returns the time at which the
+                slide's content will next change, given the current `triggers`.
+                See [`Slide.next_change`][spiel.Slide.next_change].
+            render_budget: The time, in seconds, that rendering the slide's content
+                is expected to take at most.
+                Set to `None` to use the [`Deck.render_budget`][spiel.Deck.render_budget].
+                See [`Slide.render_budget`][spiel.Slide.render_budget].
         """
 
         def slideify(content: Content) -> Content:
@@ -57,6 +78,9 @@ class Deck(Sequence[Slide]):
                     content=content,
                     bindings=bindings or {},
                     transition=transition,
+                    fps=fps,
+                    next_change=next_change,
+                    render_budget=render_budget,
                 )
             )
             return content
@@ -76,6 +100,14 @@ class Deck(Sequence[Slide]):
         """
         self._slides.extend(slides)
 
+    def compile(self) -> None:
+        """
+        Compile the plans for calling each slide's content function and bindings ahead of time.
+        See [`Slide.compile`][spiel.Slide.compile].
+        """
+        for slide in self._slides:
+            slide.compile()
+
     def __len__(self) -> int:
         return len(self._slides)
 
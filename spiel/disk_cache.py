@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import ContextManager
+
+from spiel.constants import PACKAGE_NAME
+from spiel.utils import Installed
+
+
+def default_directory() -> Path:
+    """
+    The directory to cache things in by default,
+    following the XDG Base Directory specification.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / PACKAGE_NAME
+
+
+@dataclass(frozen=True)
+class DiskCache:
+    """
+    A cache of compressed binary blobs in a directory,
+    which persists between presentations.
+
+    The cache is best-effort: if the directory can't be read or written to,
+    it behaves as if it were empty.
+    """
+
+    directory: Path
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / digest[:2] / digest
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return zlib.decompress(self._path(key).read_bytes())
+        except (OSError, zlib.error):
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # written to a temporary file and then moved into place,
+            # so that a concurrent reader never sees a partially-written file
+            with NamedTemporaryFile(dir=path.parent, delete=False) as f:
+                f.write(zlib.compress(data, level=1))
+            Path(f.name).replace(path)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=2**8)
+def _file_digest(path: Path, mtime_ns: int, size: int) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """
+    A hash of the contents of the file,
+    which is only recomputed if the file has been modified.
+    """
+    path = path.resolve()
+    stat = path.stat()
+    return _file_digest(path, stat.st_mtime_ns, stat.st_size)
+
+
+_installed: Installed[DiskCache] = Installed()
+
+
+def install(cache: DiskCache | None) -> None:
+    """
+    Start using the given disk cache,
+    or stop using a disk cache if `cache` is `None`.
+    """
+    _installed.install(cache)
+
+
+def installed() -> DiskCache | None:
+    """The disk cache that is in use, if there is one."""
+    return _installed.value
+
+
+def caching(cache: DiskCache) -> ContextManager[DiskCache]:
+    """
+    Use the given disk cache within the `with` block.
+    """
+    return _installed.using(cache)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CallPlan(Generic[T]):
+    """
+    Describes which fixtures a function should be called with,
+    so that its signature only needs to be inspected once instead of on every call.
+    """
+
+    function: Callable[..., T]
+    fixtures: tuple[str, ...]
+
+    @classmethod
+    def compile(cls, function: Callable[..., T], fixtures: Collection[str]) -> CallPlan[T]:
+        """
+        Args:
+            function: The function to plan calls to.
+            fixtures: The names of the fixtures that could be passed to the function.
+
+        Returns:
+            A plan that will pass the function the fixtures that appear in its signature.
+        """
+        parameters = inspect.signature(function).parameters
+        return cls(
+            function=function,
+            fixtures=tuple(name for name in fixtures if name in parameters),
+        )
+
+    def takes(self, fixture: str) -> bool:
+        return fixture in self.fixtures
+
+    def __call__(self, **fixtures: object) -> T:
+        return self.function(**{name: fixtures[name] for name in self.fixtures})
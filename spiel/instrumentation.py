@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import ContextManager
+
+from spiel.utils import Installed
+
+_NULL_CONTEXT: ContextManager[None] = nullcontext()
+
+
+@dataclass(frozen=True)
+class Event:
+    """
+    Something that happened during a presentation.
+    Events with a `duration` of `None` happened at an instant.
+    """
+
+    name: str
+    category: str
+    start: float
+    duration: float | None
+    thread: int
+    args: Mapping[str, object] = field(default_factory=dict)
+
+
+@dataclass
+class Tracer:
+    """
+    Collects [`Event`s][spiel.instrumentation.Event] while it is installed.
+    """
+
+    events: list[Event] = field(default_factory=list)
+    thread_names: dict[int, str] = field(default_factory=dict)
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float | None = None,
+        args: Mapping[str, object] | None = None,
+    ) -> None:
+        thread = threading.current_thread()
+        self.thread_names.setdefault(thread.ident or 0, thread.name)
+
+        # appending to a list is atomic, so events can be recorded from any thread
+        self.events.append(
+            Event(
+                name=name,
+                category=category,
+                start=start,
+                duration=None if end is None else end - start,
+                thread=thread.ident or 0,
+                args=args or {},
+            )
+        )
+
+    @contextmanager
+    def span(self, name: str, category: str, args: Mapping[str, object]) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, perf_counter(), args)
+
+    def to_chrome_trace(self) -> dict[str, object]:
+        """
+        Returns:
+            The recorded events, in the Chrome trace event format.
+        """
+        pid = os.getpid()
+
+        trace_events: list[dict[str, object]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self.thread_names.items()
+        ]
+
+        for event in self.events:
+            trace_event: dict[str, object] = {
+                "name": event.name,
+                "cat": event.category,
+                "ts": event.start * 1e6,
+                "pid": pid,
+                "tid": event.thread,
+                "args": {k: _jsonable(v) for k, v in event.args.items()},
+            }
+            if event.duration is None:
+                trace_event.update(ph="i", s="t")
+            else:
+                trace_event.update(ph="X", dur=event.duration * 1e6)
+            trace_events.append(trace_event)
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_chrome_trace()))
+
+
+def _jsonable(value: object) -> object:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+_installed: Installed[Tracer] = Installed()
+
+
+def install(tracer: Tracer | None) -> None:
+    """
+    Start recording events with the given tracer,
+    or stop recording events if `tracer` is `None`.
+    """
+    _installed.install(tracer)
+
+
+def tracing(tracer: Tracer) -> ContextManager[Tracer]:
+    """
+    Record events with the given tracer within the `with` block.
+    """
+    return _installed.using(tracer)
+
+
+def now() -> float:
+    """The current time on the clock that events are recorded with."""
+    return perf_counter()
+
+
+def span(name: str, category: str = "spiel", **args: object) -> ContextManager[None]:
+    """
+    Record the time spent in the `with` block as an event.
+    """
+    tracer = _installed.value
+    if tracer is None:
+        return _NULL_CONTEXT
+    return tracer.span(name, category, args)
+
+
+def record(
+    name: str, start: float, end: float | None = None, category: str = "spiel", **args: object
+) -> None:
+    """
+    Record an event that started at `start` (from [`now`][spiel.instrumentation.now])
+    and finished at `end`, or happened at an instant if `end` is `None`.
+    """
+    tracer = _installed.value
+    if tracer is not None:
+        tracer.record(name, category, start, end, args)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections import deque
+from time import monotonic
+from typing import IO, Any
+
+
+class RateMeter:
+    """
+    Measures how much of something happens per second,
+    over a sliding window of recent time.
+    """
+
+    def __init__(self, window: float = 1) -> None:
+        self.window = window
+
+        self._events: deque[tuple[float, float]] = deque()
+        self._total = 0.0
+
+    def tick(self, amount: float = 1, now: float | None = None) -> None:
+        now = monotonic() if now is None else now
+
+        self._events.append((now, amount))
+        self._total += amount
+        self._expire(now)
+
+    def rate(self, now: float | None = None) -> float:
+        self._expire(monotonic() if now is None else now)
+
+        return self._total / self.window
+
+    def _expire(self, now: float) -> None:
+        events = self._events
+        while events and events[0][0] <= now - self.window:
+            _, amount = events.popleft()
+            self._total -= amount
+
+
+class ByteCounter:
+    """
+    Wraps a text file and counts the bytes written to it.
+
+    An update of the screen may be written in several parts
+    (e.g., the frame between the escape codes that start and end a synchronized update),
+    so `last` is the total size of the writes between the last two calls to `end_update`.
+    """
+
+    def __init__(self, file: IO[str]) -> None:
+        self.file = file
+
+        self.total = 0
+        self.last = 0
+        self.rate = RateMeter()
+
+        self._update = 0
+
+    def write(self, text: str) -> int:
+        size = len(text.encode("utf-8", errors="replace"))
+        self.total += size
+        self._update += size
+        self.rate.tick(size)
+
+        return self.file.write(text)
+
+    def end_update(self) -> None:
+        """Mark the end of an update of the screen."""
+        self.last = self._update
+        self._update = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.file, name)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+
+
+class Quality(Enum):
+    """
+    How carefully expensive content (like images) should be rendered.
+    """
+
+    Preview = "preview"
+    """Render quickly, at lower quality, e.g. while the terminal is being resized."""
+
+    Full = "full"
+    """Render at full quality."""
+
+
+@dataclass
+class _Settling:
+    # a plain attribute rather than a context variable,
+    # because Textual lays out widgets in different tasks than the ones that handle events
+    settling: bool = False
+
+
+_settling = _Settling()
+_local = threading.local()
+
+
+def set_settling(settling: bool) -> None:
+    """
+    Render at preview quality everywhere (except where [`rendering_at`][spiel.quality.rendering_at]
+    says otherwise) until this is called again with `False`,
+    e.g. while the terminal is being resized or a transition is running.
+    """
+    _settling.settling = settling
+
+
+def settling() -> bool:
+    """
+    Whether the current thread is rendering at preview quality only until things settle,
+    in which case the output should not be cached,
+    because it will be re-rendered at full quality soon.
+    """
+    return getattr(_local, "quality", None) is None and _settling.settling
+
+
+def current() -> Quality:
+    """The quality that content should be rendered at in the current thread."""
+    quality: Quality | None = getattr(_local, "quality", None)
+    if quality is not None:
+        return quality
+    return Quality.Preview if _settling.settling else Quality.Full
+
+
+@contextmanager
+def rendering_at(quality: Quality) -> Iterator[None]:
+    """
+    Render at the given quality in the current thread within the `with` block,
+    regardless of whether things are settling.
+    """
+    previous = getattr(_local, "quality", None)
+    _local.quality = quality
+    try:
+        yield
+    finally:
+        _local.quality = previous
+
+
+def rendered_placeholder() -> None:
+    """
+    Note that the current thread rendered a placeholder in place of content that isn't ready yet,
+    so that the output is not cached.
+    """
+    _local.placeholders = placeholders_rendered() + 1
+
+
+def placeholders_rendered() -> int:
+    """
+    The number of placeholders the current thread has rendered.
+    Compare the number before and after rendering something
+    to find out whether any of its content was rendered as a placeholder.
+    """
+    placeholders: int = getattr(_local, "placeholders", 0)
+    return placeholders
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import weakref
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from itertools import accumulate
+from math import floor
+from pathlib import Path
+from threading import Lock
+from typing import Iterable, Iterator, cast
+
+from PIL import Image as Img
+from PIL import ImageSequence
+from PIL.Image import Resampling
+from rich.color import ColorSystem
+from rich.console import Console, ConsoleOptions
+from rich.segment import Segment
+
+from spiel.renderables.image import (
+    _DOWNGRADED_COLOR_SYSTEMS,
+    RESAMPLE,
+    DerivedKey,
+    ImageSize,
+    _decoded_bytes,
+    _fit,
+    _image_to_segments,
+    _terminal_pixels,
+    image_cache,
+)
+from spiel.triggers import Triggers
+
+# Used for frames that don't say how long they should be displayed for, or say zero seconds,
+# which (like web browsers) we don't take literally.
+DEFAULT_FRAME_DURATION = 0.1
+
+# The (estimated) size of the segments of the displayed frames to keep, in bytes.
+FRAME_CACHE_BYTES = 2**26
+# The memory used by a segment (and its entry in the frame's list of segments),
+# not counting its text, which is two bytes per character for the half-block characters.
+# Styles are shared between segments, so they aren't counted.
+SEGMENT_BYTES = 64 + 74 + 8
+
+FrameCacheKey = tuple[int, ImageSize, Resampling, ColorSystem | None, int]
+
+
+@dataclass(frozen=True)
+class _Frames:
+    images: tuple[Img.Image, ...]
+    ends: tuple[float, ...]
+    """The time (since the start of the animation) at which each frame stops being displayed."""
+    full_scale: bool
+    """Whether the frames are the size of the animation, rather than shrunk to fit a smaller size."""
+
+    @classmethod
+    def decode(cls, img: Img.Image, bound: ImageSize) -> _Frames:
+        """
+        Decode the frames of the animation, shrinking any that are larger than the `bound`,
+        so that long animations don't keep every frame in memory at full scale.
+        """
+        images = []
+        durations = []
+        # Images loaded from files may be shared with other renderables (and threads)
+        # through the image cache, so iterate over the frames of a private copy,
+        # rather than seeking the shared image out from under them.
+        filename = getattr(img, "filename", "")
+        with Img.open(filename) if filename else nullcontext(img) as source:
+            try:
+                for frame in ImageSequence.Iterator(source):
+                    image = frame.convert("RGBA")
+                    image.thumbnail(bound, resample=RESAMPLE)
+                    images.append(image)
+                    durations.append(
+                        (frame.info.get("duration") or 0) / 1000 or DEFAULT_FRAME_DURATION
+                    )
+            finally:
+                source.seek(0)
+
+        return cls(
+            images=tuple(images),
+            ends=tuple(accumulate(durations)),
+            full_scale=images[0].size == img.size,
+        )
+
+    @property
+    def duration(self) -> float:
+        return self.ends[-1]
+
+    @property
+    def bytes(self) -> int:
+        return sum(map(_decoded_bytes, self.images))
+
+    def covers(self, size: ImageSize) -> bool:
+        """Whether the frames can be resized to the `size` without being scaled up."""
+        width, height = self.images[0].size
+        return self.full_scale or (width >= size.width and height >= size.height)
+
+
+@dataclass
+class _FrameCache:
+    """
+    The segments of each frame that has been displayed,
+    keyed on the source image, size, resampling filter, color system, and frame index.
+
+    The cache is limited by an estimate of how much memory the segments use,
+    and evicts the least recently displayed frames first.
+    It is not thread-safe on its own; it is guarded by the `_frame_cache_lock`.
+    """
+
+    max_bytes: int = FRAME_CACHE_BYTES
+    """The maximum amount of memory the cached segments may use."""
+
+    _entries: OrderedDict[FrameCacheKey, tuple[list[Segment], int]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _bytes: int = field(default=0, init=False)
+
+    def __iter__(self) -> Iterator[FrameCacheKey]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: FrameCacheKey) -> list[Segment] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: FrameCacheKey, segments: list[Segment]) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+        # a frame that is too large to ever fit is not cached at all
+        num_bytes = _segments_bytes(segments)
+        if num_bytes <= self.max_bytes:
+            self._entries[key] = (segments, num_bytes)
+            self._bytes += num_bytes
+
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def forget_image(self, image_id: int) -> None:
+        for key in [key for key in self._entries if key[0] == image_id]:
+            self._remove(key)
+
+    def _remove(self, key: FrameCacheKey) -> None:
+        _, num_bytes = self._entries.pop(key)
+        self._bytes -= num_bytes
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+
+def _segments_bytes(segments: list[Segment]) -> int:
+    return sum(SEGMENT_BYTES + 2 * len(segment.text) for segment in segments)
+
+
+# The decoded frames of each source image are stored in the image cache,
+# so they count towards its memory limit, and are decoded again if they are evicted.
+_frame_cache = _FrameCache()
+_frame_cache_lock = Lock()
+_tracked_images: set[int] = set()
+# The ids of tracked images that have been garbage collected;
+# like the ones for still images, finalizers only queue the id, so they never take the lock.
+_collected_images: deque[int] = deque()
+
+
+def _decoded_frames(img: Img.Image, size: ImageSize | None = None) -> tuple[int, _Frames]:
+    """
+    The decoded frames of the source image, large enough to be resized to the `size`
+    (or any size that fits in the terminal if the `size` is `None`).
+    """
+    _forget_collected_images()
+
+    image_id = id(img)
+    with _frame_cache_lock:
+        if image_id not in _tracked_images:
+            _tracked_images.add(image_id)
+            weakref.finalize(img, _collected_images.append, image_id)
+
+    key = DerivedKey("frames", image_id)
+    frames = cast(_Frames | None, image_cache.derived(key))
+    if frames is not None and (size is None or frames.covers(size)):
+        return image_id, frames
+
+    # decoding every frame takes a while, so other images can be rendered in the meantime
+    with image_cache.building(key):
+        frames = cast(_Frames | None, image_cache.derived(key))
+        if frames is None or (size is not None and not frames.covers(size)):
+            bound = _terminal_pixels()
+            if size is not None:
+                bound = ImageSize(max(bound.width, size.width), max(bound.height, size.height))
+            frames = _Frames.decode(img, bound)
+            image_cache.put_derived(key, frames, frames.bytes)
+
+    return image_id, frames
+
+
+def _forget_collected_images() -> None:
+    if not _collected_images:
+        return
+
+    collected = []
+    with _frame_cache_lock:
+        while _collected_images:
+            image_id = _collected_images.popleft()
+            collected.append(image_id)
+            _tracked_images.discard(image_id)
+            _frame_cache.forget_image(image_id)
+
+    for image_id in collected:
+        image_cache.forget(DerivedKey("frames", image_id))
+
+
+def clear_caches() -> None:
+    """Forget the segments of every frame that has been displayed."""
+    with _frame_cache_lock:
+        _frame_cache.clear()
+
+
+@dataclass(frozen=True)
+class AnimatedImage:
+    """
+    An animated image (e.g., a GIF, APNG, or WebP), which displays the frame
+    for the time since its slide started being displayed.
+
+    Each frame is resized and converted to segments once per size,
+    so playing the animation only needs to look up the segments for the current frame.
+
+    ```python
+    animation = AnimatedImage.from_file(Path("animation.gif"))
+
+
+    @deck.slide(title="Animation", next_change=animation.next_change)
+    def slide(triggers: Triggers) -> RenderableType:
+        return animation.frame(triggers)
+    ```
+    """
+
+    img: Img.Image
+
+    resample: Resampling = field(default=RESAMPLE, kw_only=True)
+    """The filter to resize the frames with."""
+
+    loop: bool = field(default=True, kw_only=True)
+    """If `False`, stop on the last frame instead of starting the animation over again."""
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Path,
+        resample: Resampling = RESAMPLE,
+        loop: bool = True,
+    ) -> AnimatedImage:
+        return cls(img=image_cache.load(path), resample=resample, loop=loop)
+
+    @property
+    def num_frames(self) -> int:
+        return len(_decoded_frames(self.img)[1].images)
+
+    @property
+    def duration(self) -> float:
+        """The time it takes to play the animation once, in seconds."""
+        return _decoded_frames(self.img)[1].duration
+
+    def _position(self, elapsed: float) -> tuple[int, float | None]:
+        """
+        The index of the frame to display after the given time,
+        and the time at which the next frame starts (or `None` if the animation is over).
+        """
+        _, frames = _decoded_frames(self.img)
+        duration = frames.duration
+
+        if elapsed >= duration and not self.loop:
+            return len(frames.images) - 1, None
+
+        loops = floor(elapsed / duration)
+        index = bisect_right(frames.ends, elapsed - (loops * duration))
+        if index == len(frames.ends):  # only possible due to floating point error
+            return 0, (loops + 1) * duration + frames.ends[0]
+
+        return index, (loops * duration) + frames.ends[index]
+
+    def frame_index(self, elapsed: float) -> int:
+        """The index of the frame to display after the given time, in seconds."""
+        return self._position(max(elapsed, 0))[0]
+
+    def frame(self, triggers: Triggers) -> AnimatedImageFrame:
+        """
+        The frame to display for the time since the slide started being displayed
+        (see [`Triggers.time_since_first_trigger`][spiel.Triggers.time_since_first_trigger]).
+        """
+        return AnimatedImageFrame(
+            animation=self, index=self.frame_index(triggers.time_since_first_trigger)
+        )
+
+    def next_change(self, triggers: Triggers) -> float | None:
+        """
+        The time at which the next frame should be displayed,
+        suitable for use as a slide's [`next_change`][spiel.Slide.next_change].
+        """
+        elapsed = max(triggers.time_since_first_trigger, 0)
+        _, next_frame = self._position(elapsed)
+        if next_frame is None:
+            return None
+        return triggers.now + (next_frame - elapsed)
+
+    def _segments(self, console: Console, options: ConsoleOptions, index: int) -> list[Segment]:
+        size = _fit(ImageSize(*self.img.size), options)
+        image_id, frames = _decoded_frames(self.img, size)
+        color_system = _DOWNGRADED_COLOR_SYSTEMS.get(console.color_system or "")
+        key = (image_id, size, self.resample, color_system, index)
+
+        with _frame_cache_lock:
+            segments = _frame_cache.get(key)
+        if segments is not None:
+            return segments
+
+        segments = _image_to_segments(
+            frames.images[index].resize(size=size, resample=self.resample),
+            color_system,
+        )
+
+        with _frame_cache_lock:
+            _frame_cache.put(key, segments)
+
+        return segments
+
+
+@dataclass(frozen=True)
+class AnimatedImageFrame:
+    animation: AnimatedImage
+    index: int
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> Iterable[Segment]:
+        yield from self.animation._segments(console, options, self.index)
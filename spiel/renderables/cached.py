@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.segment import Segment
+
+from spiel import quality
+
+Lines = list[list[Segment]]
+
+
+@dataclass(frozen=True)
+class RenderedLines:
+    """
+    A renderable made of lines of segments that have already been rendered.
+    """
+
+    lines: Lines
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        new_line = Segment.line()
+        for line in self.lines:
+            yield from line
+            yield new_line
+
+
+@dataclass
+class CachedRenderable:
+    """
+    Wraps a renderable and remembers the lines it rendered to,
+    so that re-rendering it at a size it has already been rendered at
+    just replays those lines instead of laying the renderable out again.
+    """
+
+    renderable: RenderableType
+
+    _lines: dict[tuple[int, int | None], Lines] = field(default_factory=dict, repr=False)
+
+    def lines(self, console: Console, options: ConsoleOptions) -> Lines:
+        key = (options.max_width, options.height)
+        try:
+            return self._lines[key]
+        except KeyError:
+            pass
+
+        placeholders = quality.placeholders_rendered()
+        lines = console.render_lines(self.renderable, options, pad=False)
+
+        # preview quality output and placeholders will be replaced by the real output soon
+        if not quality.settling() and quality.placeholders_rendered() == placeholders:
+            self._lines[key] = lines
+
+        return lines
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        yield RenderedLines(self.lines(console, options))
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import sys
+
+from rich.box import HEAVY
+from rich.panel import Panel
+from rich.style import Style
+from rich.traceback import Traceback
+
+import spiel
+from spiel.exceptions import SpielException
+
+
+def render_failure_panel() -> Panel:
+    """
+    Display the exception that is currently being handled,
+    which was raised while rendering a slide.
+    """
+    et, ev, tr = sys.exc_info()
+    if et is None or ev is None or tr is None:  # pragma: unreachable
+        raise SpielException("Expected to be handling an exception, but wasn't.")
+    return Panel(
+        Traceback.from_exception(
+            exc_type=et,
+            exc_value=ev,
+            traceback=tr,
+            suppress=(spiel,),
+        ),
+        title="Slide content failed to render",
+        border_style=Style(bold=True, color="red1"),
+        box=HEAVY,
+    )
@@ -1,44 +1,322 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import lru_cache
-from math import floor
+import struct
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import count
+from math import ceil, floor
 from pathlib import Path
-from typing import Iterable, NamedTuple
+from shutil import get_terminal_size
+from threading import Lock
+from typing import Callable, Iterable, NamedTuple, cast
 
 from PIL import Image as Img
+from PIL import ImageChops
 from PIL.Image import Resampling
-from rich.color import Color
+from rich.color import Color, ColorSystem
 from rich.console import Console, ConsoleOptions
 from rich.segment import Segment
 from rich.style import Style
 
+from spiel import background, disk_cache, quality
+from spiel.quality import Quality
+from spiel.renderables.placeholder import PLACEHOLDER
 from spiel.utils import chunks
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+
 
 class ImageSize(NamedTuple):
     width: int
     height: int
 
 
-Pixels = tuple[tuple[int, int, int] | None, ...]
+UPPER_HALF_BLOCK = "▀"
+
+# A pair of pixels is encoded as a single integer, from the 24-bit colors of the two pixels.
+# The bottom pixel is missing when the image has an odd number of rows, which is encoded as -1.
+_MISSING = -1
+
+RESAMPLE = Resampling.LANCZOS
+PREVIEW_RESAMPLE = Resampling.BILINEAR
+
+SEGMENT_CACHE_SIZE = 2**6
+
+IMAGE_CACHE_BYTES = 2**28
+
+# A 4x4 Bayer matrix, for ordered dithering.
+BAYER_MATRIX = (
+    (0, 8, 2, 10),
+    (12, 4, 14, 6),
+    (3, 11, 1, 9),
+    (15, 7, 13, 5),
+)
+
+# Colors are converted to these color systems up front,
+# instead of by Rich for every segment when it is printed.
+_DOWNGRADED_COLOR_SYSTEMS = {
+    "standard": ColorSystem.STANDARD,
+    "256": ColorSystem.EIGHT_BIT,
+}
+
+# Bump this when the encoding of segments in the disk cache changes.
+SEGMENT_FORMAT_VERSION = 1
+_RUN = struct.Struct("<Hii")
+
+PYRAMID_MODES = ("RGB", "RGBA", "L", "LA")
+PYRAMID_MIN_SIZE = 16
+
+SegmentCacheKey = tuple[int, ImageSize, Resampling, int | None, bool, ColorSystem | None]
+
+# Keyed on the identity of the source image rather than its pixels,
+# so that a repeated render at the same size doesn't need to resize the image
+# (or even look at its pixels) to find its segments.
+# Entries for an image are dropped when the image is garbage collected,
+# so that its id can't be reused by another image while they're still in the cache.
+_segment_cache: OrderedDict[SegmentCacheKey, list[Segment]] = OrderedDict()
+_segment_cache_lock = Lock()  # thumbnails may be rendered in worker threads
+_tracked_images: set[int] = set()
+# The ids of tracked images that have been garbage collected.
+# Finalizers can run whenever the garbage collector does,
+# including while this thread holds the lock, so they only queue the id
+# (appending to a deque is atomic), and the entries are dropped the next time an image is rendered.
+_collected_images: deque[int] = deque()
+
+# Renders of images that are being (or failed to be) rendered in the background,
+# so that each one is only started once.
+_background_renders: dict[SegmentCacheKey, Future[list[Segment]]] = {}
+
+
+def _image_id(img: Img.Image) -> int:
+    # The entries for collected images are dropped first,
+    # so that a new image can't be mistaken for a collected one with the same id.
+    _forget_collected_images()
+
+    image_id = id(img)
+    with _segment_cache_lock:
+        if image_id not in _tracked_images:
+            _tracked_images.add(image_id)
+            weakref.finalize(img, _collected_images.append, image_id)
+    return image_id
+
+
+def _forget_collected_images() -> None:
+    if not _collected_images:
+        return
+
+    collected = []
+    with _segment_cache_lock:
+        while _collected_images:
+            image_id = _collected_images.popleft()
+            collected.append(image_id)
+            _tracked_images.discard(image_id)
+            for key in [key for key in _segment_cache if key[0] == image_id]:
+                del _segment_cache[key]
+            for key in [key for key in _background_renders if key[0] == image_id]:
+                del _background_renders[key]
+
+    for image_id in collected:
+        image_cache.forget(DerivedKey("pyramid", image_id))
+
+
+def _cached_segments(key: SegmentCacheKey) -> list[Segment] | None:
+    with _segment_cache_lock:
+        segments = _segment_cache.get(key)
+        if segments is not None:
+            _segment_cache.move_to_end(key)
+        return segments
+
+
+def _cache_segments(key: SegmentCacheKey, segments: list[Segment]) -> None:
+    with _segment_cache_lock:
+        # the image may have been garbage collected while it was being rendered
+        if key[0] not in _tracked_images:
+            return
+
+        _segment_cache[key] = segments
+        while len(_segment_cache) > SEGMENT_CACHE_SIZE:
+            _segment_cache.popitem(last=False)
+
+
+def _pyramid_level(img: Img.Image, size: ImageSize) -> Img.Image:
+    """
+    The smallest level of the source image's pyramid that is at least twice as large as the `size`
+    (so that resampling from it is still good quality), building levels as needed.
+
+    The pyramid holds pre-downscaled versions of the source image, each half the size of the one before,
+    so that resizing starts from the smallest version that is still larger than the target size.
+    It is stored in the image cache (without the source image itself, so that it can still be
+    garbage collected), and counts towards the cache's memory limit.
+    """
+    if img.mode not in PYRAMID_MODES:
+        return img
+
+    key = DerivedKey("pyramid", _image_id(img))
+
+    # Reducing a large image takes a while, so other images can be rendered in the meantime;
+    # only renders of this image wait for the levels they need.
+    with image_cache.building(key):
+        levels = cast(tuple[Img.Image, ...] | None, image_cache.derived(key)) or ()
+        built = list(levels)
+
+        level = img
+        for depth in count():
+            width, height = level.size
+            if (
+                width < size.width * 4
+                or height < size.height * 4
+                or min(width, height) < PYRAMID_MIN_SIZE * 2
+            ):
+                break
+
+            if depth == len(built):
+                built.append(level.reduce(2))
+            level = built[depth]
+
+        if len(built) > len(levels):
+            image_cache.put_derived(key, tuple(built), sum(map(_decoded_bytes, built)))
+
+    return level
+
+
+def _image_to_segments(img: Img.Image, color_system: ColorSystem | None = None) -> list[Segment]:
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+
+    if HAS_NUMPY and img.width and img.height:
+        return _array_to_segments(np.asarray(img), color_system)
+
+    return _image_to_segments_python(img, color_system)
+
+
+def _array_to_segments(rgb: np.ndarray, color_system: ColorSystem | None = None) -> list[Segment]:
+    """
+    Pair up rows of pixels and find runs of identical pairs with NumPy,
+    then emit one segment per run, so that the per-pixel work doesn't happen in Python.
+    """
+    rgb = rgb[..., :3].astype(np.int64)
+    codes = (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+    if color_system is not None:
+        # only convert each distinct color once
+        distinct, inverse = np.unique(codes, return_inverse=True)
+        downgraded = [_downgrade_code(code, color_system) for code in distinct.tolist()]
+        codes = np.asarray(downgraded, dtype=np.int64)[inverse].reshape(codes.shape)
+
+    if len(codes) % 2:
+        codes = np.concatenate([codes, np.full((1, codes.shape[1]), _MISSING, dtype=np.int64)])
+
+    # shift the top pixel up so that the codes for missing bottom pixels stay distinct
+    pairs = (codes[0::2] << 25) | (codes[1::2] & ((1 << 25) - 1))
 
+    num_lines, width = pairs.shape
+    starts = np.ones(pairs.shape, dtype=bool)
+    starts[:, 1:] = pairs[:, 1:] != pairs[:, :-1]
+
+    # each line starts a new run, so runs never cross line boundaries
+    run_starts = np.flatnonzero(starts)
+    run_lengths = np.diff(np.append(run_starts, num_lines * width))
+    run_lines = run_starts // width
+    flat_codes = codes.reshape(num_lines, 2, width).transpose(0, 2, 1).reshape(-1, 2)
+
+    line = Segment.line()
+    segments = []
+    previous_line = 0
+    for start, length, line_idx, (top, bottom) in zip(
+        run_starts.tolist(),
+        run_lengths.tolist(),
+        run_lines.tolist(),
+        flat_codes[run_starts].tolist(),
+    ):
+        if line_idx != previous_line:
+            segments.append(line)
+            previous_line = line_idx
+
+        segments.append(Segment(UPPER_HALF_BLOCK * length, _pair_style(top, bottom, color_system)))
+
+    segments.append(line)
+
+    return segments
+
+
+@lru_cache(maxsize=2**16)
+def _downgrade_code(code: int, color_system: ColorSystem) -> int:
+    """
+    Convert a 24-bit color code to the number of the nearest color in the given color system,
+    so that neighbouring pixels that end up the same color are merged into the same segment.
+    """
+    color = Color.from_rgb((code >> 16) & 0xFF, (code >> 8) & 0xFF, code & 0xFF)
+    number = color.downgrade(color_system).number
+    assert number is not None
+    return number
+
+
+@lru_cache(maxsize=2**16)
+def _code_to_color(code: int, color_system: ColorSystem | None = None) -> Color | None:
+    if code == _MISSING:
+        return None
+    if color_system is not None:
+        # the code was already downgraded, so Rich won't need to convert the color again
+        return Color.from_ansi(code)
+    return Color.from_rgb((code >> 16) & 0xFF, (code >> 8) & 0xFF, code & 0xFF)
+
+
+@lru_cache(maxsize=2**16)
+def _pair_style(top: int, bottom: int, color_system: ColorSystem | None = None) -> Style:
+    """
+    Interned styles for pairs of pixels, so that each distinct pair of colors
+    (of which there are few, for images quantized to a palette) is only turned into
+    a style, and then into escape codes by Rich, once.
+    """
+    return Style.from_color(
+        color=_code_to_color(top, color_system),
+        bgcolor=_code_to_color(bottom, color_system),
+    )
+
+
+def _pixel_code(pixel: tuple[int, int, int] | None, color_system: ColorSystem | None) -> int:
+    if pixel is None:
+        return _MISSING
+    code = (pixel[0] << 16) | (pixel[1] << 8) | pixel[2]
+    return code if color_system is None else _downgrade_code(code, color_system)
+
+
+def _image_to_segments_python(
+    img: Img.Image, color_system: ColorSystem | None = None
+) -> list[Segment]:
+    """
+    Convert an RGB or RGBA image to segments one pixel at a time,
+    for when NumPy isn't installed.
+    """
+    # the raw data has one byte per band for each pixel, so every band's values are a slice of it
+    data = img.tobytes()
+    bands = len(img.getbands())
+    pixels: Iterable[tuple[int, int, int] | None] = zip(
+        data[0::bands], data[1::bands], data[2::bands]
+    )
 
-@lru_cache(maxsize=2**8)
-def _pixels_to_segments(pixels: Pixels, size: ImageSize) -> list[Segment]:
     line = Segment.line()
 
     segments = []
-    pixel_row_pairs = chunks(chunks(pixels, size.width), 2, fill_value=[None] * size.width)
+    pixel_row_pairs = chunks(chunks(pixels, img.width), 2, fill_value=[None] * img.width)
     for top_pixel_row, bottom_pixel_row in pixel_row_pairs:
         for top_pixel, bottom_pixel in zip(top_pixel_row, bottom_pixel_row):
             # use upper-half-blocks for the top pixel row and the background color for the bottom pixel row
             segments.append(
                 Segment(
-                    text="▀",
-                    style=Style.from_color(
-                        color=Color.from_rgb(*top_pixel[:3]) if top_pixel else None,
-                        bgcolor=Color.from_rgb(*bottom_pixel[:3]) if bottom_pixel else None,
+                    text=UPPER_HALF_BLOCK,
+                    style=_pair_style(
+                        _pixel_code(top_pixel, color_system),
+                        _pixel_code(bottom_pixel, color_system),
+                        color_system,
                     ),
                 )
             )
@@ -47,42 +325,585 @@ def _pixels_to_segments(pixels: Pixels, size: ImageSize) -> list[Segment]:
     return list(Segment.simplify(segments))
 
 
-@lru_cache(maxsize=2**4)
-def _load_image(path: Path) -> Image:
-    img = Img.open(path)
-    img.load()
-    return img
+def _quantize(img: Img.Image, colors: int, dither: bool) -> Img.Image:
+    """
+    Reduce the image to an adaptive palette of at most `colors` colors,
+    optionally with ordered dithering to smooth out gradients.
+    """
+    rgb = img.convert("RGB")
+    quantized = rgb.quantize(colors=colors, method=Img.Quantize.MEDIANCUT, dither=Img.Dither.NONE)
+
+    if dither:
+        # Pillow only does error-diffusion dithering, which makes the noise move around
+        # when the image is resized, so dither by offsetting the pixels with a Bayer matrix instead,
+        # then map the offset pixels to the palette of the undithered image.
+        quantized = _ordered_dither(rgb, colors).quantize(palette=quantized, dither=Img.Dither.NONE)
+
+    return quantized.convert("RGB")
+
+
+def _ordered_dither(img: Img.Image, colors: int) -> Img.Image:
+    # roughly the distance between the levels of each channel in the palette
+    spread = 256 // max(round(colors ** (1 / 3)), 1)
+
+    width, height = img.size
+    rows = [
+        (bytes((threshold * spread) // 16 for threshold in row) * (width // 4 + 1))[:width]
+        for row in BAYER_MATRIX
+    ]
+    pattern = Img.frombytes("L", img.size, b"".join(rows[y % 4] for y in range(height)))
+
+    return ImageChops.add(
+        img,
+        Img.merge("RGB", (pattern, pattern, pattern)),
+        offset=-(spread // 2),
+    )
+
+
+def _color_to_code(color: Color | None, color_system: ColorSystem | None) -> int:
+    if color is None:
+        return _MISSING
+    if color_system is not None:
+        assert color.number is not None
+        return color.number
+    red, green, blue = color.get_truecolor()
+    return (red << 16) | (green << 8) | blue
+
+
+def _encode_segments(segments: list[Segment], color_system: ColorSystem | None) -> bytes:
+    """
+    Encode segments (produced from an image) as a run length and a pair of color codes per segment,
+    with a zero-length run for each line break.
+    """
+    data = bytearray()
+    for segment in segments:
+        style = segment.style
+        if style is None:
+            data += _RUN.pack(0, 0, 0)
+        else:
+            data += _RUN.pack(
+                len(segment.text),
+                _color_to_code(style.color, color_system),
+                _color_to_code(style.bgcolor, color_system),
+            )
+    return bytes(data)
+
+
+def _decode_segments(data: bytes, color_system: ColorSystem | None) -> list[Segment]:
+    line = Segment.line()
+    return [
+        Segment(UPPER_HALF_BLOCK * length, _pair_style(top, bottom, color_system))
+        if length
+        else line
+        for length, top, bottom in _RUN.iter_unpack(data)
+    ]
+
+
+def _decoded_bytes(img: Img.Image) -> int:
+    """
+    Approximately how much memory the decoded image uses:
+    Pillow stores images with a single 8-bit band in one byte per pixel,
+    and (nearly) all others in four bytes per pixel.
+    """
+    bytes_per_pixel = 1 if img.mode in ("1", "L", "P") else 4
+    return img.width * img.height * bytes_per_pixel
+
+
+ImageCacheKey = tuple[Path, int, int]
+
+
+class DerivedKey(NamedTuple):
+    """
+    The key for data derived from an image in memory (like its pyramid),
+    which is cached by the identity of the image rather than the file it was loaded from.
+    """
+
+    kind: str
+    image_id: int
+
+
+class LoadedImage(NamedTuple):
+    img: Img.Image
+    full_size: ImageSize
+    """\
+    The size of the image in the file,
+    which is larger than the size of `img` if it was decoded at a reduced scale.
+    """
+
+    def covers(self, size: ImageSize | None) -> bool:
+        """
+        Whether the decoded image is at least as large as the `size`,
+        or at full scale if the `size` is `None`.
+        """
+        if self.img.size == self.full_size:
+            return True
+        return size is not None and self.img.width >= size.width and self.img.height >= size.height
+
+
+@dataclass(frozen=True)
+class ImageCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    """The number of images evicted to stay within the cache's memory limit."""
+    images: int
+    """The number of images currently in the cache."""
+    derived: int
+    """The number of pieces of data derived from images (like pyramids) currently in the cache."""
+    bytes: int
+    """Approximately how much memory the images and derived data currently in the cache use."""
+    max_bytes: int
+
+
+@dataclass
+class ImageCache:
+    """
+    Decoded images, keyed on the path, modification time, and size of the file they were loaded from,
+    so that an image is decoded again (e.g., when the deck is reloaded) if its file has changed.
+
+    Data derived from images that is expensive to compute (like image pyramids) is cached here too,
+    so that it counts towards the same memory limit.
+
+    The cache is limited by how much memory its entries use,
+    and evicts the least recently used entries first.
+    """
+
+    max_bytes: int = IMAGE_CACHE_BYTES
+    """The maximum amount of memory the entries in the cache may use."""
+
+    _entries: OrderedDict[ImageCacheKey | DerivedKey, tuple[object, int]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _building: dict[DerivedKey, Lock] = field(default_factory=dict, init=False, repr=False)
+    _bytes: int = field(default=0, init=False)
+    _hits: int = field(default=0, init=False)
+    _misses: int = field(default=0, init=False)
+    _evictions: int = field(default=0, init=False)
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+
+    def load(self, path: Path) -> Img.Image:
+        """Load the image at full scale."""
+        return self.decode(path, size=None).img
+
+    def decode(self, path: Path, size: ImageSize | None) -> LoadedImage:
+        """
+        Load the image, decoded at the smallest scale that is at least as large as the `size`
+        (or at full scale if the `size` is `None`).
+
+        Only some formats (e.g., JPEG) can be decoded at a reduced scale;
+        other formats are always decoded at full scale.
+        An image that was decoded at a reduced scale is decoded again
+        if it is later loaded at a larger size.
+        """
+        path = path.resolve()
+        stat = path.stat()
+        key = (path, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and cast(LoadedImage, entry[0]).covers(size):
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return cast(LoadedImage, entry[0])
+            self._misses += 1
+
+        # decoded outside the lock, so that loading one large image doesn't block loading others
+        img = Img.open(path)
+        full_size = ImageSize(*img.size)
+        if size is not None:
+            img.draft(None, size)
+        img.load()
+
+        loaded = LoadedImage(img=img, full_size=full_size)
+        num_bytes = _decoded_bytes(img)
+
+        with self._lock:
+            # any other entries for this path are for older versions of the file,
+            # or for smaller decodings of this version
+            for stale in [k for k in self._entries if k[0] == path]:
+                self._remove(stale)
+
+            self._add(key, loaded, num_bytes)
+
+        return loaded
+
+    def derived(self, key: DerivedKey) -> object | None:
+        """The data derived from an image for the `key`, if it is in the cache."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put_derived(self, key: DerivedKey, value: object, num_bytes: int) -> None:
+        """Cache data derived from an image, which uses approximately `num_bytes` of memory."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._add(key, value, num_bytes)
+
+    def building(self, key: DerivedKey) -> Lock:
+        """
+        A lock to hold while deriving the data for the `key`,
+        so that it is only derived by one thread at a time.
+        """
+        with self._lock:
+            lock = self._building.get(key)
+            if lock is None:
+                lock = self._building[key] = Lock()
+            return lock
+
+    def forget(self, key: DerivedKey) -> None:
+        """Drop the data derived from an image, e.g. because the image was garbage collected."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._building.pop(key, None)
+
+    def _add(self, key: ImageCacheKey | DerivedKey, value: object, num_bytes: int) -> None:
+        # an entry that is too large to ever fit is not cached at all
+        if num_bytes <= self.max_bytes:
+            self._entries[key] = (value, num_bytes)
+            self._bytes += num_bytes
+
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, key: ImageCacheKey | DerivedKey) -> None:
+        _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._building.clear()
+            self._bytes = 0
+
+    def stats(self) -> ImageCacheStats:
+        with self._lock:
+            derived = sum(isinstance(key, DerivedKey) for key in self._entries)
+            return ImageCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                images=len(self._entries) - derived,
+                derived=derived,
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+
+image_cache = ImageCache()
+"""The cache that `Image.from_file` loads images through."""
+
+
+def clear_caches() -> None:
+    """
+    Forget the segments that images have been rendered to,
+    so that the next render of each image resizes and converts it again.
+    (The decoded images themselves are kept; use `image_cache.clear()` to forget those too.)
+    """
+    with _segment_cache_lock:
+        _segment_cache.clear()
+
+
+def _fit(size: ImageSize, options: ConsoleOptions) -> ImageSize:
+    """
+    The size to display an image of the given size at,
+    filling the available height (if there is one) without exceeding the available width.
+    """
+    width: float
+    height: float
+    width, height = size
+
+    # multiply the max height by 2, because we're going to print 2 "pixels" per row
+    max_height = options.height * 2 if options.height else None
+    if max_height:
+        width, height = size.width * max_height / size.height, max_height
+
+    if width > options.max_width:
+        width, height = options.max_width, height * options.max_width / width
+
+    return ImageSize(floor(width), floor(height))
+
+
+class _ImageSource(NamedTuple):
+    path: Path
+    size: ImageSize
+    loaded: bool
+    """\
+    Whether the image's `img` has its pixels,
+    rather than only the metadata from the file's header (decoding it when it is first resized).
+    """
+
+
+def _start_decoding(path: Path) -> None:
+    """
+    Start decoding an image in a worker thread (if there are workers),
+    e.g. while the rest of the deck loads.
+    """
+    workers = background.installed()
+    if workers is not None:
+        workers.executor.submit(image_cache.decode, path, _terminal_pixels())
+
+
+def _terminal_pixels() -> ImageSize:
+    # each character cell displays two "pixels", one above the other
+    columns, lines = get_terminal_size()
+    return ImageSize(columns, lines * 2)
 
 
 @dataclass(frozen=True)
 class Image:
-    img: Img
+    img: Img.Image
+
+    resample: Resampling = field(default=RESAMPLE, kw_only=True)
+    """The filter to resize the image with."""
+
+    preview_resample: Resampling = field(default=PREVIEW_RESAMPLE, kw_only=True)
+    """\
+    The (faster) filter to resize the image with while rendering at preview quality,
+    e.g. while the terminal is being resized, during transitions, and in Deck view thumbnails.
+    """
+
+    colors: int | None = field(default=None, kw_only=True)
+    """\
+    If not `None`, reduce the image to an adaptive palette of at most this many colors.
+    Fewer distinct colors means longer runs of identical cells and fewer distinct styles,
+    so much less output needs to be written to the terminal (e.g., over a slow SSH connection).
+    """
+
+    dither: bool = field(default=False, kw_only=True)
+    """\
+    If `True`, use ordered dithering to smooth out the gradients in images reduced to a palette.
+    Dithering breaks up runs of identical cells, so it writes more output than not dithering.
+    """
+
+    background: bool = field(default=False, kw_only=True)
+    """\
+    If `True`, decode and resize the image in a worker thread while presenting,
+    displaying a placeholder until it is ready,
+    so that displaying large images never blocks the app.
+    Only images loaded by `from_file` can be decoded in the background;
+    their `img` only has the image's metadata (like its size), not its pixels.
+    """
+
+    # Set for images loaded by from_file, which may be decoded at a reduced scale.
+    _source: _ImageSource | None = field(default=None, kw_only=True, repr=False)
 
     @classmethod
-    def from_file(cls, path: Path) -> Image:
-        return cls(img=_load_image(path))
+    def from_file(
+        cls,
+        path: Path,
+        resample: Resampling = RESAMPLE,
+        preview_resample: Resampling = PREVIEW_RESAMPLE,
+        colors: int | None = None,
+        dither: bool = False,
+        background: bool = False,
+    ) -> Image:
+        """
+        Load an image from a file.
 
-    def _determine_size(self, options: ConsoleOptions) -> ImageSize:
-        width, height = self.img.size
+        Large images are decoded at a reduced scale if the file format supports it,
+        just large enough to fill the terminal, and decoded again at a larger scale
+        only if they are later displayed larger than that.
+
+        If `background` is `True`, only the image's metadata is read here,
+        and the image is decoded in a worker thread instead (if there are workers).
+        If there is a disk cache, only the image's metadata is read here too,
+        and the image is only decoded if it isn't in the disk cache at the size it is displayed at.
+        """
+        if not background and disk_cache.installed() is None:
+            loaded = image_cache.decode(path, _terminal_pixels())
+            return cls(
+                img=loaded.img,
+                resample=resample,
+                preview_resample=preview_resample,
+                colors=colors,
+                dither=dither,
+                _source=_ImageSource(path=path, size=loaded.full_size, loaded=True),
+            )
 
-        # multiply the max height by 2, because we're going to print 2 "pixels" per row
-        max_height = options.height * 2 if options.height else None
-        if max_height:
-            width, height = width * max_height / self.img.height, max_height
+        # opening an image only reads its header; closing it makes sure it is never decoded here
+        with Img.open(path) as img:
+            size = ImageSize(*img.size)
 
-        if width > options.max_width:
-            width, height = options.max_width, height * options.max_width / width
+        if background:
+            _start_decoding(path)
+
+        return cls(
+            img=img,
+            resample=resample,
+            preview_resample=preview_resample,
+            colors=colors,
+            dither=dither,
+            background=background,
+            _source=_ImageSource(path=path, size=size, loaded=False),
+        )
 
-        return ImageSize(floor(width), floor(height))
+    @property
+    def _full_size(self) -> ImageSize:
+        return self._source.size if self._source is not None else ImageSize(*self.img.size)
 
-    def _resize(self, size: ImageSize) -> Img:
-        return self.img.resize(
+    def _source_image(self, size: ImageSize) -> Img.Image:
+        """The decoded image to resize to the given size, decoding it again if it is too small."""
+        if self._source is None:
+            return self.img
+        if self._source.loaded and LoadedImage(self.img, self._source.size).covers(size):
+            return self.img
+        return image_cache.decode(self._source.path, size).img
+
+    def _determine_size(self, options: ConsoleOptions) -> ImageSize:
+        return _fit(self._full_size, options)
+
+    def _resample(self) -> Resampling:
+        return self.preview_resample if quality.current() is Quality.Preview else self.resample
+
+    def _resize(self, size: ImageSize, resample: Resampling) -> Img.Image:
+        resized = _pyramid_level(self._source_image(size), size).resize(
             size=size,
-            resample=Resampling.LANCZOS,
+            resample=resample,
+        )
+        if self.colors is not None:
+            resized = _quantize(resized, self.colors, self.dither)
+        return resized
+
+    def _disk_cache_key(self, size: ImageSize, color_system: ColorSystem | None) -> str | None:
+        if self._source is None or disk_cache.installed() is None:
+            return None
+
+        try:
+            digest = disk_cache.file_digest(self._source.path)
+        except OSError:
+            return None
+
+        return ":".join(
+            (
+                f"image-segments-v{SEGMENT_FORMAT_VERSION}",
+                digest,
+                f"{size.width}x{size.height}",
+                self.resample.name,
+                str(self.colors),
+                str(self.dither),
+                color_system.name if color_system is not None else "TRUECOLOR",
+            )
         )
 
+    def _load_segments(
+        self, size: ImageSize, color_system: ColorSystem | None
+    ) -> list[Segment] | None:
+        """Load full quality segments for this image from the disk cache, if there is one."""
+        cache = disk_cache.installed()
+        key = self._disk_cache_key(size, color_system)
+        if cache is None or key is None:
+            return None
+
+        data = cache.get(key)
+        if data is None:
+            return None
+
+        try:
+            return _decode_segments(data, color_system)
+        except struct.error:
+            return None
+
+    def _save_segments(
+        self, size: ImageSize, color_system: ColorSystem | None, segments: list[Segment]
+    ) -> None:
+        cache = disk_cache.installed()
+        key = self._disk_cache_key(size, color_system)
+        if cache is not None and key is not None:
+            cache.put(key, _encode_segments(segments, color_system))
+
     def __rich_console__(self, console: Console, options: ConsoleOptions) -> Iterable[Segment]:
         size = self._determine_size(options)
-        resized = self._resize(size)
-        pixels = tuple(resized.getdata())
-        yield from _pixels_to_segments(pixels, size)
+        image_id = _image_id(self.img)
+        color_system = _DOWNGRADED_COLOR_SYSTEMS.get(console.color_system or "")
+
+        resample = self._resample()
+        key = (image_id, size, resample, self.colors, self.dither, color_system)
+
+        full_key = (image_id, size, self.resample, self.colors, self.dither, color_system)
+
+        # a full quality render is just as fast to display as a preview, if there already is one
+        segments = _cached_segments(full_key) or _cached_segments(key)
+        if segments is None:
+            render = partial(self._render_segments, size, resample, color_system, key, full_key)
+
+            workers = background.installed()
+            if self.background and workers is not None and workers.should_defer():
+                _render_in_background(workers, key, render)
+                quality.rendered_placeholder()
+                yield from _placeholder(console, size)
+                return
+
+            segments = render()
+
+        yield from segments
+
+    def _render_segments(
+        self,
+        size: ImageSize,
+        resample: Resampling,
+        color_system: ColorSystem | None,
+        key: SegmentCacheKey,
+        full_key: SegmentCacheKey,
+    ) -> list[Segment]:
+        segments = self._load_segments(size, color_system)
+        if segments is not None:
+            _cache_segments(full_key, segments)
+            return segments
+
+        segments = _image_to_segments(self._resize(size, resample), color_system)
+        _cache_segments(key, segments)
+        if resample == self.resample:
+            self._save_segments(size, color_system, segments)
+
+        return segments
+
+
+def _render_in_background(
+    workers: background.Workers, key: SegmentCacheKey, render: Callable[[], list[Segment]]
+) -> None:
+    with _segment_cache_lock:
+        future = _background_renders.get(key)
+        if future is None:
+            future = _background_renders[key] = workers.executor.submit(render)
+            submitted = True
+        else:
+            submitted = False
+
+    if submitted:
+        # outside the lock, because the callback is called right away if the render is already done
+        future.add_done_callback(partial(_rendered_in_background, workers, key))
+    elif future.done():
+        # successful renders are in the segment cache, so this one failed;
+        # raise its error here, and try again the next time the image is displayed
+        with _segment_cache_lock:
+            _background_renders.pop(key, None)
+        future.result()
+
+
+def _rendered_in_background(
+    workers: background.Workers, key: SegmentCacheKey, future: Future[list[Segment]]
+) -> None:
+    if future.cancelled() or future.exception() is None:
+        with _segment_cache_lock:
+            _background_renders.pop(key, None)
+
+    if not future.cancelled() and background.installed() is workers:
+        workers.on_ready()
+
+
+def _placeholder(console: Console, size: ImageSize) -> Iterable[Segment]:
+    """A placeholder that takes up as much space as the image will."""
+    if not (size.width and size.height):
+        return
+
+    options = console.options.update_dimensions(size.width, ceil(size.height / 2))
+    new_line = Segment.line()
+    for line in console.render_lines(PLACEHOLDER, options):
+        yield from line
+        yield new_line
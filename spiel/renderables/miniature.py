@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from rich.cells import get_character_cell_size
+from rich.color import Color
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.segment import Segment
+from rich.style import Style
+from rich.terminal_theme import MONOKAI, TerminalTheme
+
+from spiel.renderables.cached import Lines, RenderedLines
+
+RGB = tuple[int, int, int]
+
+TEXT_COVERAGE = 0.4
+"""\
+The fraction of a cell that a glyph is assumed to cover with its foreground color.
+"""
+
+THEME: TerminalTheme = MONOKAI
+"""\
+The theme used to resolve default and standard colors, which have no fixed RGB value.
+"""
+
+UPPER_HALF_BLOCK = "▀"
+LOWER_HALF_BLOCK = "▄"
+FULL_BLOCK = "█"
+
+
+@lru_cache(maxsize=2**10)
+def _colors(style: Style | None) -> tuple[RGB, RGB]:
+    style = style or Style.null()
+
+    foreground = tuple((style.color or Color.default()).get_truecolor(THEME, foreground=True))
+    background = tuple((style.bgcolor or Color.default()).get_truecolor(THEME, foreground=False))
+
+    if style.reverse:
+        foreground, background = background, foreground
+
+    return foreground, background  # type: ignore[return-value]
+
+
+def _blend(background: RGB, foreground: RGB, coverage: float) -> RGB:
+    return (
+        round(background[0] + (foreground[0] - background[0]) * coverage),
+        round(background[1] + (foreground[1] - background[1]) * coverage),
+        round(background[2] + (foreground[2] - background[2]) * coverage),
+    )
+
+
+@lru_cache(maxsize=2**12)
+def _cell_pixels(character: str, style: Style | None) -> tuple[RGB, RGB]:
+    """
+    The colors of the top and bottom halves of a cell,
+    which is what the cell looks like from far away.
+    """
+    foreground, background = _colors(style)
+
+    if character == UPPER_HALF_BLOCK:
+        return foreground, background
+    elif character == LOWER_HALF_BLOCK:
+        return background, foreground
+    elif character == FULL_BLOCK:
+        return foreground, foreground
+    elif character.isspace():
+        return background, background
+    else:
+        blended = _blend(background, foreground, TEXT_COVERAGE)
+        return blended, blended
+
+
+def _pixels(lines: Lines, width: int) -> list[list[RGB]]:
+    """
+    Convert rendered lines into rows of pixels, two rows per line.
+    """
+    _, empty = _colors(None)
+
+    rows = []
+    for line in lines:
+        top: list[RGB] = []
+        bottom: list[RGB] = []
+        for text, style, control in line:
+            if control:
+                continue
+            for character in text:
+                top_pixel, bottom_pixel = _cell_pixels(character, style)
+                for _ in range(get_character_cell_size(character)):
+                    top.append(top_pixel)
+                    bottom.append(bottom_pixel)
+
+        for row in (top, bottom):
+            del row[width:]
+            row.extend([empty] * (width - len(row)))
+            rows.append(row)
+
+    return rows
+
+
+def _blocks(source: int, target: int) -> list[range]:
+    """
+    Split `source` pixels into `target` contiguous blocks, none of them empty.
+    """
+    blocks = []
+    for t in range(target):
+        start = min((t * source) // target, source - 1)
+        stop = max(((t + 1) * source) // target, start + 1)
+        blocks.append(range(start, stop))
+    return blocks
+
+
+def _average(pixels: list[RGB]) -> RGB:
+    n = len(pixels)
+    return (
+        sum(p[0] for p in pixels) // n,
+        sum(p[1] for p in pixels) // n,
+        sum(p[2] for p in pixels) // n,
+    )
+
+
+def downsample(lines: Lines, size: tuple[int, int], width: int, height: int) -> Lines:
+    """
+    Shrink rendered lines into a miniature of the given size,
+    by averaging the colors of blocks of cells and drawing them with half-block characters.
+
+    Args:
+        lines: The rendered lines.
+        size: The width and height of the area that the lines were rendered into.
+        width: The width of the miniature, in cells.
+        height: The height of the miniature, in lines.
+
+    Returns:
+        The lines of the miniature.
+    """
+    source_width, source_height = size
+    if width <= 0 or height <= 0 or source_width <= 0 or source_height <= 0:
+        return [[] for _ in range(max(height, 0))]
+
+    _, empty = _colors(None)
+    pixels = _pixels(lines[:source_height], source_width)
+    pixels.extend([empty] * source_width for _ in range((source_height * 2) - len(pixels)))
+
+    columns = _blocks(source_width, width)
+    narrowed = [[_average(row[c.start : c.stop]) for c in columns] for row in pixels]
+
+    rows = [
+        [_average([narrowed[r][x] for r in block]) for x in range(width)]
+        for block in _blocks(source_height * 2, height * 2)
+    ]
+
+    styles: dict[tuple[RGB, RGB], Style] = {}
+    miniature = []
+    for top, bottom in zip(rows[::2], rows[1::2]):
+        line = []
+        for pair, count in _runs(list(zip(top, bottom))):
+            try:
+                style = styles[pair]
+            except KeyError:
+                style = styles[pair] = Style(
+                    color=Color.from_rgb(*pair[0]),
+                    bgcolor=Color.from_rgb(*pair[1]),
+                )
+            line.append(Segment(UPPER_HALF_BLOCK * count, style))
+        miniature.append(line)
+
+    return miniature
+
+
+def _runs(pairs: list[tuple[RGB, RGB]]) -> list[tuple[tuple[RGB, RGB], int]]:
+    runs: list[tuple[tuple[RGB, RGB], int]] = []
+    for pair in pairs:
+        if runs and runs[-1][0] == pair:
+            runs[-1] = (pair, runs[-1][1] + 1)
+        else:
+            runs.append((pair, 1))
+    return runs
+
+
+@dataclass(frozen=True)
+class Miniature:
+    """
+    Displays lines that were rendered at full size, shrunk to fit the space available.
+    """
+
+    lines: Lines
+    size: tuple[int, int]
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        width = options.max_width
+        source_width, source_height = self.size
+        height = options.height or max(round(width * source_height / max(source_width, 1)), 1)
+
+        yield RenderedLines(downsample(self.lines, self.size, width=width, height=height))
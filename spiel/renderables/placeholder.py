@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from rich.align import Align
+from rich.style import Style
+from rich.text import Text
+
+PLACEHOLDER = Align.center(Text("Rendering...", style=Style(dim=True)), vertical="middle")
+"""\
+Displayed in place of content that is still being rendered in the background.
+"""
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from math import floor
+from time import monotonic
+
+from textual import log
+from textual.message_pump import MessagePump
+from textual.timer import Timer
+
+
+def next_frame_time(previous: float | None, now: float, interval: float) -> float:
+    """
+    Determine when the next frame should be rendered.
+
+    Frames are scheduled on a fixed grid of deadlines spaced `interval` apart,
+    starting from the `previous` frame's deadline.
+    If we have fallen behind (e.g., because rendering a frame took longer than `interval`),
+    any frames whose deadlines have already passed are dropped instead of being rendered late,
+    so that slow frames can't pile up on top of each other.
+
+    Args:
+        previous: The deadline of the previous frame, or `None` if there was no previous frame.
+        now: The current time.
+        interval: The time between frames.
+
+    Returns:
+        The deadline for the next frame, which is always later than `now`.
+    """
+    if previous is None:
+        return now + interval
+
+    missed_frames = max(floor((now - previous) / interval), 0)
+    return previous + (missed_frames + 1) * interval
+
+
+class _Unobserved:
+    pass
+
+
+UNOBSERVED = _Unobserved()
+
+
+@dataclass(eq=False)
+class Subscription:
+    """
+    A callback registered with a `Clock`.
+    """
+
+    callback: Callable[[], object]
+    deadline: float
+    interval: float | None = None
+    observe: Callable[[], object] | None = None
+    last_observed: object = UNOBSERVED
+
+
+class Clock:
+    """
+    A single app-wide timer that calls back subscribers at the times they ask for,
+    so that every widget that needs to update periodically doesn't need its own timer.
+
+    Subscribers that only care about some value derived from the time
+    (like a clock display that only shows minutes)
+    can provide a function to `observe`,
+    and will only be called back when the observed value changes.
+    """
+
+    def __init__(self, owner: MessagePump) -> None:
+        self.owner = owner
+
+        self._subscriptions: list[Subscription] = []
+        self._timer: Timer | None = None
+        self._timer_deadline: float | None = None
+        self._ticking = False
+
+    def every(
+        self,
+        interval: float,
+        callback: Callable[[], object],
+        observe: Callable[[], object] | None = None,
+    ) -> Subscription:
+        """
+        Call the `callback` every `interval` seconds,
+        dropping calls if we fall behind.
+
+        Args:
+            interval: The time between calls.
+            callback: The function to call.
+            observe: If given, only call the `callback` when the value returned by this function changes.
+        """
+        return self._add(
+            Subscription(
+                callback=callback,
+                deadline=next_frame_time(None, monotonic(), interval),
+                interval=interval,
+                observe=observe,
+                last_observed=observe() if observe is not None else UNOBSERVED,
+            )
+        )
+
+    def at(self, deadline: float, callback: Callable[[], object]) -> Subscription:
+        """
+        Call the `callback` once, at the `deadline`
+        (a time comparable to [`time.monotonic`][time.monotonic]).
+        """
+        return self._add(Subscription(callback=callback, deadline=deadline))
+
+    def cancel(self, subscription: Subscription) -> None:
+        try:
+            self._subscriptions.remove(subscription)
+        except ValueError:
+            pass
+
+    def _add(self, subscription: Subscription) -> Subscription:
+        self._subscriptions.append(subscription)
+        self._schedule()
+        return subscription
+
+    def tick(self) -> None:
+        """
+        Call back every subscriber whose deadline has passed.
+
+        A subscriber that raises an exception is logged and skipped,
+        so that it can't stop the other subscribers from being called back.
+        """
+        self._timer = self._timer_deadline = None
+
+        now = monotonic()
+        due = [s for s in self._subscriptions if s.deadline <= now]
+
+        self._ticking = True
+        try:
+            for subscription in due:
+                try:
+                    self._call(subscription, now)
+                except Exception as e:
+                    log.error(f"Clock subscriber {subscription.callback!r} failed: {e!r}")
+        finally:
+            self._ticking = False
+            self._schedule()
+
+    def _call(self, subscription: Subscription, now: float) -> None:
+        if subscription.interval is None:
+            self.cancel(subscription)
+        else:
+            subscription.deadline = next_frame_time(
+                subscription.deadline, now, subscription.interval
+            )
+
+        if subscription.observe is not None:
+            observed = subscription.observe()
+            if observed == subscription.last_observed:
+                return
+            subscription.last_observed = observed
+
+        subscription.callback()
+
+    def _schedule(self) -> None:
+        if self._ticking:
+            return
+
+        deadline = min((s.deadline for s in self._subscriptions), default=None)
+
+        if deadline == self._timer_deadline:
+            return
+
+        if self._timer is not None:
+            self._timer.stop_no_wait()
+            self._timer = self._timer_deadline = None
+
+        if deadline is not None:
+            self._timer_deadline = deadline
+            # this is equivalent to MessagePump.set_timer, except that the timer is not allowed
+            # to skip its only tick if it starts late (e.g., because the deadline has already passed)
+            self._timer = Timer(
+                self.owner,
+                max(deadline - monotonic(), 0),
+                self.owner,
+                name="clock",
+                callback=self.tick,
+                repeat=0,
+                skip=False,
+            )
+            self._timer.start()
+            self.owner._timers.add(self._timer)
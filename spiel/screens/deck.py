@@ -16,6 +16,7 @@ class DeckScreen(SpielScreen):
         Binding("left", "prev_slide", "Go to previous slide."),
         Binding("down", "next_row", "Go to next row of slides."),
         Binding("up", "prev_row", "Go to previous row of slides."),
+        Binding("m", "toggle_deck_miniatures", "Toggle between miniature and reflowed slides."),
         Binding(
             "escape,enter", "switch_screen('slide')", "Go to Slide view with the selected slide."
         ),
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import inspect
 from typing import ClassVar, List, Tuple
 
 from textual.app import ComposeResult
@@ -9,12 +8,17 @@ from textual.events import Key
 
 from spiel.screens.screen import SpielScreen
 from spiel.widgets.footer import Footer
+from spiel.widgets.performance import PerformanceOverlay
 from spiel.widgets.slide import SlideWidget
 
-SUSPEND = "suspend"
-
 
 class SlideScreen(SpielScreen):
+    DEFAULT_CSS = """\
+    SlideScreen {
+        layers: below above;
+    }
+    """
+
     BINDINGS: ClassVar[List[Binding | Tuple[str, str, str]]] = [
         Binding("right", "next_slide", "Go to next slide."),
         Binding("left", "prev_slide", "Go to previous slide."),
@@ -24,17 +28,12 @@ class SlideScreen(SpielScreen):
 
     def compose(self) -> ComposeResult:
         yield SlideWidget()
+        yield PerformanceOverlay()
         yield Footer()
 
     def on_key(self, event: Key) -> None:
         slide = self.app.deck[self.app.current_slide_idx]
-        bind = slide.bindings.get(event.key)
-
-        if callable(bind):
-            signature = inspect.signature(bind)
-
-            kwargs: dict[str, object] = {}
-            if SUSPEND in signature.parameters:
-                kwargs[SUSPEND] = self.app.suspend
+        plan = slide.binding_plan(event.key)
 
-            bind(**kwargs)
+        if plan is not None:
+            plan(suspend=self.app.suspend)
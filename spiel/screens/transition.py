@@ -7,10 +7,11 @@ from textual.reactive import reactive
 
 from spiel.screens.screen import SpielScreen
 from spiel.slide import Slide
-from spiel.transitions.protocol import Direction, Transition
+from spiel.transitions.protocol import CompositingTransition, Direction, Transition
 from spiel.triggers import Triggers
 from spiel.widgets.fixed_slide import FixedSlideWidget
 from spiel.widgets.footer import Footer
+from spiel.widgets.transition import TransitionWidget
 
 
 class SlideTransitionScreen(SpielScreen):
@@ -36,8 +37,12 @@ class SlideTransitionScreen(SpielScreen):
     Footer#dummy {
         layer: below;
     }
+
+    TransitionWidget {
+        layer: above;
+    }
     """
-    progress = reactive(0, init=False, layout=True)
+    progress = reactive(0, init=False, repaint=False)
 
     def __init__(
         self,
@@ -56,6 +61,17 @@ class SlideTransitionScreen(SpielScreen):
         self.direction = direction
 
     def compose(self) -> ComposeResult:
+        if isinstance(self.transition, CompositingTransition):
+            yield TransitionWidget(
+                from_slide=self.from_slide,
+                from_triggers=self.from_triggers,
+                to_slide=self.to_slide,
+                transition=self.transition,
+                direction=self.direction,
+            )
+            yield Footer()
+            return
+
         from_widget = FixedSlideWidget(self.from_slide, triggers=self.from_triggers, id="from")
         to_widget = FixedSlideWidget(self.to_slide, id="to")
 
@@ -74,6 +90,10 @@ class SlideTransitionScreen(SpielScreen):
         )  # a dummy footer to hold space on the "below" layer, won't be displayed
 
     def watch_progress(self, new_progress: float) -> None:
+        if isinstance(self.transition, CompositingTransition):
+            self.query_one(TransitionWidget).progress = new_progress
+            return
+
         from_widget = self.query_one("#from")
         to_widget = self.query_one("#to")
 
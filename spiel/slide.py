@@ -1,17 +1,30 @@
 from __future__ import annotations
 
-import inspect
 from dataclasses import dataclass, field
+from threading import Lock
 from typing import Callable, Mapping, Type
 
-from rich.console import RenderableType
+from rich.console import Console, RenderableType
+from rich.errors import NotRenderableError
+from rich.protocol import is_renderable
 from rich.text import Text
 
+from spiel.fixtures import CallPlan
+from spiel.renderables.cached import CachedRenderable, Lines
 from spiel.transitions.protocol import Transition
 from spiel.transitions.swipe import Swipe
 from spiel.triggers import Triggers
 
 TRIGGERS = "triggers"
+SUSPEND = "suspend"
+
+CONTENT_FIXTURES = (TRIGGERS,)
+BINDING_FIXTURES = (SUSPEND,)
+
+RENDER_CACHE_SIZES = 4
+
+# slides may be pre-rendered in the background while they are also being rendered for display
+_render_cache_lock = Lock()
 
 Content = Callable[..., RenderableType]
 
@@ -50,11 +63,133 @@ class Slide:
     of the deck this slide is in.
     """
 
+    fps: float | None = None
+    """\
+    The target frame rate to re-render the slide at while it is displayed,
+    if its content function takes `triggers`.
+    Set to `None` to use the default frame rate (sixty frames per second).
+    """
+
+    next_change: Callable[[Triggers], float | None] | None = None
+    """\
+    An optional callable that is given the current [`Triggers`][spiel.Triggers]
+    and returns the time (comparable to [`Triggers.now`][spiel.Triggers.now])
+    at which the slide's content will next change,
+    or `None` if it will not change until the slide is triggered again.
+    Spiel will not re-render the slide until then,
+    which saves a lot of work for slides that only animate briefly (e.g., after a trigger).
+    """
+
+    render_budget: float | None = None
+    """\
+    The time, in seconds, that rendering the slide's content is expected to take at most.
+    If the slide keeps going over its budget,
+    Spiel will render it in the background instead of blocking the rest of the app.
+    Set to `None` to use the
+    [`Deck.render_budget`][spiel.Deck.render_budget]
+    of the deck this slide is in.
+    """
+
+    _render_cache: dict[tuple[int, int], CachedRenderable] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _content_plan: CallPlan[RenderableType] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _binding_plans: dict[str, CallPlan[None]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _overruns: int = field(default=0, init=False, repr=False, compare=False)
+    _render_in_background: bool = field(default=False, init=False, repr=False, compare=False)
+
+    @property
+    def content_plan(self) -> CallPlan[RenderableType]:
+        """The plan for calling the content function, recompiled if the content function changes."""
+        plan = self._content_plan
+        if plan is None or plan.function is not self.content:
+            plan = self._content_plan = CallPlan.compile(self.content, CONTENT_FIXTURES)
+            self._render_cache.clear()
+        return plan
+
+    def binding_plan(self, key: str) -> CallPlan[None] | None:
+        """The plan for calling the binding for the given key, or `None` if there is no such binding."""
+        binding = self.bindings.get(key)
+        if not callable(binding):
+            return None
+
+        plan = self._binding_plans.get(key)
+        if plan is None or plan.function is not binding:
+            plan = self._binding_plans[key] = CallPlan.compile(binding, BINDING_FIXTURES)
+        return plan
+
+    def compile(self) -> None:
+        """
+        Compile the plans for calling the content function and the bindings ahead of time,
+        so that they don't need to be compiled while presenting.
+        """
+        # accessing the plans compiles them if they haven't been compiled yet
+        self.content_plan
+        for key in self.bindings:
+            self.binding_plan(key)
+
+    @property
+    def takes_triggers(self) -> bool:
+        """Whether the slide's content function depends on the current `triggers`."""
+        return self.content_plan.takes(TRIGGERS)
+
     def render(self, triggers: Triggers) -> RenderableType:
-        signature = inspect.signature(self.content)
+        return self.content_plan(triggers=triggers)
+
+    def render_cached(self, triggers: Triggers, size: tuple[int, int]) -> RenderableType:
+        """
+        Render the slide's content, reusing the previous output if possible.
+
+        Content that does not take `triggers` can't change between renders
+        at the same size, so it is only rendered once per size.
+        Content that does take `triggers` is rendered every time.
+        """
+        if self.takes_triggers:
+            return self.render(triggers=triggers)
+
+        try:
+            return self._render_cache[size]
+        except KeyError:
+            pass
+
+        r = self.render(triggers=triggers)
+        if not is_renderable(r):
+            return r
+
+        with _render_cache_lock:
+            if len(self._render_cache) >= RENDER_CACHE_SIZES:
+                del self._render_cache[next(iter(self._render_cache))]
+
+            cached = self._render_cache[size] = CachedRenderable(r)
+
+        return cached
+
+    def render_lines(self, triggers: Triggers, console: Console, size: tuple[int, int]) -> Lines:
+        """
+        Render the slide's content all the way to lines of segments,
+        the same way it would be rendered in a widget of the given `size`.
+
+        For content that does not take `triggers`, the lines are cached,
+        so they can be prepared ahead of time (e.g., in the background).
+        """
+        return lay_out(self.render_cached(triggers=triggers, size=size), console, size)
+
+
+def lay_out(renderable: RenderableType, console: Console, size: tuple[int, int]) -> Lines:
+    """
+    Lay out rendered slide content into lines of segments,
+    the same way it would be laid out in a widget of the given `size`.
+    """
+    if not is_renderable(renderable):
+        raise NotRenderableError(f"object {renderable!r} is not renderable")
 
-        kwargs: dict[str, object] = {}
-        if TRIGGERS in signature.parameters:
-            kwargs[TRIGGERS] = triggers
+    options = console.options.update_dimensions(*size).update(highlight=False)
 
-        return self.content(**kwargs)
+    if isinstance(renderable, CachedRenderable):
+        return renderable.lines(console, options)
+    else:
+        return console.render_lines(renderable, options, pad=False)
@@ -5,6 +5,8 @@ from typing import Protocol, runtime_checkable
 
 from textual.widget import Widget
 
+from spiel.renderables.cached import Lines
+
 
 class Direction(Enum):
     """
@@ -70,3 +72,46 @@ class Transition(Protocol):
                 no matter which `direction` the transition should move in.
         """
         ...
+
+
+@runtime_checkable
+class CompositingTransition(Transition, Protocol):
+    """
+    A protocol that describes how to implement a transition animation
+    by compositing pre-rendered frames of the slides,
+    instead of by moving widgets around.
+
+    If a transition implements this protocol,
+    Spiel will render each slide only once at the start of the transition,
+    and will call [`composite`][spiel.CompositingTransition.composite]
+    to produce each frame of the animation,
+    which is much cheaper than laying out and rendering the slide widgets on every frame.
+    """
+
+    def composite(
+        self,
+        from_lines: Lines,
+        to_lines: Lines,
+        direction: Direction,
+        progress: float,
+        width: int,
+    ) -> Lines:
+        """
+        A hook function that is called each time the `progress`
+        of the transition animation updates,
+        which produces the frame to display.
+
+        Args:
+            from_lines: The rendered lines of the slide that we are leaving.
+            to_lines: The rendered lines of the slide that we are entering.
+                Both `from_lines` and `to_lines` have the same number of lines,
+                and every line is exactly `width` cells wide.
+            direction: The desired direction of the transition animation.
+            progress: The progress of the animation, as a percentage.
+                See [`Transition.progress`][spiel.Transition.progress] for details.
+            width: The width of the lines, in cells.
+
+        Returns:
+            The lines of the frame to display.
+        """
+        ...
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from rich.segment import Segment
 from textual.widget import Widget
 
-from spiel.transitions.protocol import Direction, Transition
+from spiel.transitions.protocol import CompositingTransition, Direction, Lines
+from spiel.utils import clamp
 
 
-class Swipe(Transition):
+class Swipe(CompositingTransition):
     """
     A transition where the current and incoming slide are placed side-by-side
     and gradually slide across the screen,
@@ -38,3 +40,30 @@ class Swipe(Transition):
             case Direction.Previous:
                 from_widget.styles.offset = (f"{progress:.2f}%", 0)
                 to_widget.styles.offset = (f"-{100 - progress:.2f}%", 0)
+
+    def composite(
+        self,
+        from_lines: Lines,
+        to_lines: Lines,
+        direction: Direction,
+        progress: float,
+        width: int,
+    ) -> Lines:
+        offset = clamp(round(width * progress / 100), 0, width)
+
+        # each line of the frame is the right part of the line on the left,
+        # followed by the left part of the line on the right
+        match direction:
+            case Direction.Next:
+                left, right, cut = from_lines, to_lines, offset
+            case Direction.Previous:
+                left, right, cut = to_lines, from_lines, width - offset
+
+        cuts = [cut, width]
+        frame = []
+        for left_line, right_line in zip(left, right):
+            _, left_part = Segment.divide(left_line, cuts)
+            right_part, _ = Segment.divide(right_line, cuts)
+            frame.append([*left_part, *right_part])
+
+        return frame
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from itertools import zip_longest
-from typing import TypeVar
+from typing import Generic, TypeVar
 
 T = TypeVar("T")
 
@@ -22,3 +23,30 @@ def clamp(value: int, lower: int, upper: int) -> int:
 def chunks(iterable: Iterable[T], n: int, fill_value: T | None = None) -> Iterable[Iterable[T]]:
     args = [iter(iterable)] * n
     return zip_longest(*args, fillvalue=fill_value)
+
+
+class Installed(Generic[T]):
+    """
+    Something (like a tracer or a cache) that is installed for the whole process,
+    or `None` if nothing is installed.
+
+    It is stored in a plain attribute rather than a context variable,
+    so that it can be used from worker threads
+    (and from Textual's tasks, which don't share context with the ones that handle events) too.
+    """
+
+    def __init__(self) -> None:
+        self.value: T | None = None
+
+    def install(self, value: T | None) -> None:
+        self.value = value
+
+    @contextmanager
+    def using(self, value: T) -> Iterator[T]:
+        """Install the value within the `with` block, then restore whatever was installed before."""
+        previous = self.value
+        self.install(value)
+        try:
+            yield value
+        finally:
+            self.install(previous)
@@ -7,9 +7,10 @@ from rich.rule import Rule
 from rich.style import Style
 from rich.table import Column, Table
 from rich.text import Text
-from textual.reactive import reactive
+from textual.reactive import _watch, reactive
 
 from spiel.constants import FOOTER_TIME_FORMAT
+from spiel.scheduling import Subscription
 from spiel.widgets.widget import SpielWidget
 
 
@@ -24,11 +25,27 @@ class Footer(SpielWidget):
 
     now: datetime = reactive(datetime.now)  # type: ignore[arg-type,assignment]
 
+    _clock_subscription: Subscription | None = None
+
     def on_mount(self) -> None:
         super().on_mount()
 
+        _watch(self, self.app, "over_budget", self.refresh)
+
         self.update_now()
-        self.set_interval(1 / 60, self.update_now)
+        if not self.app.fixed_time:
+            # the displayed time only changes once per minute,
+            # so only refresh when the formatted time actually changes
+            self._clock_subscription = self.app.clock.every(
+                1,
+                self.update_now,
+                observe=lambda: datetime.now().strftime(FOOTER_TIME_FORMAT),
+            )
+
+    def on_unmount(self) -> None:
+        if self._clock_subscription is not None:
+            self.app.clock.cancel(self._clock_subscription)
+            self._clock_subscription = None
 
     def update_now(self) -> None:
         self.now = self.app.fixed_time or datetime.now()
@@ -49,8 +66,9 @@ class Footer(SpielWidget):
         grid.add_row(
             Text(f"{self.app.deck.name} | {self.app.deck[self.app.current_slide_idx].title}"),
             self.app.message,
-            Text(
-                f"{self.now.strftime(FOOTER_TIME_FORMAT)}   [{self.app.current_slide_idx + 1:>0{self.longest_slide_number_length}d} / {len(self.app.deck)}]"
+            Text.assemble(
+                ("over budget   ", Style(color="yellow")) if self.app.over_budget else "",
+                f"{self.now.strftime(FOOTER_TIME_FORMAT)}   [{self.app.current_slide_idx + 1:>0{self.longest_slide_number_length}d} / {len(self.app.deck)}]",
             ),
         )
         return Group(Rule(style=Style(dim=True)), grid)
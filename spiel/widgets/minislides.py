@@ -1,70 +1,379 @@
 from __future__ import annotations
 
-from itertools import islice
+import asyncio
+from collections.abc import Iterator
+from functools import partial
 from math import ceil
+from typing import Any
 
-from rich.console import RenderableType
-from rich.layout import Layout
+from rich.align import Align
+from rich.console import Console, RenderableType
 from rich.panel import Panel
+from rich.segment import Segment
 from rich.style import Style
 from rich.text import Text
+from textual.reactive import _watch, reactive
 
+from spiel import instrumentation, quality
+from spiel.quality import Quality
+from spiel.renderables.cached import CachedRenderable, Lines, RenderedLines
+from spiel.renderables.miniature import Miniature
+from spiel.renderables.placeholder import PLACEHOLDER
+from spiel.slide import Slide
 from spiel.triggers import Triggers
 from spiel.utils import clamp
 from spiel.widgets.widget import SpielWidget
 
+MIN_THUMBNAIL_WIDTH = 12
+MIN_THUMBNAIL_HEIGHT = 5
+THUMBNAIL_CACHE_SIZE = 256
+SCROLL_DURATION = 0.15
+
+
+def split(total: int, parts: int) -> list[int]:
+    """
+    Split a length into a number of parts whose lengths differ by at most one.
+    """
+    return [(total * (p + 1)) // parts - (total * p) // parts for p in range(parts)]
+
 
 class MiniSlides(SpielWidget):
-    def render(self) -> RenderableType:
+    scroll_row = reactive(0.0)
+    """\
+    The (possibly fractional) index of the row of slides displayed at the top of the grid.
+    Animated towards the row that centers the current slide when the selection moves.
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        super().__init__(name=name, id=id, classes=classes)
+
+        # Thumbnails remember the lines they rendered to at each cell size,
+        # so they are only laid out again when the deck is reloaded or the cells are resized.
+        # The slide content is cached separately from the panel around it,
+        # so that moving the selection only redraws the borders of the panels it changed.
+        self._contents: dict[int, tuple[CachedRenderable, bool]] = {}
+        self._thumbnails: dict[tuple[int, bool], CachedRenderable] = {}
+        self._pending: dict[int, asyncio.Future[tuple[CachedRenderable, bool]]] = {}
+
+    def on_mount(self) -> None:
+        super().on_mount()
+
+        _watch(self, self.app, "deck", self.on_new_deck)
+        _watch(self, self.app, "current_slide_idx", self.scroll_to_current_slide)
+        _watch(self, self.app, "deck_miniatures", self.clear_thumbnails)
+
+        self.scroll_row = self.target_row()
+
+    def on_new_deck(self) -> None:
+        self.clear_thumbnails()
+        self.scroll_row = self.target_row()
+
+    def on_resize(self) -> None:
+        # miniatures are shrunk from slides rendered at the size of this widget
+        if self.app.deck_miniatures:
+            self.clear_thumbnails()
+
+    def clear_thumbnails(self) -> None:
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._contents.clear()
+        self._thumbnails.clear()
+
+    def target_row(self) -> int:
+        """
+        The row to display at the top of the grid so that the current slide is centered,
+        as far as possible without scrolling past the end of the deck.
+        """
         grid_width = self.app.deck_grid_width
-        row_of_current_slide = self.app.current_slide_idx // grid_width
         num_rows = ceil(len(self.app.deck) / grid_width)
-        start_row = clamp(
-            value=row_of_current_slide - (grid_width // 2),
+        return clamp(
+            value=(self.app.current_slide_idx // grid_width) - (grid_width // 2),
             lower=0,
             upper=max(num_rows - grid_width, 0),
         )
-        start_slide_idx = grid_width * start_row
-        slides = islice(enumerate(self.app.deck), start_slide_idx, None)
-
-        rows = [Layout(name=str(r)) for r in range(grid_width)]
-        cols = [[Layout(name=f"{r}-{c}") for c in range(grid_width)] for r, _ in enumerate(rows)]
-
-        root = Layout()
-        root.split_column(*rows)
-
-        for row, layouts in zip(rows, cols):
-            row.split_row(*layouts)
-
-            for layout in layouts:
-                slide_idx, slide = next(slides, (None, None))
-                if slide_idx is None or slide is None:
-                    layout.update("")
-                else:
-                    is_active_slide = slide_idx == self.app.current_slide_idx
-
-                    try:
-                        content = slide.render(triggers=Triggers.new())
-                        border_style = Style(
-                            color="bright_cyan" if is_active_slide else None,
-                            dim=not is_active_slide,
-                        )
-                    except Exception as e:
-                        content = Text(
-                            f"Failed to render slide {slide_idx + 1} due to:\n{e}",
-                            style=Style(color="red"),
-                        )
-                        border_style = Style(
-                            color="red1",
-                            dim=not is_active_slide,
-                        )
-
-                    layout.update(
-                        Panel(
-                            content,
-                            title=" | ".join((str(slide_idx + 1), slide.title)),
-                            border_style=border_style,
-                        )
-                    )
-
-        return root
+
+    def scroll_to_current_slide(self) -> None:
+        self.animate("scroll_row", value=self.target_row(), duration=SCROLL_DURATION)
+
+    def content(
+        self, slide_idx: int, slide: Slide, cell: tuple[int, int]
+    ) -> tuple[CachedRenderable, bool] | None:
+        """
+        Get the content of the thumbnail of a slide,
+        and whether the slide failed to render.
+
+        If the app has a thumbnail executor, the content is rendered in it
+        and `None` is returned until it is ready; the grid is refreshed when it is.
+        `None` is also returned (and nothing is cached) if any of the content
+        was rendered as a placeholder because it isn't ready yet.
+        """
+        try:
+            return self._contents[slide_idx]
+        except KeyError:
+            pass
+
+        render = partial(
+            render_content,
+            slide_idx=slide_idx,
+            slide=slide,
+            console=self.app.console,
+            # Miniatures are shrunk from the slide rendered at the size it is presented at,
+            # which is the same as the size of this widget.
+            size=(self.size.width, self.size.height) if self.app.deck_miniatures else None,
+            cell=cell,
+        )
+
+        executor = self.app.thumbnail_executor
+        if executor is None:
+            placeholders = quality.placeholders_rendered()
+            result = render()
+            if quality.placeholders_rendered() != placeholders:
+                # some of the content (e.g., an image rendered in the background) isn't ready yet,
+                # so it is rendered again when the app is refreshed because it is
+                return None
+
+            self._contents[slide_idx] = result
+            evict(self._contents)
+            return result
+
+        if slide_idx not in self._pending:
+            future = asyncio.get_running_loop().run_in_executor(executor, render)
+            future.add_done_callback(partial(self.on_content_rendered, slide_idx))
+            self._pending[slide_idx] = future
+
+        return None
+
+    def on_content_rendered(
+        self, slide_idx: int, future: asyncio.Future[tuple[CachedRenderable, bool]]
+    ) -> None:
+        if self._pending.get(slide_idx) is not future:
+            # the thumbnails were cleared while this one was being rendered
+            return
+
+        del self._pending[slide_idx]
+        if future.cancelled():
+            return
+
+        self._contents[slide_idx] = future.result()
+        evict(self._contents)
+        self.refresh()
+
+    def thumbnail(
+        self, slide_idx: int, slide: Slide, is_active_slide: bool, cell: tuple[int, int]
+    ) -> CachedRenderable:
+        key = (slide_idx, is_active_slide)
+        try:
+            return self._thumbnails[key]
+        except KeyError:
+            pass
+
+        result = self.content(slide_idx, slide, cell)
+        if result is None:
+            # not cached, so that it is replaced as soon as the content is ready
+            return CachedRenderable(
+                thumbnail_panel(
+                    slide_idx=slide_idx,
+                    slide=slide,
+                    content=PLACEHOLDER,
+                    failed=False,
+                    is_active_slide=is_active_slide,
+                )
+            )
+
+        content, failed = result
+        thumbnail = self._thumbnails[key] = CachedRenderable(
+            thumbnail_panel(
+                slide_idx=slide_idx,
+                slide=slide,
+                content=content,
+                failed=failed,
+                is_active_slide=is_active_slide,
+            )
+        )
+        evict(self._thumbnails)
+        return thumbnail
+
+    def title_tile(self, slide_idx: int, slide: Slide, is_active_slide: bool) -> RenderableType:
+        """
+        A low-fidelity tile that only shows the slide's title,
+        used instead of a thumbnail when the cells are too small for the slide content to be legible.
+        The slide's content is not rendered at all.
+        """
+        return Align.center(
+            Text(
+                title(slide_idx, slide),
+                style=border_style(is_active_slide=is_active_slide, failed=False),
+                no_wrap=True,
+                overflow="ellipsis",
+            ),
+            vertical="middle",
+        )
+
+    def cell(self, slide_idx: int, width: int, height: int) -> Lines:
+        if slide_idx >= len(self.app.deck):
+            return [[Segment(" " * width)] for _ in range(height)]
+
+        slide = self.app.deck[slide_idx]
+        is_active_slide = slide_idx == self.app.current_slide_idx
+        console = self.app.console
+        options = console.options.update_dimensions(width, height)
+
+        if width < MIN_THUMBNAIL_WIDTH or height < MIN_THUMBNAIL_HEIGHT:
+            lines = console.render_lines(
+                self.title_tile(slide_idx, slide, is_active_slide), options, pad=False
+            )
+        else:
+            lines = self.thumbnail(slide_idx, slide, is_active_slide, (width, height)).lines(
+                console, options
+            )
+
+        return [Segment.adjust_line_length(line, width) for line in lines[:height]]
+
+    def row(self, row: int, widths: list[int], height: int) -> Iterator[list[Segment]]:
+        grid_width = len(widths)
+        cells = [
+            self.cell(slide_idx=(row * grid_width) + col, width=width, height=height)
+            for col, width in enumerate(widths)
+        ]
+        for parts in zip(*cells):
+            yield [segment for part in parts for segment in part]
+
+    def render(self) -> RenderableType:
+        width, height = self.size
+        grid_width = self.app.deck_grid_width
+
+        if width <= 0 or height <= 0:
+            return ""
+
+        widths = split(width, grid_width)
+        row_height = max(height // grid_width, 1)
+
+        # Only the rows that are at least partially visible are rendered,
+        # so the cost of rendering doesn't depend on the number of slides in the deck.
+        top = round(self.scroll_row * row_height)
+        first_row = top // row_height
+        last_row = (top + height - 1) // row_height
+
+        lines: Lines = []
+        for row in range(first_row, last_row + 1):
+            lines.extend(self.row(row, widths=widths, height=row_height))
+
+        skip = top - (first_row * row_height)
+        visible = lines[skip : skip + height]
+        visible.extend([Segment(" " * width)] for _ in range(height - len(visible)))
+
+        return RenderedLines(visible)
+
+
+def render_content(
+    slide_idx: int,
+    slide: Slide,
+    console: Console,
+    size: tuple[int, int] | None,
+    cell: tuple[int, int],
+) -> tuple[CachedRenderable, bool]:
+    """
+    Render the content of the thumbnail of a slide, and whether the slide failed to render.
+    The content is laid out at the given cell size,
+    so that it is ready to be displayed without any more work if this is called in a worker thread.
+
+    Args:
+        slide_idx: The index of the slide in the deck.
+        slide: The slide.
+        console: The console to render with.
+        size: If not `None`, render the slide at this size and shrink it down to a miniature.
+            Otherwise, lay the slide content out directly in the thumbnail.
+        cell: The size of the grid cell that the thumbnail will be displayed in.
+    """
+    # Reflowed thumbnails are small, so they are always rendered at preview quality.
+    # Miniatures share the full-size slide's rendered lines with Slide view,
+    # so they must be rendered at full quality.
+    with (
+        instrumentation.span("render_thumbnail", "render", slide=slide_idx),
+        quality.rendering_at(Quality.Full if size is not None else Quality.Preview),
+    ):
+        return _render_content(slide_idx, slide, console, size, cell)
+
+
+def _render_content(
+    slide_idx: int,
+    slide: Slide,
+    console: Console,
+    size: tuple[int, int] | None,
+    cell: tuple[int, int],
+) -> tuple[CachedRenderable, bool]:
+    try:
+        content: RenderableType
+        if size is not None:
+            # Static slides share their rendered lines with Slide view and transitions.
+            content = Miniature(
+                lines=slide.render_lines(triggers=Triggers.new(), console=console, size=size),
+                size=size,
+            )
+        else:
+            content = slide.render(triggers=Triggers.new())
+        failed = False
+    except Exception as e:
+        content = Text(
+            f"Failed to render slide {slide_idx + 1} due to:\n{e}",
+            style=Style(color="red"),
+        )
+        failed = True
+
+    cached = CachedRenderable(content)
+
+    width, height = cell
+    console.render_lines(
+        thumbnail_panel(
+            slide_idx=slide_idx,
+            slide=slide,
+            content=cached,
+            failed=failed,
+            is_active_slide=False,
+        ),
+        console.options.update_dimensions(width, height),
+    )
+
+    return cached, failed
+
+
+def thumbnail_panel(
+    slide_idx: int,
+    slide: Slide,
+    content: RenderableType,
+    failed: bool,
+    is_active_slide: bool,
+) -> Panel:
+    return Panel(
+        content,
+        title=title(slide_idx, slide),
+        border_style=border_style(is_active_slide=is_active_slide, failed=failed),
+    )
+
+
+def title(slide_idx: int, slide: Slide) -> str:
+    return " | ".join((str(slide_idx + 1), slide.title))
+
+
+def border_style(is_active_slide: bool, failed: bool) -> Style:
+    if failed:
+        return Style(
+            color="red1",
+            dim=not is_active_slide,
+        )
+    else:
+        return Style(
+            color="bright_cyan" if is_active_slide else None,
+            dim=not is_active_slide,
+        )
+
+
+def evict(cache: dict[Any, Any]) -> None:
+    while len(cache) > THUMBNAIL_CACHE_SIZE:
+        del cache[next(iter(cache))]
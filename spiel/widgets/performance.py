@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from rich.console import RenderableType
+from rich.panel import Panel
+from rich.style import Style
+from rich.table import Column, Table
+from textual.reactive import _watch
+
+from spiel.scheduling import Subscription
+from spiel.widgets.slide import SlideWidget
+from spiel.widgets.widget import SpielWidget
+
+REFRESH_INTERVAL = 0.25
+
+
+class PerformanceOverlay(SpielWidget):
+    """
+    Displays how long the current slide takes to render and how much it writes to the terminal.
+    """
+
+    DEFAULT_CSS = """
+    PerformanceOverlay {
+        layer: above;
+        dock: right;
+        width: 32;
+        height: 9;
+    }
+    """
+
+    _refresh_subscription: Subscription | None = None
+
+    def on_mount(self) -> None:
+        super().on_mount()
+
+        _watch(self, self.app, "show_performance", self.on_toggle)
+        self.on_toggle()
+
+    def on_unmount(self) -> None:
+        self.stop_refreshing()
+
+    def on_toggle(self) -> None:
+        self.display = self.app.show_performance
+
+        if self.app.show_performance:
+            if self._refresh_subscription is None:
+                self._refresh_subscription = self.app.clock.every(REFRESH_INTERVAL, self.refresh)
+        else:
+            self.stop_refreshing()
+
+    def stop_refreshing(self) -> None:
+        if self._refresh_subscription is not None:
+            self.app.clock.cancel(self._refresh_subscription)
+            self._refresh_subscription = None
+
+    def render(self) -> RenderableType:
+        slide_widget = self.screen.query_one(SlideWidget)
+        frame = slide_widget.last_frame
+        output = self.app.output
+
+        grid = Table.grid(
+            Column(style=Style(dim=True)),
+            Column(justify="right"),
+            padding=(0, 1),
+            expand=True,
+        )
+
+        if frame is not None:
+            grid.add_row("frame", f"{frame.render_time * 1000:.1f} ms")
+            grid.add_row("  content", f"{frame.content_time * 1000:.1f} ms")
+            grid.add_row("  layout", f"{frame.layout_time * 1000:.1f} ms")
+            grid.add_row("segments", f"{frame.segments:,}")
+        else:
+            grid.add_row("frame", "-")
+            grid.add_row("  content", "-")
+            grid.add_row("  layout", "-")
+            grid.add_row("segments", "-")
+
+        if output is not None:
+            grid.add_row("output", f"{output.last:,} B/update")
+            grid.add_row("", f"{output.rate.rate() / 1024:,.1f} KiB/s")
+        else:
+            grid.add_row("output", "-")
+            grid.add_row("", "-")
+
+        grid.add_row("fps", f"{slide_widget.frame_rate.rate():.1f}")
+
+        return Panel(grid, title="Performance", border_style=Style(color="bright_cyan"))
@@ -1,58 +1,355 @@
 from __future__ import annotations
 
-import sys
-from time import monotonic
+import asyncio
+from collections.abc import Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial
+from time import monotonic, perf_counter
 
-from rich.box import HEAVY
-from rich.console import RenderableType
+from rich.console import Console, RenderableType
 from rich.errors import NotRenderableError
-from rich.panel import Panel
 from rich.protocol import is_renderable
 from rich.style import Style
-from rich.traceback import Traceback
-from textual.reactive import reactive
+from rich.text import Text
+from textual.reactive import _watch, reactive
 
-import spiel
-from spiel.exceptions import SpielException
+from spiel import instrumentation, quality
+from spiel.performance import RateMeter
+from spiel.quality import Quality
+from spiel.renderables.cached import Lines, RenderedLines
+from spiel.renderables.failure import render_failure_panel
+from spiel.renderables.placeholder import PLACEHOLDER
+from spiel.scheduling import Subscription, next_frame_time
+from spiel.slide import Slide, lay_out
 from spiel.triggers import Triggers
 from spiel.widgets.widget import SpielWidget
 
+OVERRUNS_BEFORE_BACKGROUND = 3
+"""\
+How many frames in a row a slide can go over its render budget
+before it is moved to a background worker.
+"""
+
+
+@dataclass(frozen=True)
+class Frame:
+    """
+    A rendered frame of a slide, and how long it took to render.
+    """
+
+    lines: Lines
+    failed: bool
+    content_time: float
+    """The time spent in the slide's content function, in seconds."""
+    layout_time: float
+    """The time spent laying the content out into lines, in seconds."""
+
+    @property
+    def render_time(self) -> float:
+        return self.content_time + self.layout_time
+
+    @property
+    def segments(self) -> int:
+        return sum(len(line) for line in self.lines)
+
+
+def render_frame(
+    slide: Slide, triggers: Triggers, console: Console, size: tuple[int, int]
+) -> Frame:
+    """
+    Render a frame of a slide, or the failure panel if the slide fails to render.
+    """
+    start = perf_counter()
+    content_done = None
+    try:
+        with instrumentation.span("content", "render", title=slide.title):
+            r = slide.render_cached(triggers=triggers, size=size)
+        content_done = perf_counter()
+        with instrumentation.span("layout", "render", title=slide.title):
+            lines = lay_out(r, console, size)
+        failed = False
+    except Exception:
+        width, height = size
+        lines = console.render_lines(
+            render_failure_panel(), console.options.update_dimensions(width, height), pad=False
+        )
+        failed = True
+
+    end = perf_counter()
+    content_done = content_done or end
+
+    return Frame(
+        lines=lines,
+        failed=failed,
+        content_time=content_done - start,
+        layout_time=end - content_done,
+    )
+
+
+def prerender(slides: Iterable[Slide], console: Console, size: tuple[int, int]) -> None:
+    # the lines are cached, so they must be full quality even if things are settling
+    with quality.rendering_at(Quality.Full):
+        _prerender(slides, console, size)
+
+
+def _prerender(slides: Iterable[Slide], console: Console, size: tuple[int, int]) -> None:
+    for slide in slides:
+        if slide.takes_triggers:
+            # content that takes triggers is re-rendered on every frame anyway
+            continue
+
+        # if the slide fails to render, the error will be displayed when we move to it
+        with suppress(Exception):
+            slide.render_lines(triggers=Triggers.new(), console=console, size=size)
+
 
 class SlideWidget(SpielWidget):
     triggers: Triggers = reactive(Triggers.new)  # type: ignore[assignment,arg-type]
 
+    _frame_timer: Subscription | None = None
+    _frame_deadline: float | None = None
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._prefetch: asyncio.Task[None] | None = None
+        self._prefetch_again = False
+
+        # The last frame of a slide that rendered successfully, which keeps being displayed
+        # while a slide that is rendered in the background is failing,
+        # and the last frame if it failed, which is only displayed if there is no good frame.
+        self._last_frame: tuple[Slide, Frame] | None = None
+        self._failed_frame: tuple[Slide, Frame] | None = None
+        self._background_render: asyncio.Task[Frame] | None = None
+        self._background_request: tuple[int, Triggers, tuple[int, int], Quality] | None = None
+        self.frame_rate = RateMeter()
+
     def on_mount(self) -> None:
         super().on_mount()
 
+        _watch(self, self.app, "deck", self.prefetch)
+        _watch(self, self.app, "current_slide_idx", self.prefetch)
+
         if not self.app.fixed_triggers:
-            self.set_interval(self.app.slide_refresh_rate, self.update_triggers)
+            _watch(self, self.app, "deck", self.schedule_frames)
+            _watch(self, self.app, "last_activity", self.wake)
+            self.schedule_frames()
         else:
             self.triggers = self.app.fixed_triggers
 
+    def on_unmount(self) -> None:
+        if self._frame_timer is not None:
+            self.app.clock.cancel(self._frame_timer)
+            self._frame_timer = None
+
+    def on_resize(self) -> None:
+        self.prefetch()
+
+    def prefetch(self) -> None:
+        """
+        Pre-render the slides on either side of the current slide in the background,
+        so that they can be displayed immediately when we move to them.
+
+        Only one prefetch runs at a time. Requests made in the meantime
+        (e.g., for every step of a terminal resize) are coalesced into one more prefetch,
+        of whatever the neighbours are at the size the widget is when the running one finishes.
+        """
+        if self._prefetch is not None:
+            self._prefetch_again = True
+            return
+
+        width, height = self.size
+        if not (width and height):
+            return
+
+        deck = self.app.deck
+        neighbours = [
+            deck[idx]
+            for idx in (self.app.current_slide_idx + 1, self.app.current_slide_idx - 1)
+            if 0 <= idx < len(deck)
+        ]
+
+        task = asyncio.create_task(
+            asyncio.to_thread(prerender, neighbours, self.app.console, (width, height))
+        )
+        task.add_done_callback(self.on_prefetched)
+        self._prefetch = task
+
+    def on_prefetched(self, task: asyncio.Task[None]) -> None:
+        self._prefetch = None
+        if self._prefetch_again:
+            self._prefetch_again = False
+            self.prefetch()
+
+    def watch_triggers(self, old_triggers: Triggers, new_triggers: Triggers) -> None:
+        # the frame schedule only needs to restart if the slide was triggered, reset, or changed,
+        # not when the triggers are updated by the frame schedule itself
+        if old_triggers._times != new_triggers._times and not self.app.fixed_triggers:
+            self.schedule_frames()
+
     def update_triggers(self) -> None:
         self.triggers = Triggers(now=monotonic(), _times=self.triggers._times)
 
+    def schedule_frames(self) -> None:
+        """
+        Restart the frame schedule, e.g. because the slide or its triggers changed.
+        """
+        if self._frame_timer is not None:
+            self.app.clock.cancel(self._frame_timer)
+            self._frame_timer = None
+
+        self._frame_deadline = None
+        self.schedule_next_frame()
+
+    def schedule_next_frame(self) -> None:
+        deadline = self.next_frame_deadline(monotonic())
+        if deadline is None:
+            return
+
+        self._frame_deadline = deadline
+        self._frame_timer = self.app.clock.at(deadline, self.on_frame)
+
+    def wake(self) -> None:
+        if self._frame_timer is None:
+            self.schedule_next_frame()
+
+    def on_frame(self) -> None:
+        self._frame_timer = None
+        self.update_triggers()
+        self.schedule_next_frame()
+
+    def next_frame_deadline(self, now: float) -> float | None:
+        """
+        Determine when the current slide next needs to be re-rendered,
+        or `None` if it doesn't need to be re-rendered until something else changes.
+        """
+        slide = self.current_slide
+
+        if not slide.takes_triggers or self.app.idle:
+            return None
+
+        if slide.next_change is not None:
+            next_change = slide.next_change(self.triggers)
+            if next_change is None:
+                return None
+        else:
+            next_change = now
+
+        interval = 1 / slide.fps if slide.fps else self.app.slide_refresh_rate
+
+        return max(next_frame_time(self._frame_deadline, now, interval), next_change)
+
+    @property
+    def render_budget(self) -> float | None:
+        slide = self.current_slide
+        return (
+            slide.render_budget if slide.render_budget is not None else self.app.deck.render_budget
+        )
+
     def render(self) -> RenderableType:
+        with instrumentation.span("render_slide", "render", slide=self.app.current_slide_idx):
+            return self.render_current_slide()
+
+    def render_current_slide(self) -> RenderableType:
+        budget = self.render_budget
+        if budget is None and not self.app.show_performance:
+            return self.render_slide()
+
+        # Render all the way to lines here, instead of letting Textual lay out the content,
+        # so that we can see how long rendering takes.
+        slide = self.current_slide
+        if slide._render_in_background:
+            return self.render_in_background(slide, budget)
+
+        frame = render_frame(
+            slide, self.triggers, self.app.console, (self.size.width, self.size.height)
+        )
+        self.record_frame(slide, frame, budget)
+
+        return RenderedLines(frame.lines)
+
+    def render_slide(self) -> RenderableType:
         try:
             self.remove_class("error")
-            r = self.current_slide.render(triggers=self.triggers)
+            r = self.current_slide.render_cached(triggers=self.triggers, size=self.size)
             if is_renderable(r):
                 return r
             else:
                 raise NotRenderableError(f"object {r!r} is not renderable")
         except Exception:
             self.add_class("error")
-            et, ev, tr = sys.exc_info()
-            if et is None or ev is None or tr is None:  # pragma: unreachable
-                raise SpielException("Expected to be handling an exception, but wasn't.")
-            return Panel(
-                Traceback.from_exception(
-                    exc_type=et,
-                    exc_value=ev,
-                    traceback=tr,
-                    suppress=(spiel,),
+            return render_failure_panel()
+
+    def render_in_background(self, slide: Slide, budget: float | None) -> RenderableType:
+        """
+        Display the last frame of the slide while its next frame is rendered in a worker thread,
+        so that slow content doesn't block the app.
+        Only one frame is rendered at a time; frames that are requested in the meantime are skipped.
+        """
+        size = (self.size.width, self.size.height)
+        # a frame rendered at preview quality while things were settling is rendered again after
+        request = (id(slide), self.triggers, size, quality.current())
+
+        if self._background_render is None and request != self._background_request:
+            self._background_request = request
+            task = asyncio.create_task(
+                asyncio.to_thread(render_frame, slide, self.triggers, self.app.console, size)
+            )
+            task.add_done_callback(partial(self.on_background_frame, slide, budget))
+            self._background_render = task
+
+        if self._last_frame is not None and self._last_frame[0] is slide:
+            return RenderedLines(self._last_frame[1].lines)
+        elif self._failed_frame is not None and self._failed_frame[0] is slide:
+            return RenderedLines(self._failed_frame[1].lines)
+        else:
+            return PLACEHOLDER
+
+    def on_background_frame(
+        self, slide: Slide, budget: float | None, task: asyncio.Task[Frame]
+    ) -> None:
+        self._background_render = None
+        if task.cancelled():
+            return
+
+        self.record_frame(slide, task.result(), budget)
+        self.refresh()
+
+    @property
+    def last_frame(self) -> Frame | None:
+        """The last frame of the current slide that rendered successfully, if any."""
+        if self._last_frame is not None and self._last_frame[0] is self.current_slide:
+            return self._last_frame[1]
+        else:
+            return None
+
+    def record_frame(self, slide: Slide, frame: Frame, budget: float | None) -> None:
+        self.set_class(frame.failed, "error")
+        if frame.failed:
+            self._failed_frame = (slide, frame)
+        else:
+            self._last_frame = (slide, frame)
+            self._failed_frame = None
+        self.frame_rate.tick()
+
+        if budget is None:
+            return
+
+        if frame.render_time > budget:
+            slide._overruns += 1
+        else:
+            slide._overruns = 0
+
+        if slide._overruns >= OVERRUNS_BEFORE_BACKGROUND and not slide._render_in_background:
+            slide._render_in_background = True
+            self.app.set_message_temporarily(
+                Text(
+                    f"Slide {self.app.current_slide_idx + 1} is over its render budget, "
+                    "rendering it in the background",
+                    style=Style(color="yellow"),
                 ),
-                title="Slide content failed to render",
-                border_style=Style(bold=True, color="red1"),
-                box=HEAVY,
+                delay=5,
             )
+
+        self.app.over_budget = slide._overruns > 0
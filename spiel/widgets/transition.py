@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from rich.console import RenderableType
+from rich.segment import Segment
+from textual.reactive import reactive
+
+from spiel.renderables.cached import Lines, RenderedLines
+from spiel.renderables.failure import render_failure_panel
+from spiel.slide import Slide
+from spiel.transitions.protocol import CompositingTransition, Direction
+from spiel.triggers import Triggers
+from spiel.widgets.widget import SpielWidget
+
+
+class TransitionWidget(SpielWidget):
+    """
+    Displays a [`CompositingTransition`][spiel.CompositingTransition]
+    by compositing frames of the two slides, which are only rendered once.
+    """
+
+    progress = reactive(0.0)
+
+    def __init__(
+        self,
+        from_slide: Slide,
+        from_triggers: Triggers,
+        to_slide: Slide,
+        transition: CompositingTransition,
+        direction: Direction,
+        id: str | None = None,
+    ) -> None:
+        super().__init__(id=id)
+
+        self.from_slide = from_slide
+        self.from_triggers = from_triggers
+        self.to_slide = to_slide
+        self.to_triggers = Triggers.new()
+        self.transition = transition
+        self.direction = direction
+
+        self._frames: dict[tuple[int, int], tuple[Lines, Lines]] = {}
+
+    def render_slide(self, slide: Slide, triggers: Triggers, size: tuple[int, int]) -> Lines:
+        width, height = size
+        console = self.app.console
+        try:
+            lines = slide.render_lines(triggers=triggers, console=console, size=size)
+        except Exception:
+            lines = console.render_lines(
+                render_failure_panel(),
+                console.options.update_dimensions(width, height),
+                pad=False,
+            )
+
+        lines = [Segment.adjust_line_length(line, width) for line in lines[:height]]
+        lines.extend([Segment(" " * width)] for _ in range(height - len(lines)))
+        return lines
+
+    def frames(self) -> tuple[Lines, Lines]:
+        size = (self.size.width, self.size.height)
+        try:
+            return self._frames[size]
+        except KeyError:
+            frames = self._frames[size] = (
+                self.render_slide(self.from_slide, self.from_triggers, size),
+                self.render_slide(self.to_slide, self.to_triggers, size),
+            )
+            return frames
+
+    def render(self) -> RenderableType:
+        from_lines, to_lines = self.frames()
+        return RenderedLines(
+            self.transition.composite(
+                from_lines=from_lines,
+                to_lines=to_lines,
+                direction=self.direction,
+                progress=self.progress,
+                width=self.size.width,
+            )
+        )
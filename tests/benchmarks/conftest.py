@@ -0,0 +1,59 @@
+import json
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from timeit import Timer
+
+import pytest
+
+RESULTS = pytest.StashKey[list[dict[str, object]]]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.stash[RESULTS] = []
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    path = session.config.getoption("--benchmark-json")
+    if path is not None:
+        path.write_text(json.dumps({"benchmarks": session.config.stash[RESULTS]}, indent=2))
+
+
+@dataclass
+class Benchmark:
+    """
+    Times functions, recording the results as properties of the test
+    (which end up in the JUnit XML report)
+    and in the JSON report written by --benchmark-json.
+    """
+
+    test: str
+    record_property: Callable[[str, object], None]
+    results: list[dict[str, object]]
+    repeat: int = 3
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def __call__(self, name: str, func: Callable[[], object], number: int) -> float:
+        """
+        Call the function `number` times per repetition,
+        and return the best time per call in seconds.
+        """
+        func()  # warm up
+
+        seconds = min(Timer(func).repeat(repeat=self.repeat, number=number)) / number
+
+        self.timings[name] = seconds
+        self.record_property(f"{name}_seconds", seconds)
+        self.results.append({"test": self.test, "name": name, "seconds": seconds, "number": number})
+
+        return seconds
+
+
+@pytest.fixture()
+def benchmark(
+    request: pytest.FixtureRequest, record_property: Callable[[str, object], None]
+) -> Iterator[Benchmark]:
+    yield Benchmark(
+        test=request.node.nodeid,
+        record_property=record_property,
+        results=request.config.stash[RESULTS],
+    )
@@ -0,0 +1,112 @@
+from collections.abc import Callable
+from io import StringIO
+from pathlib import Path
+from typing import Literal
+
+import pytest
+from PIL import Image as Img
+from rich.console import Console
+
+from spiel.renderables import animated
+from spiel.renderables.animated import AnimatedImage
+from spiel.renderables.image import Image, ImageSize, _image_to_segments, clear_caches
+from spiel.triggers import Triggers
+from tests.benchmarks.conftest import Benchmark
+
+SIZES = [(40, 12), (80, 24), (200, 60)]
+
+
+@pytest.fixture(scope="module")
+def source() -> Img.Image:
+    gradient = Img.linear_gradient("L").resize((512, 512))
+    return Img.merge("RGB", (gradient, gradient.rotate(90), gradient.rotate(180)))
+
+
+@pytest.fixture(scope="module")
+def image(source: Img.Image) -> Image:
+    return Image(img=source)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("width, height", SIZES)
+def test_image_to_segments(
+    benchmark: Benchmark, source: Img.Image, width: int, height: int
+) -> None:
+    img = source.resize(ImageSize(width, height * 2))
+
+    benchmark("image_to_segments", lambda: _image_to_segments(img), number=2)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("width, height", SIZES)
+def test_image_render(
+    benchmark: Benchmark, console: Console, image: Image, width: int, height: int
+) -> None:
+    options = console.options.update_dimensions(width, height)
+
+    def render() -> None:
+        clear_caches()
+        console.render_lines(image, options)
+
+    benchmark("render_uncached", render, number=2)
+    benchmark("render_cached", lambda: console.render_lines(image, options), number=2)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("color_system", ["truecolor", "256"])
+@pytest.mark.parametrize(
+    "colors, dither",
+    [
+        (None, False),
+        (16, False),
+        (16, True),
+    ],
+)
+def test_image_output_bytes(
+    benchmark: Benchmark,
+    record_property: Callable[[str, object], None],
+    source: Img.Image,
+    color_system: Literal["truecolor", "256"],
+    colors: int | None,
+    dither: bool,
+) -> None:
+    image = Image(img=source, colors=colors, dither=dither)
+    console = Console(
+        file=StringIO(),
+        width=80,
+        height=24,
+        color_system=color_system,
+        force_terminal=True,
+        legacy_windows=False,
+    )
+
+    def render() -> str:
+        clear_caches()
+        with console.capture() as capture:
+            console.print(image)
+        return capture.get()
+
+    benchmark("render_and_print", render, number=1)
+    record_property("output_bytes", len(render().encode("utf-8")))
+
+
+@pytest.mark.slow
+def test_animated_image_frame(
+    benchmark: Benchmark, console: Console, source: Img.Image, tmp_path: Path
+) -> None:
+    path = tmp_path / "animation.gif"
+    frames = [source.resize((128, 128)).rotate(angle) for angle in range(0, 360, 60)]
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=50, loop=0)
+
+    animation = AnimatedImage.from_file(path)
+    options = console.options.update_dimensions(80, 24)
+    frame = animation.frame(Triggers(now=0.2, _times=(0,)))
+
+    def render() -> None:
+        animated.clear_caches()
+        console.render_lines(frame, options)
+
+    cold = benchmark("frame_uncached", render, number=2)
+    warm = benchmark("frame_cached", lambda: console.render_lines(frame, options), number=2)
+
+    benchmark.record_property("cached_speedup", cold / warm)
@@ -0,0 +1,10 @@
+import pytest
+
+from spiel.app import load_deck
+from spiel.constants import DEMO_FILE
+from tests.benchmarks.conftest import Benchmark
+
+
+@pytest.mark.slow
+def test_load_demo_deck(benchmark: Benchmark) -> None:
+    benchmark("load_deck", lambda: load_deck(DEMO_FILE), number=5)
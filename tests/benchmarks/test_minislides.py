@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+from rich.console import Console
+from textual.geometry import Size
+
+from spiel import Deck, Slide
+from spiel.widgets.minislides import MiniSlides
+from tests.benchmarks.conftest import Benchmark
+
+
+@pytest.fixture(params=[10, 1000])
+def deck(request: pytest.FixtureRequest) -> Deck:
+    deck = Deck(name="deck")
+    deck.add_slides(
+        *(
+            Slide(title=str(idx), content=lambda idx=idx: f"slide {idx}")
+            for idx in range(request.param)
+        )
+    )
+    return deck
+
+
+@pytest.fixture()
+def app(mocker: MockerFixture, deck: Deck, console: Console) -> MagicMock:
+    app = MagicMock(
+        deck=deck,
+        current_slide_idx=len(deck) // 2,
+        deck_grid_width=3,
+        deck_miniatures=False,
+        thumbnail_executor=None,
+        console=console,
+    )
+    mocker.patch.object(MiniSlides, "app", new_callable=mocker.PropertyMock, return_value=app)
+    mocker.patch.object(
+        MiniSlides, "size", new_callable=mocker.PropertyMock, return_value=Size(120, 36)
+    )
+    return app
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("miniatures", [False, True])
+def test_minislides_render(
+    benchmark: Benchmark, app: MagicMock, console: Console, miniatures: bool
+) -> None:
+    app.deck_miniatures = miniatures
+    ms = MiniSlides()
+
+    def cold() -> None:
+        ms.clear_thumbnails()
+        console.render_lines(ms.render())
+
+    cold_seconds = benchmark("render_cold", cold, number=2)
+    warm_seconds = benchmark("render_warm", lambda: console.render_lines(ms.render()), number=5)
+
+    benchmark.record_property("warm_speedup", cold_seconds / warm_seconds)
@@ -0,0 +1,43 @@
+import inspect
+
+import pytest
+from rich.console import RenderableType
+from rich.text import Text
+
+from spiel import Slide, Triggers
+from spiel.slide import TRIGGERS
+from tests.benchmarks.conftest import Benchmark
+
+NUMBER = 10_000
+
+
+def content(triggers: Triggers) -> RenderableType:
+    return Text()
+
+
+def render_by_inspecting_signature(slide: Slide, triggers: Triggers) -> RenderableType:
+    # how Slide.render dispatched to the content function before it used a precompiled plan
+    signature = inspect.signature(slide.content)
+
+    kwargs: dict[str, object] = {}
+    if TRIGGERS in signature.parameters:
+        kwargs[TRIGGERS] = triggers
+
+    return slide.content(**kwargs)
+
+
+@pytest.mark.slow
+def test_render_dispatch_overhead(benchmark: Benchmark) -> None:
+    slide = Slide(content=content)
+    slide.compile()
+    triggers = Triggers.new()
+
+    before = benchmark(
+        "inspect_signature_per_frame",
+        lambda: render_by_inspecting_signature(slide, triggers),
+        number=NUMBER,
+    )
+    after = benchmark("call_plan_per_frame", lambda: slide.render(triggers=triggers), number=NUMBER)
+    benchmark("bare_call_per_frame", lambda: slide.content(triggers=triggers), number=NUMBER)
+
+    benchmark.record_property("dispatch_overhead_saved_seconds", before - after)
@@ -0,0 +1,26 @@
+import pytest
+from rich.console import Console
+from rich.text import Text
+
+from spiel.transitions.protocol import Direction
+from spiel.transitions.swipe import Swipe
+from tests.benchmarks.conftest import Benchmark
+
+NUMBER = 200
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("width, height", [(80, 24), (200, 60)])
+def test_swipe_frame(benchmark: Benchmark, console: Console, width: int, height: int) -> None:
+    options = console.options.update_dimensions(width, height)
+    from_lines = console.render_lines(Text("from " * width, style="red"), options, pad=True)
+    to_lines = console.render_lines(Text("to " * width, style="blue"), options, pad=True)
+    swipe = Swipe()
+
+    benchmark(
+        "composite",
+        lambda: swipe.composite(
+            from_lines, to_lines, direction=Direction.Next, progress=50, width=width
+        ),
+        number=NUMBER,
+    )
@@ -0,0 +1,24 @@
+import pytest
+
+from spiel import Triggers
+from tests.benchmarks.conftest import Benchmark
+
+NUMBER = 2_000
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("num_triggers", [1, 10, 100])
+def test_triggers_construction(benchmark: Benchmark, num_triggers: int) -> None:
+    times = tuple(float(t) for t in range(num_triggers))
+
+    benchmark("construct", lambda: Triggers(now=times[-1], _times=times), number=NUMBER)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("num_triggers", [1, 10, 100])
+def test_triggers_take(benchmark: Benchmark, num_triggers: int) -> None:
+    times = tuple(float(t) for t in range(num_triggers))
+    triggers = Triggers(now=times[-1], _times=times)
+    items = range(1000)
+
+    benchmark("take", lambda: list(triggers.take(items)), number=NUMBER)
@@ -0,0 +1,81 @@
+import json
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+from typer.testing import CliRunner
+
+from spiel.cli import cli
+from spiel.constants import DECK
+
+
+@pytest.fixture()
+def deck_file(empty_file: Path) -> Path:
+    empty_file.write_text(
+        dedent(
+            f"""\
+            from spiel import Deck, Slide
+
+            {DECK} = Deck(name="deck")
+            {DECK}.add_slides(Slide(), Slide())
+            """
+        )
+    )
+
+    return empty_file
+
+
+def test_bench(runner: CliRunner, deck_file: Path, tmp_path: Path) -> None:
+    save = tmp_path / "bench.json"
+
+    result = runner.invoke(
+        cli,
+        [
+            "bench",
+            str(deck_file),
+            "--size",
+            "80x24",
+            "--size",
+            "40x10",
+            "--iterations",
+            "2",
+            "--save",
+            str(save),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert len(json.loads(save.read_text())["results"]) == 4
+
+
+def test_bench_with_invalid_size(runner: CliRunner, deck_file: Path) -> None:
+    result = runner.invoke(cli, ["bench", str(deck_file), "--size", "big"])
+
+    assert result.exit_code == 2
+
+
+def test_bench_fails_on_regression(runner: CliRunner, deck_file: Path, tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            {
+                "results": [
+                    {
+                        "slide": 1,
+                        "title": "",
+                        "size": [80, 24],
+                        "step": 0,
+                        "min": 0,
+                        "p50": 0,
+                        "p99": 0,
+                        "output_bytes": 0,
+                        "failed": False,
+                    }
+                ]
+            }
+        )
+    )
+
+    result = runner.invoke(cli, ["bench", str(deck_file), "--baseline", str(baseline)])
+
+    assert result.exit_code == 1
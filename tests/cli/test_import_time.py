@@ -0,0 +1,54 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = {"textual", "PIL", "watchfiles"}
+
+
+def imported_modules(*args: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(re.findall(r"^import time:.*\|\s*(\S+)$", result.stderr, flags=re.MULTILINE))
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["version", "--plain"],
+        ["--help"],
+        ["present", "--help"],
+    ],
+)
+def test_quick_commands_do_not_import_heavy_modules(args: list[str]) -> None:
+    modules = imported_modules("-m", "spiel", *args)
+
+    assert "spiel.cli" in modules
+    assert not modules & HEAVY_MODULES
+
+
+def test_demo_copy_does_not_import_heavy_modules(tmp_path: Path) -> None:
+    modules = imported_modules("-m", "spiel", "demo", "copy", str(tmp_path / "demo"))
+
+    assert not modules & HEAVY_MODULES
+
+
+def test_importing_spiel_does_not_import_heavy_modules() -> None:
+    modules = imported_modules("-c", "import spiel")
+
+    assert not modules & HEAVY_MODULES
+
+
+def test_public_api_is_imported_on_use() -> None:
+    modules = imported_modules("-c", "import spiel; spiel.Deck")
+
+    # the module that Deck is defined in isn't reported,
+    # because -X importtime doesn't time importlib.import_module,
+    # but the modules it imports are
+    assert "spiel.slide" in modules
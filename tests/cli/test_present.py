@@ -18,3 +18,13 @@ def test_display_demo(runner: CliRunner, stdin: str) -> None:
     result = runner.invoke(cli, ["present", str(DEMO_FILE)], input=stdin)
 
     assert result.exit_code == 0
+
+
+def test_present_with_disk_cache(
+    runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    result = runner.invoke(cli, ["present", str(DEMO_FILE), "--disk-cache"], input="")
+
+    assert result.exit_code == 0
@@ -15,6 +15,16 @@ settings.register_profile("default", deadline=None)
 settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    # registered here rather than next to the benchmarks so that it is available from the repository root
+    parser.addoption(
+        "--benchmark-json",
+        type=Path,
+        default=None,
+        help="Write the results of the benchmarks in tests/benchmarks to this file as JSON.",
+    )
+
+
 @pytest.fixture()
 def runner() -> CliRunner:
     return CliRunner()
@@ -0,0 +1,191 @@
+import gc
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image as Img
+from pytest_mock import MockerFixture
+from rich.console import Console
+
+from spiel.renderables.animated import (
+    AnimatedImage,
+    _decoded_frames,
+    _forget_collected_images,
+    _frame_cache,
+    clear_caches,
+)
+from spiel.renderables.image import DerivedKey, ImageSize, _image_to_segments, image_cache
+from spiel.triggers import Triggers
+
+COLORS = ["red", "green", "blue"]
+
+
+@pytest.fixture()
+def gif(tmp_path: Path) -> Path:
+    path = tmp_path / "animation.gif"
+    first, *rest = (Img.new(mode="RGB", size=(40, 20), color=color) for color in COLORS)
+    first.save(path, save_all=True, append_images=rest, duration=[100, 200, 300], loop=0)
+    return path
+
+
+@pytest.fixture()
+def animation(gif: Path) -> AnimatedImage:
+    return AnimatedImage.from_file(gif)
+
+
+def triggers(elapsed: float) -> Triggers:
+    return Triggers(now=10 + elapsed, _times=(10,))
+
+
+def test_decodes_frames(animation: AnimatedImage) -> None:
+    assert animation.num_frames == 3
+    assert animation.duration == pytest.approx(0.6)
+    assert animation.img.tell() == 0
+
+
+@pytest.mark.parametrize(
+    ("elapsed", "index"),
+    [
+        (0, 0),
+        (0.05, 0),
+        (0.15, 1),
+        (0.25, 1),
+        (0.35, 2),
+        (0.55, 2),
+        (0.65, 0),
+        (1.45, 1),
+        (1.55, 2),
+    ],
+)
+def test_frame_index(animation: AnimatedImage, elapsed: float, index: int) -> None:
+    assert animation.frame(triggers(elapsed)).index == index
+
+
+def test_frame_index_before_start(animation: AnimatedImage) -> None:
+    assert animation.frame_index(-1) == 0
+
+
+def test_frame_index_without_loop(gif: Path) -> None:
+    animation = AnimatedImage.from_file(gif, loop=False)
+
+    assert animation.frame_index(0.65) == 2
+    assert animation.next_change(triggers(0.65)) is None
+
+
+@pytest.mark.parametrize(
+    ("elapsed", "next_change"),
+    [
+        (0, 10.1),
+        (0.15, 10.3),
+        (0.5, 10.6),
+        (0.65, 10.7),
+    ],
+)
+def test_next_change(animation: AnimatedImage, elapsed: float, next_change: float) -> None:
+    assert animation.next_change(triggers(elapsed)) == pytest.approx(next_change)
+
+
+def test_frames_are_rendered_once_per_size(
+    animation: AnimatedImage, console: Console, mocker: MockerFixture
+) -> None:
+    options = console.options.update(max_width=20, height=5)
+    convert = mocker.patch(
+        "spiel.renderables.animated._image_to_segments", wraps=_image_to_segments
+    )
+
+    lines = [console.render_lines(animation.frame(triggers(t)), options) for t in (0, 0.15, 0.35)]
+    assert convert.call_count == 3
+    assert len({str(line) for line in lines}) == 3
+
+    for t in (0.65, 0.75, 0.95, 0.05):
+        console.render_lines(animation.frame(triggers(t)), options)
+    assert convert.call_count == 3
+
+    console.render_lines(
+        animation.frame(triggers(0)), console.options.update(max_width=10, height=3)
+    )
+    assert convert.call_count == 4
+
+
+def test_frames_are_dropped_with_source_image(gif: Path, console: Console) -> None:
+    img = Img.open(gif)
+    image_id = id(img)
+    console.render_lines(AnimatedImage(img).frame(triggers(0)), console.options)
+
+    del img
+    gc.collect()
+    _forget_collected_images()
+
+    assert image_cache.derived(DerivedKey("frames", image_id)) is None
+    assert not any(key[0] == image_id for key in _frame_cache)
+
+
+def test_clear_caches_forgets_frame_segments(animation: AnimatedImage, console: Console) -> None:
+    console.render_lines(animation.frame(triggers(0)), console.options)
+
+    clear_caches()
+
+    assert not _frame_cache
+
+
+def test_frame_cache_is_bounded_by_bytes(
+    animation: AnimatedImage, console: Console, mocker: MockerFixture
+) -> None:
+    clear_caches()
+    options = console.options.update(max_width=10, height=3)
+    console.render_lines(animation.frame(triggers(0)), options)
+    frame_bytes = _frame_cache.bytes
+    assert frame_bytes > 0
+
+    # room for two frames, but not three
+    mocker.patch.object(_frame_cache, "max_bytes", 2 * frame_bytes)
+    for t in (0.15, 0.35):
+        console.render_lines(animation.frame(triggers(t)), options)
+
+    assert len(_frame_cache) == 2
+    assert _frame_cache.bytes == 2 * frame_bytes
+
+
+def test_decoding_frames_does_not_seek_shared_image(gif: Path, mocker: MockerFixture) -> None:
+    img = image_cache.load(gif)
+    seek = mocker.spy(img, "seek")
+
+    _, frames = _decoded_frames(img)
+
+    assert len(frames.images) == 3
+    assert seek.call_count == 0
+
+
+def test_decodes_frames_of_image_not_loaded_from_a_file(gif: Path) -> None:
+    img = Img.open(BytesIO(gif.read_bytes()))
+
+    _, frames = _decoded_frames(img)
+
+    assert len(frames.images) == 3
+    assert img.tell() == 0
+
+
+def test_frames_are_shrunk_to_fit_terminal(gif: Path, mocker: MockerFixture) -> None:
+    mocker.patch("spiel.renderables.animated._terminal_pixels", return_value=ImageSize(10, 10))
+    img = Img.open(gif)
+
+    _, frames = _decoded_frames(img)
+    assert {frame.size for frame in frames.images} == {(10, 5)}
+    assert image_cache.derived(DerivedKey("frames", id(img))) is frames
+
+    # decoded again if they're displayed larger than the terminal
+    _, larger = _decoded_frames(img, ImageSize(20, 10))
+    assert {frame.size for frame in larger.images} == {(20, 10)}
+    assert _decoded_frames(img, ImageSize(20, 10))[1] is larger
+
+
+def test_frames_count_towards_image_cache_memory(gif: Path) -> None:
+    # drop the frames of images from other tests first
+    gc.collect()
+    _forget_collected_images()
+    img = Img.open(gif)
+    before = image_cache.stats().bytes
+
+    _decoded_frames(img, ImageSize(40, 20))
+
+    assert image_cache.stats().bytes - before == 3 * 40 * 20 * 4
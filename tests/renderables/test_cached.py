@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from io import StringIO
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.markdown import Markdown
+from rich.segment import Segment
+
+from spiel import quality
+from spiel.renderables.cached import CachedRenderable, RenderedLines
+
+
+def test_cached_renderable_renders_like_the_original(console: Console, output: StringIO) -> None:
+    renderable = Markdown("# Title\n\nSome *text* here.")
+
+    console.print(renderable)
+    expected = output.getvalue()
+    output.truncate(0)
+    output.seek(0)
+
+    console.print(CachedRenderable(renderable))
+
+    assert output.getvalue() == expected
+
+
+def test_cached_renderable_only_lays_out_once_per_size(console: Console) -> None:
+    cached = CachedRenderable(Markdown("# Title"))
+
+    options = console.options.update_dimensions(40, 10)
+    first = cached.lines(console, options)
+    second = cached.lines(console, options)
+
+    assert first is second
+
+    cached.lines(console, console.options.update_dimensions(50, 10))
+
+    assert len(cached._lines) == 2
+
+
+def test_rendered_lines_renders_like_the_original(console: Console, output: StringIO) -> None:
+    renderable = Markdown("# Title\n\nSome *text* here.")
+
+    console.print(renderable)
+    expected = output.getvalue()
+    output.truncate(0)
+    output.seek(0)
+
+    console.print(RenderedLines(console.render_lines(renderable, pad=False)))
+
+    assert output.getvalue() == expected
+
+
+def test_cached_renderable_does_not_cache_lines_while_settling(console: Console) -> None:
+    cached = CachedRenderable(Markdown("# Title"))
+    options = console.options.update_dimensions(40, 10)
+
+    quality.set_settling(True)
+    try:
+        first = cached.lines(console, options)
+        second = cached.lines(console, options)
+    finally:
+        quality.set_settling(False)
+
+    assert first == second
+    assert first is not second
+    assert cached.lines(console, options) is cached.lines(console, options)
+
+
+@dataclass(frozen=True)
+class Placeholder:
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        quality.rendered_placeholder()
+        yield Segment("...")
+
+
+def test_cached_renderable_does_not_cache_placeholders(console: Console) -> None:
+    cached = CachedRenderable(Placeholder())
+    options = console.options.update_dimensions(40, 10)
+
+    assert cached.lines(console, options) is not cached.lines(console, options)
@@ -1,9 +1,48 @@
+import gc
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from io import StringIO
+from pathlib import Path
+from typing import Any, Literal, TypeVar, cast
+
+import hypothesis.strategies as st
 import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, sampled_from, tuples
 from PIL import Image as Img
+from PIL.Image import Resampling
+from pytest_mock import MockerFixture
+from rich.color import Color, ColorSystem
 from rich.console import Console
+from rich.segment import Segment
+from rich.style import Style
 
+from spiel import background, disk_cache, quality
+from spiel.background import Workers
 from spiel.constants import DEMO_DIR
-from spiel.renderables.image import Image, ImageSize
+from spiel.disk_cache import DiskCache
+from spiel.quality import Quality
+from spiel.renderables.image import (
+    DerivedKey,
+    Image,
+    ImageCache,
+    ImageCacheStats,
+    ImageSize,
+    _array_to_segments,
+    _decode_segments,
+    _encode_segments,
+    _forget_collected_images,
+    _image_to_segments,
+    _image_to_segments_python,
+    _pyramid_level,
+    _quantize,
+    _segment_cache,
+    _segment_cache_lock,
+    clear_caches,
+    image_cache,
+)
 
 
 @pytest.fixture()
@@ -39,3 +78,625 @@ def test_render_image_from_file(console: Console) -> None:
     image = Image.from_file(DEMO_DIR / "tree.jpg")
 
     console.print(image)
+
+
+pixel = tuples(integers(0, 255), integers(0, 255), integers(0, 255))
+
+
+def from_pixels(
+    pixels: list[tuple[int, int, int]], size: ImageSize, mode: str = "RGB"
+) -> Img.Image:
+    img = Img.new(mode="RGB", size=size)
+    img.putdata(pixels)
+    return img.convert(mode)
+
+
+@st.composite
+def images(draw: st.DrawFn) -> Img.Image:
+    width = draw(integers(1, 8))
+    height = draw(integers(1, 8))
+    # a small palette, so that there are runs of identical pixels
+    palette = draw(lists(pixel, min_size=1, max_size=3))
+    pixels = draw(lists(sampled_from(palette), min_size=width * height, max_size=width * height))
+    return from_pixels(pixels, ImageSize(width, height), mode=draw(sampled_from(["RGB", "RGBA"])))
+
+
+@given(img=images(), color_system=sampled_from([None, ColorSystem.STANDARD, ColorSystem.EIGHT_BIT]))
+def test_vectorized_image_to_segments_matches_python(
+    img: Img.Image, color_system: ColorSystem | None
+) -> None:
+    np = pytest.importorskip("numpy")
+
+    assert _array_to_segments(np.asarray(img), color_system) == _image_to_segments_python(
+        img, color_system
+    )
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA"])
+def test_image_to_segments_without_numpy(mocker: MockerFixture, mode: str) -> None:
+    mocker.patch("spiel.renderables.image.HAS_NUMPY", False)
+
+    img = from_pixels(
+        [(255, 0, 0), (255, 0, 0), (0, 0, 255), (0, 0, 255)], ImageSize(2, 2), mode=mode
+    )
+
+    assert _image_to_segments(img) == [
+        Segment(
+            "▀▀",
+            Style.from_color(color=Color.from_rgb(255, 0, 0), bgcolor=Color.from_rgb(0, 0, 255)),
+        ),
+        Segment.line(),
+    ]
+
+
+def test_rendering_at_same_size_reuses_segments(
+    image: Image, console: Console, mocker: MockerFixture
+) -> None:
+    resize = mocker.spy(Image, "_resize")
+    options = console.options.update(max_width=40, height=10)
+
+    first = console.render_lines(image, options)
+    second = console.render_lines(image, options)
+
+    assert first == second
+    assert resize.call_count == 1
+
+    console.render_lines(image, console.options.update(max_width=20, height=5))
+
+    assert resize.call_count == 2
+
+
+def test_images_with_same_source_share_segments(
+    image: Image, console: Console, mocker: MockerFixture
+) -> None:
+    resize = mocker.spy(Image, "_resize")
+
+    console.render_lines(image)
+    console.render_lines(Image(img=image.img))
+
+    assert resize.call_count == 1
+
+
+def test_cached_segments_are_dropped_with_source_image(console: Console) -> None:
+    image = Image(Img.new(mode="RGB", size=ImageSize(10, 10)))
+    image_id = id(image.img)
+    console.render_lines(image)
+
+    assert any(key[0] == image_id for key in _segment_cache)
+
+    del image
+    gc.collect()
+    _forget_collected_images()
+
+    assert not any(key[0] == image_id for key in _segment_cache)
+
+
+def test_image_collected_while_cache_is_locked_does_not_deadlock(console: Console) -> None:
+    image = Image(Img.new(mode="RGB", size=ImageSize(10, 10)))
+    image_id = id(image.img)
+    console.render_lines(image)
+
+    # images in reference cycles (e.g., in the globals of a reloaded deck's module)
+    # are only collected by the cyclic garbage collector, which can run at any time
+    cycle: list[object] = [image]
+    cycle.append(cycle)
+    del image, cycle
+
+    with _segment_cache_lock:
+        gc.collect()
+
+    _forget_collected_images()
+
+    assert not any(key[0] == image_id for key in _segment_cache)
+
+
+def test_segment_cache_is_bounded(console: Console, mocker: MockerFixture) -> None:
+    mocker.patch("spiel.renderables.image.SEGMENT_CACHE_SIZE", 2)
+    image = Image(Img.new(mode="RGB", size=ImageSize(10, 10)))
+
+    for width in range(1, 6):
+        console.render_lines(image, console.options.update(max_width=width))
+
+    assert len(_segment_cache) <= 2
+
+
+def test_clear_caches_renders_again(console: Console, mocker: MockerFixture) -> None:
+    image = Image(Img.new(mode="RGB", size=ImageSize(10, 10)))
+    console.render_lines(image)
+    resize = mocker.spy(Image, "_resize")
+
+    clear_caches()
+    console.render_lines(image)
+
+    assert resize.call_count == 1
+
+
+@pytest.mark.parametrize("mode", ["L", "P", "RGBA"])
+def test_render_image_in_other_modes(console: Console, mode: str) -> None:
+    console.print(Image(Img.new(mode=mode, size=ImageSize(10, 10))))
+
+
+def pyramid(img: Img.Image) -> tuple[Img.Image, ...] | None:
+    return cast(tuple[Img.Image, ...] | None, image_cache.derived(DerivedKey("pyramid", id(img))))
+
+
+@pytest.fixture()
+def large_image() -> Image:
+    return Image(Img.new(mode="RGB", size=ImageSize(512, 256)))
+
+
+def test_pyramid_levels_are_built_as_needed(large_image: Image) -> None:
+    level = _pyramid_level(large_image.img, ImageSize(40, 20))
+
+    levels = pyramid(large_image.img)
+    assert level.size == (128, 64)
+    assert levels is not None
+    assert [lvl.size for lvl in levels] == [(256, 128), (128, 64)]
+
+    assert _pyramid_level(large_image.img, ImageSize(200, 100)) is large_image.img
+    assert _pyramid_level(large_image.img, ImageSize(70, 35)) is levels[0]
+
+
+def test_pyramid_counts_towards_image_cache_memory(large_image: Image) -> None:
+    # drop the pyramids of images from other tests first
+    gc.collect()
+    _forget_collected_images()
+    before = image_cache.stats().bytes
+
+    _pyramid_level(large_image.img, ImageSize(40, 20))
+
+    assert image_cache.stats().bytes - before == (256 * 128 + 128 * 64) * 4
+
+
+def test_pyramid_is_rebuilt_after_eviction(large_image: Image) -> None:
+    _pyramid_level(large_image.img, ImageSize(40, 20))
+    image_cache.forget(DerivedKey("pyramid", id(large_image.img)))
+
+    assert pyramid(large_image.img) is None
+    assert _pyramid_level(large_image.img, ImageSize(40, 20)).size == (128, 64)
+
+
+def test_pyramid_is_not_built_for_palette_images() -> None:
+    img = Img.new(mode="P", size=ImageSize(512, 512))
+
+    assert _pyramid_level(img, ImageSize(10, 10)) is img
+
+
+def test_pyramid_is_dropped_with_source_image() -> None:
+    img = Img.new(mode="RGB", size=ImageSize(512, 256))
+    image_id = id(img)
+    _pyramid_level(img, ImageSize(10, 10))
+
+    del img
+    gc.collect()
+    _forget_collected_images()
+
+    assert image_cache.derived(DerivedKey("pyramid", image_id)) is None
+
+
+@pytest.mark.parametrize(
+    ("settling", "resample"),
+    [
+        (False, Resampling.LANCZOS),
+        (True, Resampling.BILINEAR),
+    ],
+)
+def test_resample_filter_depends_on_quality(
+    large_image: Image,
+    console: Console,
+    mocker: MockerFixture,
+    settling: bool,
+    resample: Resampling,
+) -> None:
+    resize = mocker.spy(Image, "_resize")
+
+    quality.set_settling(settling)
+    try:
+        console.render_lines(large_image, console.options.update(max_width=30))
+    finally:
+        quality.set_settling(False)
+
+    assert resize.call_args.args[-1] is resample
+
+
+def test_preview_uses_full_quality_render_if_available(
+    large_image: Image, console: Console, mocker: MockerFixture
+) -> None:
+    resize = mocker.spy(Image, "_resize")
+    options = console.options.update(max_width=30)
+
+    full = console.render_lines(large_image, options)
+    with quality.rendering_at(Quality.Preview):
+        preview = console.render_lines(large_image, options)
+
+    assert full == preview
+    assert resize.call_count == 1
+
+
+def save_image(path: Path, size: ImageSize, color: str = "red") -> Path:
+    Img.new(mode="RGB", size=size, color=color).save(path)
+    return path
+
+
+def test_image_cache_reuses_loaded_image(tmp_path: Path) -> None:
+    cache = ImageCache()
+    path = save_image(tmp_path / "image.png", ImageSize(10, 10))
+
+    first = cache.load(path)
+    second = cache.load(tmp_path / "." / "image.png")
+
+    assert first is second
+    assert cache.stats() == ImageCacheStats(
+        hits=1,
+        misses=1,
+        evictions=0,
+        images=1,
+        derived=0,
+        bytes=10 * 10 * 4,
+        max_bytes=cache.max_bytes,
+    )
+
+
+def test_image_cache_reloads_changed_file(tmp_path: Path) -> None:
+    cache = ImageCache()
+    path = save_image(tmp_path / "image.png", ImageSize(10, 10))
+
+    first = cache.load(path)
+    save_image(path, ImageSize(20, 10), color="blue")
+    second = cache.load(path)
+
+    assert second is not first
+    assert second.size == (20, 10)
+    assert cache.stats().images == 1
+    assert cache.stats().bytes == 20 * 10 * 4
+
+
+def test_image_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = ImageCache(max_bytes=2 * 10 * 10 * 4)
+    a, b, c = (save_image(tmp_path / f"{name}.png", ImageSize(10, 10)) for name in "abc")
+
+    cache.load(a)
+    cache.load(b)
+    cache.load(a)
+    cache.load(c)
+
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.images == 2
+    assert stats.bytes <= cache.max_bytes
+
+    cache.load(a)
+    assert cache.stats().hits == 2
+
+    cache.load(b)
+    assert cache.stats().misses == 4
+
+
+def test_image_cache_does_not_cache_images_larger_than_limit(tmp_path: Path) -> None:
+    cache = ImageCache(max_bytes=100)
+    path = save_image(tmp_path / "image.png", ImageSize(10, 10))
+
+    assert cache.load(path).size == (10, 10)
+    assert cache.stats().images == 0
+
+
+def test_image_cache_clear(tmp_path: Path) -> None:
+    cache = ImageCache()
+    cache.load(save_image(tmp_path / "image.png", ImageSize(10, 10)))
+
+    cache.clear()
+
+    assert cache.stats().images == 0
+    assert cache.stats().bytes == 0
+
+
+def test_from_file_uses_image_cache(tmp_path: Path) -> None:
+    path = save_image(tmp_path / "image.png", ImageSize(10, 10))
+
+    assert Image.from_file(path).img is Image.from_file(path).img
+
+
+@pytest.fixture()
+def gradient() -> Img.Image:
+    gradient = Img.linear_gradient("L").resize((64, 64))
+    return Img.merge("RGB", (gradient, gradient.rotate(90), gradient.rotate(180)))
+
+
+@pytest.mark.parametrize("dither", [False, True])
+def test_quantize_reduces_to_palette(gradient: Img.Image, dither: bool) -> None:
+    quantized = _quantize(gradient, colors=8, dither=dither)
+
+    assert quantized.mode == "RGB"
+    assert quantized.size == gradient.size
+    assert len(quantized.getcolors() or []) <= 8
+
+
+def test_dithering_uses_same_palette(gradient: Img.Image) -> None:
+    plain = _quantize(gradient, colors=8, dither=False)
+    dithered = _quantize(gradient, colors=8, dither=True)
+
+    assert plain.tobytes() != dithered.tobytes()
+    assert {color for _, color in dithered.getcolors() or []} <= {
+        color for _, color in plain.getcolors() or []
+    }
+
+
+def print_to(image: Image, color_system: Literal["truecolor", "256"]) -> str:
+    console = Console(
+        file=StringIO(),
+        width=80,
+        height=24,
+        color_system=color_system,
+        force_terminal=True,
+        legacy_windows=False,
+    )
+    with console.capture() as capture:
+        console.print(image)
+    return capture.get()
+
+
+def test_palette_reduces_output(gradient: Img.Image) -> None:
+    assert len(print_to(Image(gradient, colors=8), "truecolor")) < len(
+        print_to(Image(gradient), "truecolor")
+    )
+
+
+def test_colors_are_converted_for_256_color_terminals(gradient: Img.Image) -> None:
+    image = Image(gradient)
+
+    truecolor = print_to(image, "truecolor")
+    eight_bit = print_to(image, "256")
+
+    assert "38;2;" in truecolor
+    assert "38;2;" not in eight_bit
+    assert "38;5;" in eight_bit
+    assert len(eight_bit) < len(truecolor)
+
+
+@pytest.mark.parametrize("color_system", [None, ColorSystem.STANDARD, ColorSystem.EIGHT_BIT])
+def test_neighbouring_cells_with_same_downgraded_color_are_merged(
+    color_system: ColorSystem | None,
+) -> None:
+    img = from_pixels([(255, 0, 0), (254, 0, 0)], ImageSize(2, 1))
+
+    segments = _image_to_segments(img, color_system)
+
+    assert len(segments) == (3 if color_system is None else 2)
+
+
+def test_pair_styles_are_interned() -> None:
+    img = from_pixels([(255, 0, 0), (0, 0, 255), (0, 0, 255), (255, 0, 0)], ImageSize(2, 2))
+
+    left, right, _ = _image_to_segments(img)
+
+    assert left.style is _image_to_segments(img)[0].style
+    assert right.style is not left.style
+
+
+@pytest.fixture()
+def photo(tmp_path: Path, gradient: Img.Image) -> Path:
+    path = tmp_path / "photo.jpg"
+    gradient.resize((1600, 1200)).save(path)
+    return path
+
+
+def test_image_cache_decodes_jpeg_at_reduced_scale(photo: Path) -> None:
+    cache = ImageCache()
+
+    loaded = cache.decode(photo, ImageSize(100, 100))
+
+    assert loaded.img.size == (200, 150)
+    assert loaded.full_size == (1600, 1200)
+
+
+def test_image_cache_decodes_again_only_for_larger_size(photo: Path) -> None:
+    cache = ImageCache()
+
+    small = cache.decode(photo, ImageSize(100, 100))
+    large = cache.decode(photo, ImageSize(400, 300))
+
+    assert large.img.size == (400, 300)
+    assert cache.decode(photo, ImageSize(100, 100)) is large
+    assert cache.load(photo).size == (1600, 1200)
+    assert cache.decode(photo, ImageSize(400, 300)).img.size == (1600, 1200)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.images) == (2, 3, 1)
+    assert small.img.size == (200, 150)
+
+
+def test_from_file_decodes_at_terminal_size(photo: Path, mocker: MockerFixture) -> None:
+    mocker.patch("spiel.renderables.image._terminal_pixels", return_value=ImageSize(80, 48))
+
+    image = Image.from_file(photo)
+
+    assert image.img.size == (200, 150)
+    assert image._determine_size(Console().options.update(max_width=400, height=None)) == (
+        400,
+        300,
+    )
+
+
+def test_from_file_decodes_again_to_render_larger(
+    photo: Path, console: Console, mocker: MockerFixture
+) -> None:
+    mocker.patch("spiel.renderables.image._terminal_pixels", return_value=ImageSize(80, 48))
+    image = Image.from_file(photo)
+    resize = mocker.spy(Img.Image, "resize")
+
+    console.render_lines(image, console.options.update(max_width=100, height=50))
+    assert resize.call_args.args[0].size == (200, 150)
+
+    console.render_lines(image, console.options.update(max_width=400, height=150))
+    assert resize.call_args.args[0].size == (400, 300)
+
+
+@pytest.mark.parametrize("color_system", [None, ColorSystem.STANDARD, ColorSystem.EIGHT_BIT])
+def test_encode_and_decode_segments(gradient: Img.Image, color_system: ColorSystem | None) -> None:
+    segments = _image_to_segments(gradient.resize((16, 9)), color_system)
+
+    assert _decode_segments(_encode_segments(segments, color_system), color_system) == segments
+
+
+def test_disk_cache_is_used_across_presentations(
+    photo: Path, tmp_path: Path, console: Console, mocker: MockerFixture
+) -> None:
+    options = console.options.update(max_width=40, height=10)
+    resize = mocker.spy(Image, "_resize")
+
+    with disk_cache.caching(DiskCache(tmp_path / "cache")):
+        first = console.render_lines(Image.from_file(photo), options)
+        assert resize.call_count == 1
+
+        # as if Spiel was started again
+        clear_caches()
+        image_cache.clear()
+
+        second = console.render_lines(Image.from_file(photo), options)
+        assert resize.call_count == 1
+
+    assert first == second
+
+
+def test_disk_cache_hit_does_not_decode_image(
+    photo: Path, tmp_path: Path, console: Console, mocker: MockerFixture
+) -> None:
+    options = console.options.update(max_width=40, height=10)
+
+    with disk_cache.caching(DiskCache(tmp_path / "cache")):
+        console.render_lines(Image.from_file(photo), options)
+
+        # as if Spiel was started again
+        clear_caches()
+        image_cache.clear()
+        decode = mocker.spy(image_cache, "decode")
+
+        image = Image.from_file(photo)
+        assert image.img.size == (1600, 1200)
+        console.render_lines(image, options)
+
+    assert decode.call_count == 0
+
+
+def test_disk_cache_does_not_store_previews(photo: Path, tmp_path: Path, console: Console) -> None:
+    cache = DiskCache(tmp_path / "cache")
+
+    with disk_cache.caching(cache), quality.rendering_at(Quality.Preview):
+        console.render_lines(Image.from_file(photo), console.options.update(max_width=40))
+
+    assert not (tmp_path / "cache").exists()
+
+
+def test_disk_cache_is_not_used_without_source_file(
+    gradient: Img.Image, tmp_path: Path, console: Console
+) -> None:
+    with disk_cache.caching(DiskCache(tmp_path / "cache")):
+        console.render_lines(Image(gradient), console.options.update(max_width=40))
+
+    assert not (tmp_path / "cache").exists()
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class FakeExecutor(Executor):
+    """Doesn't run anything, so that the tests decide when (and how) work finishes."""
+
+    futures: list[Future[Any]] = field(default_factory=list)
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        future: Future[T] = Future()
+        self.futures.append(future)
+        return future
+
+
+@pytest.fixture()
+def workers() -> Iterator[Workers]:
+    with background.working(Workers(executor=FakeExecutor(), on_ready=lambda: None)) as w:
+        yield w
+
+
+def test_from_file_in_background_does_not_decode(photo: Path, mocker: MockerFixture) -> None:
+    decode = mocker.spy(image_cache, "decode")
+
+    image = Image.from_file(photo, background=True)
+
+    assert decode.call_count == 0
+    assert image.img.size == (1600, 1200)
+    assert image._determine_size(Console().options.update(max_width=400, height=None)) == (
+        400,
+        300,
+    )
+
+
+def test_background_image_without_workers_renders_right_away(photo: Path, console: Console) -> None:
+    options = console.options.update(max_width=40, height=10)
+
+    assert console.render_lines(Image.from_file(photo, background=True), options) == (
+        console.render_lines(Image.from_file(photo), options)
+    )
+
+
+def test_background_image_renders_placeholder_until_ready(photo: Path, console: Console) -> None:
+    options = console.options.update(max_width=40, height=10)
+    ready = threading.Event()
+
+    with (
+        ThreadPoolExecutor(max_workers=1) as executor,
+        background.working(Workers(executor=executor, on_ready=ready.set)),
+    ):
+        image = Image.from_file(photo, background=True)
+        placeholders = quality.placeholders_rendered()
+
+        placeholder = console.render_lines(image, options)
+
+        assert quality.placeholders_rendered() == placeholders + 1
+        assert len(placeholder) == 10
+        assert "Rendering..." in "".join(segment.text for line in placeholder for segment in line)
+
+        assert ready.wait(timeout=10)
+
+        lines = console.render_lines(image, options)
+
+    assert lines == console.render_lines(Image.from_file(photo), options)
+
+
+def test_background_render_is_started_once(photo: Path, console: Console, workers: Workers) -> None:
+    image = Image.from_file(photo, background=True)
+    assert isinstance(workers.executor, FakeExecutor)
+    workers.executor.futures.clear()  # the image started decoding when it was loaded
+
+    console.render_lines(image, console.options.update(max_width=40))
+    console.render_lines(image, console.options.update(max_width=40))
+
+    assert len(workers.executor.futures) == 1
+
+
+def test_background_render_failure_is_raised_on_next_render(
+    photo: Path, console: Console, workers: Workers
+) -> None:
+    image = Image.from_file(photo, background=True)
+    assert isinstance(workers.executor, FakeExecutor)
+    options = console.options.update(max_width=40)
+
+    console.render_lines(image, options)
+    workers.executor.futures[-1].set_exception(ZeroDivisionError())
+
+    with pytest.raises(ZeroDivisionError):
+        console.render_lines(image, options)
+
+    # tries again
+    console.render_lines(image, options)
+
+
+def test_background_image_renders_right_away_in_other_threads(
+    photo: Path, console: Console, workers: Workers
+) -> None:
+    image = Image.from_file(photo, background=True)
+    options = console.options.update(max_width=40, height=10)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        lines = executor.submit(console.render_lines, image, options).result()
+
+    assert lines == console.render_lines(Image.from_file(photo), options)
@@ -0,0 +1,75 @@
+import pytest
+from rich.color import Color
+from rich.console import Console
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+
+from spiel.renderables.miniature import Miniature, _blocks, downsample
+
+RED = Style(bgcolor=Color.from_rgb(200, 0, 0))
+BLUE = Style(bgcolor=Color.from_rgb(0, 0, 200))
+
+
+@pytest.mark.parametrize(
+    ("source", "target", "expected"),
+    [
+        (4, 2, [(0, 2), (2, 4)]),
+        (5, 2, [(0, 2), (2, 5)]),
+        (2, 4, [(0, 1), (0, 1), (1, 2), (1, 2)]),
+    ],
+)
+def test_blocks(source: int, target: int, expected: list[tuple[int, int]]) -> None:
+    assert [(block.start, block.stop) for block in _blocks(source, target)] == expected
+
+
+def test_downsample_has_requested_size() -> None:
+    lines = [[Segment("hello world")] for _ in range(10)]
+
+    miniature = downsample(lines, (20, 10), width=5, height=3)
+
+    assert len(miniature) == 3
+    assert all(Segment.get_line_length(line) == 5 for line in miniature)
+
+
+def test_downsample_averages_colors() -> None:
+    lines = [[Segment("  ", RED), Segment("  ", BLUE)]]
+
+    (line,) = downsample(lines, (4, 1), width=1, height=1)
+    (segment,) = line
+
+    assert segment.style is not None
+    assert segment.style.color == Color.from_rgb(100, 0, 100)
+    assert segment.style.bgcolor == Color.from_rgb(100, 0, 100)
+
+
+def test_downsample_keeps_halves_of_half_blocks() -> None:
+    lines = [[Segment("▀", Style(color="#ff0000", bgcolor="#0000ff"))]]
+
+    (line,) = downsample(lines, (1, 1), width=1, height=1)
+    (segment,) = line
+
+    assert segment.style is not None
+    assert segment.style.color == Color.from_rgb(255, 0, 0)
+    assert segment.style.bgcolor == Color.from_rgb(0, 0, 255)
+
+
+def test_downsample_merges_runs_of_the_same_color() -> None:
+    lines = [[Segment("    ", RED)]]
+
+    (line,) = downsample(lines, (4, 1), width=4, height=1)
+
+    assert line == [Segment("▀▀▀▀", line[0].style)]
+
+
+def test_miniature_fills_available_space(console: Console) -> None:
+    lines = console.render_lines(
+        Text("some text\n" * 10), console.options.update_dimensions(40, 10)
+    )
+
+    rendered = console.render_lines(
+        Miniature(lines=lines, size=(40, 10)), console.options.update_dimensions(8, 2)
+    )
+
+    assert len(rendered) == 2
+    assert all(Segment.get_line_length(line) == 8 for line in rendered)
@@ -1,7 +1,12 @@
+from time import monotonic
+from typing import cast
+
 import pytest
 
+from spiel import background, quality
 from spiel.app import SpielApp
 from spiel.constants import DEMO_FILE
+from spiel.quality import Quality
 
 
 @pytest.fixture()
@@ -20,3 +25,76 @@ async def test_advance_through_demo_slides(app: SpielApp) -> None:
         await pilot.press(*keys)
 
         assert app.current_slide_idx == len(app.deck) - 1
+
+
+@pytest.mark.parametrize(
+    ("idle_timeout", "seconds_since_activity", "expected"),
+    [
+        (None, 1000, False),
+        (10, 5, False),
+        (10, 15, True),
+    ],
+)
+def test_idle(idle_timeout: float | None, seconds_since_activity: float, expected: bool) -> None:
+    app = SpielApp(deck_path=DEMO_FILE, idle_timeout=idle_timeout)
+    app.last_activity = monotonic() - seconds_since_activity
+
+    assert app.idle is expected
+
+
+async def test_browse_deck_view(app: SpielApp) -> None:
+    async with app.run_test() as pilot:
+        assert not app.deck_miniatures
+
+        await pilot.press("d", "right", "down", "m", "left")
+
+        assert app.current_slide_idx == 0 + 1 + app.deck_grid_width - 1
+        assert app.deck_miniatures
+
+
+async def test_toggle_performance_overlay(app: SpielApp) -> None:
+    async with app.run_test() as pilot:
+        await pilot.press("f")
+
+        assert app.show_performance
+        assert app.output is not None
+        assert cast(object, app.console.file) is app.output
+
+        await pilot.press("f")
+
+        assert not app.show_performance
+
+
+async def test_settles_after_resize(app: SpielApp) -> None:
+    async with app.run_test() as pilot:
+        app.settle_later(delay=0.05)
+
+        assert quality.current() is Quality.Preview
+
+        await pilot.pause(0.2)
+
+        assert quality.current() is Quality.Full
+
+
+async def test_settling_does_not_outlive_app(app: SpielApp) -> None:
+    async with app.run_test():
+        app.settle_later(delay=10)
+
+    assert not quality.settling()
+
+
+async def test_background_workers_do_not_outlive_app(app: SpielApp) -> None:
+    async with app.run_test():
+        workers = background.installed()
+        assert workers is not None
+        assert workers.executor is app.image_executor
+
+    assert background.installed() is None
+
+
+async def test_executors_are_shut_down_when_app_exits(app: SpielApp) -> None:
+    async with app.run_test():
+        pass
+
+    with pytest.raises(RuntimeError):
+        app.image_executor.submit(print)
@@ -0,0 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from spiel import background
+from spiel.background import Workers
+
+
+def test_should_defer_only_on_installing_thread() -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        workers = Workers(executor=executor, on_ready=lambda: None)
+
+        assert workers.should_defer()
+        assert not executor.submit(workers.should_defer).result()
+
+
+def test_working_restores_previous_workers() -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert background.installed() is None
+
+        with background.working(Workers(executor=executor, on_ready=lambda: None)) as outer:
+            with background.working(Workers(executor=executor, on_ready=lambda: None)):
+                pass
+            assert background.installed() is outer
+
+        assert background.installed() is None
@@ -0,0 +1,155 @@
+from pathlib import Path
+
+import pytest
+from PIL import Image as Img
+from pytest_mock import MockerFixture
+
+from spiel import Deck, Slide, Triggers
+from spiel.bench import (
+    Result,
+    bench_deck,
+    find_regressions,
+    load_results,
+    parse_size,
+    percentile,
+    save_results,
+    trigger_steps,
+)
+from spiel.renderables.image import Image, _image_to_segments
+
+
+def result(p50: float, failed: bool = False) -> Result:
+    return Result(
+        slide=1,
+        title="",
+        size=(80, 24),
+        step=0,
+        min=p50,
+        p50=p50,
+        p99=p50,
+        output_bytes=100,
+        failed=failed,
+    )
+
+
+@pytest.mark.parametrize(
+    "q, expected",
+    [
+        (0, 1),
+        (50, 5),
+        (99, 10),
+        (100, 10),
+    ],
+)
+def test_percentile(q: float, expected: float) -> None:
+    assert percentile(list(range(10, 0, -1)), q) == expected
+
+
+@pytest.mark.parametrize(
+    "size, expected",
+    [
+        ("80x24", (80, 24)),
+        ("120X40", (120, 40)),
+    ],
+)
+def test_parse_size(size: str, expected: tuple[int, int]) -> None:
+    assert parse_size(size) == expected
+
+
+@pytest.mark.parametrize("size", ["80", "80x", "x24", "80x24x1", "0x24", "foo"])
+def test_parse_invalid_size(size: str) -> None:
+    with pytest.raises(ValueError):
+        parse_size(size)
+
+
+def test_trigger_steps_for_static_slide() -> None:
+    assert [step for step, _ in trigger_steps(Slide(), steps=3)] == [0]
+
+
+def test_trigger_steps_for_triggered_slide() -> None:
+    def content(triggers: Triggers) -> str:
+        return str(len(triggers))
+
+    steps = list(trigger_steps(Slide(content=content), steps=2))
+
+    assert [(step, len(triggers)) for step, triggers in steps] == [(0, 1), (1, 2), (2, 3)]
+
+
+def test_bench_deck(three_slide_deck: Deck) -> None:
+    results = bench_deck(three_slide_deck, sizes=[(80, 24), (40, 10)], iterations=3)
+
+    assert [(r.slide, r.size) for r in results] == [
+        (1, (80, 24)),
+        (1, (40, 10)),
+        (2, (80, 24)),
+        (2, (40, 10)),
+        (3, (80, 24)),
+        (3, (40, 10)),
+    ]
+    assert all(0 <= r.min <= r.p50 <= r.p99 for r in results)
+    assert all(r.output_bytes > 0 and not r.failed for r in results)
+
+
+def test_bench_deck_calls_content_every_iteration() -> None:
+    calls: list[None] = []
+
+    def content() -> str:
+        calls.append(None)
+        return "foo"
+
+    deck = Deck(name="deck")
+    deck.add_slides(Slide(content=content))
+
+    bench_deck(deck, sizes=[(80, 24)], iterations=5)
+
+    assert len(calls) == 5
+
+
+def test_bench_deck_renders_images_every_iteration(mocker: MockerFixture) -> None:
+    convert = mocker.patch("spiel.renderables.image._image_to_segments", wraps=_image_to_segments)
+    image = Image(Img.new(mode="RGB", size=(100, 100)))
+
+    deck = Deck(name="deck")
+    deck.add_slides(Slide(content=lambda: image))
+
+    bench_deck(deck, sizes=[(80, 24)], iterations=3)
+
+    assert convert.call_count == 3
+
+
+def test_bench_deck_records_failures() -> None:
+    def content() -> str:
+        raise Exception("oops")
+
+    deck = Deck(name="deck")
+    deck.add_slides(Slide(content=content))
+
+    (r,) = bench_deck(deck, sizes=[(80, 24)], iterations=3)
+
+    assert r.failed
+
+
+def test_results_round_trip(tmp_path: Path) -> None:
+    results = [result(0.1), result(0.2, failed=True)]
+    path = tmp_path / "bench.json"
+
+    save_results(results, path)
+
+    assert load_results(path) == results
+
+
+@pytest.mark.parametrize(
+    "new, regressed",
+    [
+        (result(0.1), False),
+        (result(0.11), False),
+        (result(0.13), True),
+        (result(0, failed=True), True),
+    ],
+)
+def test_find_regressions(new: Result, regressed: bool) -> None:
+    assert bool(find_regressions([new], [result(0.1)], threshold=0.2)) is regressed
+
+
+def test_no_regression_without_baseline() -> None:
+    assert not find_regressions([result(1)], [result(0.1, failed=True)], threshold=0.2)
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import pytest
+
+from spiel import disk_cache
+from spiel.disk_cache import DiskCache, default_directory, file_digest
+
+
+def test_default_directory_uses_xdg_cache_home(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert default_directory() == tmp_path / "spiel"
+
+
+def test_default_directory_without_xdg_cache_home(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+
+    assert default_directory() == Path.home() / ".cache" / "spiel"
+
+
+def test_put_and_get(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path / "cache")
+
+    assert cache.get("key") is None
+
+    cache.put("key", b"data")
+
+    assert cache.get("key") == b"data"
+    assert DiskCache(tmp_path / "cache").get("key") == b"data"
+    assert cache.get("other") is None
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path)
+    cache.put("key", b"data")
+
+    (path,) = (p for p in tmp_path.rglob("*") if p.is_file())
+    path.write_bytes(b"garbage")
+
+    assert cache.get("key") is None
+
+
+def test_unwritable_directory_is_ignored(tmp_path: Path) -> None:
+    file = tmp_path / "file"
+    file.touch()
+    cache = DiskCache(file / "cache")
+
+    cache.put("key", b"data")
+
+    assert cache.get("key") is None
+
+
+def test_file_digest_changes_with_contents(tmp_path: Path) -> None:
+    path = tmp_path / "file"
+    path.write_bytes(b"a")
+    before = file_digest(path)
+
+    assert file_digest(path) == before
+
+    path.write_bytes(b"bb")
+
+    assert file_digest(path) != before
+
+
+def test_caching_restores_previous_cache(tmp_path: Path) -> None:
+    assert disk_cache.installed() is None
+
+    with disk_cache.caching(DiskCache(tmp_path)) as outer:
+        with disk_cache.caching(DiskCache(tmp_path / "inner")):
+            pass
+        assert disk_cache.installed() is outer
+
+    assert disk_cache.installed() is None
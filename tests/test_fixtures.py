@@ -0,0 +1,25 @@
+from rich.console import RenderableType
+from rich.text import Text
+
+from spiel.fixtures import CallPlan
+
+
+def no_fixtures() -> RenderableType:
+    return Text("none")
+
+
+def one_fixture(foo: int) -> RenderableType:
+    return Text(str(foo))
+
+
+def test_plan_only_includes_fixtures_in_signature() -> None:
+    plan = CallPlan.compile(one_fixture, fixtures=("foo", "bar"))
+
+    assert plan.fixtures == ("foo",)
+    assert plan.takes("foo")
+    assert not plan.takes("bar")
+
+
+def test_plan_passes_only_requested_fixtures() -> None:
+    assert CallPlan.compile(no_fixtures, fixtures=("foo",))(foo=1) == Text("none")
+    assert CallPlan.compile(one_fixture, fixtures=("foo",))(foo=1, bar=2) == Text("1")
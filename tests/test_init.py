@@ -0,0 +1,19 @@
+import pytest
+
+import spiel
+from spiel.constants import PACKAGE_NAME, _version
+
+
+@pytest.mark.parametrize("name", spiel.__all__)
+def test_public_api(name: str) -> None:
+    assert getattr(spiel, name) is not None
+    assert name in dir(spiel)
+
+
+def test_missing_attribute() -> None:
+    with pytest.raises(AttributeError):
+        spiel.foobar
+
+
+def test_version() -> None:
+    assert spiel.__version__ == _version(PACKAGE_NAME)
@@ -0,0 +1,108 @@
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from spiel import instrumentation
+from spiel.app import load_deck
+from spiel.cli import cli
+from spiel.constants import DEMO_FILE
+from spiel.instrumentation import Tracer
+
+
+def test_span_does_nothing_when_not_tracing() -> None:
+    with instrumentation.span("nothing"):
+        pass
+
+    instrumentation.record("nothing", start=instrumentation.now())
+
+
+def test_span_records_event() -> None:
+    with instrumentation.tracing(Tracer()) as tracer:
+        with instrumentation.span("work", "render", slide=2):
+            pass
+
+    (event,) = tracer.events
+    assert event.name == "work"
+    assert event.category == "render"
+    assert event.duration is not None and event.duration >= 0
+    assert event.args == {"slide": 2}
+
+
+def test_span_records_event_when_block_raises() -> None:
+    with instrumentation.tracing(Tracer()) as tracer:
+        with pytest.raises(ZeroDivisionError):
+            with instrumentation.span("work"):
+                1 / 0
+
+    assert [event.name for event in tracer.events] == ["work"]
+
+
+def test_record_instant_event() -> None:
+    with instrumentation.tracing(Tracer()) as tracer:
+        instrumentation.record("tick", start=instrumentation.now())
+
+    (event,) = tracer.events
+    assert event.duration is None
+
+
+def test_tracing_restores_previous_tracer() -> None:
+    with instrumentation.tracing(Tracer()) as outer:
+        with instrumentation.tracing(Tracer()) as inner:
+            instrumentation.record("inner", start=instrumentation.now())
+        instrumentation.record("outer", start=instrumentation.now())
+
+    assert [event.name for event in inner.events] == ["inner"]
+    assert [event.name for event in outer.events] == ["outer"]
+
+
+def test_to_chrome_trace() -> None:
+    tracer = Tracer()
+    tracer.record("span", "render", start=1, end=1.5, args={"path": Path("deck.py")})
+    tracer.record("instant", "transition", start=2)
+
+    trace = tracer.to_chrome_trace()
+    events = trace["traceEvents"]
+    assert isinstance(events, list)
+
+    metadata, span, instant = events
+    assert metadata["ph"] == "M"
+    assert span == {
+        "name": "span",
+        "cat": "render",
+        "ph": "X",
+        "ts": 1e6,
+        "dur": 0.5e6,
+        "pid": metadata["pid"],
+        "tid": metadata["tid"],
+        "args": {"path": "deck.py"},
+    }
+    assert instant["ph"] == "i"
+    assert "dur" not in instant
+
+
+def test_write_chrome_trace(tmp_path: Path) -> None:
+    tracer = Tracer()
+    tracer.record("span", "render", start=1, end=2)
+
+    path = tmp_path / "trace.json"
+    tracer.write_chrome_trace(path)
+
+    assert json.loads(path.read_text()) == tracer.to_chrome_trace()
+
+
+def test_load_deck_is_traced() -> None:
+    with instrumentation.tracing(Tracer()) as tracer:
+        load_deck(DEMO_FILE)
+
+    assert "load_deck" in {event.name for event in tracer.events}
+
+
+def test_present_with_trace(runner: CliRunner, tmp_path: Path) -> None:
+    path = tmp_path / "trace.json"
+
+    result = runner.invoke(cli, ["present", str(DEMO_FILE), "--trace", str(path)], input="")
+
+    assert result.exit_code == 0
+    assert "traceEvents" in json.loads(path.read_text())
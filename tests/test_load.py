@@ -39,3 +39,20 @@ def test_fails_to_load_not_deck(empty_file: Path) -> None:
 
     with pytest.raises(NoDeckFound):
         load_deck(empty_file)
+
+
+def test_loading_deck_compiles_slides(empty_file: Path) -> None:
+    empty_file.write_text(
+        dedent(
+            """\
+            from spiel import Deck, Slide
+
+            deck = Deck(name="deck")
+            deck.add_slides(Slide(), Slide())
+            """
+        )
+    )
+
+    deck = load_deck(empty_file)
+
+    assert all(slide._content_plan is not None for slide in deck)
@@ -0,0 +1,53 @@
+from io import StringIO
+
+import pytest
+
+from spiel.performance import ByteCounter, RateMeter
+
+
+def test_rate_meter_counts_events_in_window() -> None:
+    meter = RateMeter(window=2)
+
+    for now in (0, 0.5, 1, 1.5):
+        meter.tick(now=now)
+
+    assert meter.rate(now=1.5) == pytest.approx(2)
+    assert meter.rate(now=2.25) == pytest.approx(1.5)
+    assert meter.rate(now=10) == 0
+
+
+def test_rate_meter_with_amounts() -> None:
+    meter = RateMeter(window=1)
+
+    meter.tick(100, now=0)
+    meter.tick(50, now=0.5)
+
+    assert meter.rate(now=0.5) == pytest.approx(150)
+    assert meter.rate(now=1.25) == pytest.approx(50)
+
+
+def test_byte_counter() -> None:
+    file = StringIO()
+    counter = ByteCounter(file)
+
+    counter.write("abc")
+    counter.write("é")
+    counter.flush()
+    counter.end_update()
+
+    assert file.getvalue() == "abcé"
+    assert counter.total == 5
+    assert counter.last == 5
+
+
+def test_byte_counter_counts_each_update_separately() -> None:
+    counter = ByteCounter(StringIO())
+
+    for text in ("start", "frame", "end"):
+        counter.write(text)
+    counter.end_update()
+    counter.write("ab")
+    counter.end_update()
+
+    assert counter.total == 15
+    assert counter.last == 2
@@ -0,0 +1,54 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from spiel import quality
+from spiel.quality import Quality
+
+
+@pytest.fixture(autouse=True)
+def reset() -> Iterator[None]:
+    yield
+    quality.set_settling(False)
+
+
+def test_full_quality_by_default() -> None:
+    assert quality.current() is Quality.Full
+    assert not quality.settling()
+
+
+def test_preview_quality_while_settling() -> None:
+    quality.set_settling(True)
+
+    assert quality.current() is Quality.Preview
+    assert quality.settling()
+
+
+@pytest.mark.parametrize("settling", [True, False])
+@pytest.mark.parametrize("q", list(Quality))
+def test_rendering_at_overrides_settling(settling: bool, q: Quality) -> None:
+    quality.set_settling(settling)
+
+    with quality.rendering_at(q):
+        assert quality.current() is q
+        assert not quality.settling()
+
+    assert quality.settling() is settling
+
+
+def test_rendering_at_only_affects_current_thread() -> None:
+    quality.set_settling(True)
+
+    with quality.rendering_at(Quality.Full), ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(quality.current).result() is Quality.Preview
+
+
+def test_placeholders_rendered_are_counted_per_thread() -> None:
+    before = quality.placeholders_rendered()
+
+    quality.rendered_placeholder()
+
+    assert quality.placeholders_rendered() == before + 1
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(quality.placeholders_rendered).result() == 0
@@ -0,0 +1,128 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from spiel.scheduling import Clock, next_frame_time
+
+
+@pytest.mark.parametrize(
+    ("previous", "now", "interval", "expected"),
+    [
+        (None, 0, 1, 1),
+        (None, 5.5, 1, 6.5),
+        (0, 0.5, 1, 1),
+        (0, 0, 1, 1),
+        (0, 1, 1, 2),  # exactly on a deadline, so the next one is a full frame later
+        (0, 2.5, 1, 3),  # fell behind, so the frames at 1 and 2 are dropped
+        (0, 10.25, 0.5, 10.5),
+    ],
+)
+def test_next_frame_time(
+    previous: float | None, now: float, interval: float, expected: float
+) -> None:
+    assert next_frame_time(previous, now, interval) == expected
+
+
+@pytest.mark.parametrize("now", [0, 0.1, 0.99, 1, 3.7, 100])
+def test_next_frame_time_is_always_after_now(now: float) -> None:
+    assert next_frame_time(0, now, 1) > now
+
+
+@pytest.fixture()
+def now(mocker: MockerFixture) -> list[float]:
+    now = [0.0]
+    mocker.patch("spiel.scheduling.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+@pytest.fixture()
+def clock(mocker: MockerFixture) -> Clock:
+    mocker.patch("spiel.scheduling.Timer")
+    return Clock(owner=MagicMock())
+
+
+def test_at_is_called_once_after_deadline(clock: Clock, now: list[float]) -> None:
+    callback = MagicMock()
+    clock.at(1, callback)
+
+    clock.tick()
+    assert callback.call_count == 0
+
+    now[0] = 1
+    clock.tick()
+    now[0] = 2
+    clock.tick()
+
+    assert callback.call_count == 1
+    assert not clock._subscriptions
+
+
+def test_every_is_called_at_each_interval(clock: Clock, now: list[float]) -> None:
+    callback = MagicMock()
+    clock.every(1, callback)
+
+    for t in (0.5, 1, 1.5, 2, 5):
+        now[0] = t
+        clock.tick()
+
+    # called at 1, 2, and 5 (the missed ticks at 3 and 4 are dropped)
+    assert callback.call_count == 3
+
+
+def test_every_with_observe_is_only_called_when_observed_value_changes(
+    clock: Clock, now: list[float]
+) -> None:
+    callback = MagicMock()
+    clock.every(1, callback, observe=lambda: now[0] // 3)
+
+    for t in range(1, 10):
+        now[0] = t
+        clock.tick()
+
+    # the observed value changes at 3, 6, and 9
+    assert callback.call_count == 3
+
+
+def test_cancel(clock: Clock, now: list[float]) -> None:
+    callback = MagicMock()
+    subscription = clock.every(1, callback)
+
+    clock.cancel(subscription)
+    clock.cancel(subscription)  # cancelling twice is fine
+
+    now[0] = 2
+    clock.tick()
+
+    assert callback.call_count == 0
+
+
+def test_timer_is_set_for_earliest_deadline(clock: Clock, now: list[float]) -> None:
+    clock.at(5, MagicMock())
+    clock.at(2, MagicMock())
+    clock.at(3, MagicMock())
+
+    assert clock._timer_deadline == 2
+
+
+@pytest.mark.parametrize("raises_in", ["callback", "observe"])
+def test_failing_subscriber_does_not_stop_others(
+    clock: Clock, now: list[float], raises_in: str
+) -> None:
+    def fail() -> None:
+        raise Exception("oops")
+
+    if raises_in == "callback":
+        clock.every(1, fail)
+    else:
+        observed = iter([0])
+        clock.every(1, MagicMock(), observe=lambda: next(observed))
+    callback = MagicMock()
+    clock.every(1, callback)
+
+    for t in (1, 2):
+        now[0] = t
+        clock.tick()
+
+    assert callback.call_count == 2
+    assert clock._timer_deadline == 3
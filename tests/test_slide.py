@@ -1,5 +1,117 @@
+from unittest.mock import MagicMock
+
+import pytest
+from rich.console import Console, RenderableType
+from rich.errors import NotRenderableError
+from rich.text import Text
+
 from spiel import Slide, Triggers
+from spiel.renderables.cached import CachedRenderable
+from spiel.slide import RENDER_CACHE_SIZES
 
 
 def test_can_render_default_slide() -> None:
     Slide().render(triggers=Triggers.new())
+
+
+def test_static_content_is_rendered_once_per_size() -> None:
+    content = MagicMock(return_value=Text("foo"))
+    slide = Slide(content=content)
+
+    first = slide.render_cached(triggers=Triggers.new(), size=(80, 24))
+    second = slide.render_cached(triggers=Triggers.new(), size=(80, 24))
+
+    assert isinstance(first, CachedRenderable)
+    assert first is second
+    assert content.call_count == 1
+
+    slide.render_cached(triggers=Triggers.new(), size=(100, 24))
+
+    assert content.call_count == 2
+
+
+def test_content_that_takes_triggers_is_always_rendered() -> None:
+    calls = []
+
+    def content(triggers: Triggers) -> RenderableType:
+        calls.append(triggers)
+        return Text(str(triggers.now))
+
+    slide = Slide(content=content)
+
+    for _ in range(3):
+        slide.render_cached(triggers=Triggers.new(), size=(80, 24))
+
+    assert len(calls) == 3
+
+
+def test_render_cache_is_bounded() -> None:
+    slide = Slide()
+
+    for width in range(RENDER_CACHE_SIZES * 2):
+        slide.render_cached(triggers=Triggers.new(), size=(width, 24))
+
+    assert len(slide._render_cache) == RENDER_CACHE_SIZES
+
+
+def test_unrenderable_content_is_not_cached() -> None:
+    slide = Slide(content=lambda: None)  # type: ignore[arg-type,return-value]
+
+    assert slide.render_cached(triggers=Triggers.new(), size=(80, 24)) is None
+    assert not slide._render_cache
+
+
+def test_content_plan_is_recompiled_when_content_changes() -> None:
+    slide = Slide(content=lambda: Text("foo"))
+
+    slide.render_cached(triggers=Triggers.new(), size=(80, 24))
+    takes_triggers_before = slide.takes_triggers
+
+    slide.content = lambda triggers: Text("bar")
+
+    assert (takes_triggers_before, slide.takes_triggers) == (False, True)
+    assert not slide._render_cache
+
+
+def test_binding_plan() -> None:
+    suspended = []
+
+    def bind(suspend: object) -> None:
+        suspended.append(suspend)
+
+    slide = Slide(bindings={"a": bind})
+
+    assert slide.binding_plan("b") is None
+
+    plan = slide.binding_plan("a")
+    assert plan is not None
+    plan(suspend="s")
+
+    assert suspended == ["s"]
+
+
+def test_compile_precomputes_plans() -> None:
+    slide = Slide(bindings={"a": lambda: None})
+
+    slide.compile()
+
+    assert slide._content_plan is not None
+    assert set(slide._binding_plans) == {"a"}
+
+
+def test_render_lines_of_static_content_are_cached(console: Console) -> None:
+    slide = Slide(content=lambda: Text("foo"))
+
+    first = slide.render_lines(triggers=Triggers.new(), console=console, size=(20, 5))
+    second = slide.render_lines(triggers=Triggers.new(), console=console, size=(20, 5))
+
+    assert first is second
+    assert "".join(segment.text for segment in first[0]) == "foo"
+    assert len(first) == 5
+
+
+def test_render_lines_of_unrenderable_content_raises(console: Console) -> None:
+    slide = Slide(content=lambda: None)  # type: ignore[arg-type,return-value]
+
+    with pytest.raises(NotRenderableError):
+        slide.render_lines(triggers=Triggers.new(), console=console, size=(20, 5))
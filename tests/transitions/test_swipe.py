@@ -1,10 +1,11 @@
 import pytest
 from hypothesis import HealthCheck, given, settings
 from hypothesis.strategies import floats
+from rich.segment import Segment
 from textual.css.scalar import Scalar, ScalarOffset, Unit
 from textual.widget import Widget
 
-from spiel import Direction, Swipe, Transition
+from spiel import CompositingTransition, Direction, Swipe, Transition
 
 
 @pytest.fixture()
@@ -119,3 +120,56 @@ def test_swipe_progress_always_balances_for_right(
     )
 
     assert abs(from_widget.styles.offset.x.value) + to_widget.styles.offset.x.value == 100
+
+
+def line(text: str) -> list[Segment]:
+    return [Segment(text)]
+
+
+@pytest.mark.parametrize(
+    ("progress", "direction", "expected"),
+    [
+        (0, Direction.Next, "aaaa"),
+        (25, Direction.Next, "aaab"),
+        (50, Direction.Next, "aabb"),
+        (100, Direction.Next, "bbbb"),
+        (0, Direction.Previous, "aaaa"),
+        (25, Direction.Previous, "baaa"),
+        (50, Direction.Previous, "bbaa"),
+        (100, Direction.Previous, "bbbb"),
+    ],
+)
+def test_swipe_composite(
+    transition: Swipe,
+    progress: float,
+    direction: Direction,
+    expected: str,
+) -> None:
+    frame = transition.composite(
+        from_lines=[line("aaaa"), line("AAAA")],
+        to_lines=[line("bbbb"), line("BBBB")],
+        direction=direction,
+        progress=progress,
+        width=4,
+    )
+
+    texts = ["".join(segment.text for segment in frame_line) for frame_line in frame]
+    assert texts == [expected, expected.upper()]
+
+
+@given(progress=floats(min_value=0, max_value=100))
+@settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
+def test_swipe_composite_always_fills_width(transition: Swipe, progress: float) -> None:
+    frame = transition.composite(
+        from_lines=[line("a" * 10)],
+        to_lines=[line("b" * 10)],
+        direction=Direction.Next,
+        progress=progress,
+        width=10,
+    )
+
+    assert Segment.get_line_length(frame[0]) == 10
+
+
+def test_swipe_is_compositing_transition() -> None:
+    assert isinstance(Swipe(), CompositingTransition)
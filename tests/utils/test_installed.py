@@ -0,0 +1,16 @@
+from spiel.utils import Installed
+
+
+def test_nothing_is_installed_by_default() -> None:
+    assert Installed[int]().value is None
+
+
+def test_using_restores_previous_value() -> None:
+    installed: Installed[int] = Installed()
+    installed.install(1)
+
+    with installed.using(2) as value:
+        assert value == 2
+        assert installed.value == 2
+
+    assert installed.value == 1
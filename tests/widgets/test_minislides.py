@@ -0,0 +1,269 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import StringIO
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.text import Text
+from textual.geometry import Size
+
+from spiel import Deck, Slide, quality
+from spiel.renderables.miniature import Miniature
+from spiel.widgets.minislides import MiniSlides, split
+
+CELL = (40, 10)
+
+
+@pytest.fixture()
+def calls() -> list[int]:
+    return []
+
+
+@pytest.fixture()
+def deck(calls: list[int]) -> Deck:
+    deck = Deck(name="deck")
+
+    for idx in range(6):
+
+        def content(idx: int = idx) -> RenderableType:
+            calls.append(idx)
+            return Text(f"slide {idx}")
+
+        deck.add_slides(Slide(title=str(idx), content=content))
+
+    return deck
+
+
+@pytest.fixture()
+def size() -> Size:
+    return Size(80, 20)
+
+
+@pytest.fixture()
+def app(mocker: MockerFixture, deck: Deck, console: Console, size: Size) -> MagicMock:
+    app = MagicMock(
+        deck=deck,
+        current_slide_idx=0,
+        deck_grid_width=2,
+        deck_miniatures=False,
+        thumbnail_executor=None,
+        console=console,
+    )
+    mocker.patch.object(MiniSlides, "app", new_callable=mocker.PropertyMock, return_value=app)
+    mocker.patch.object(MiniSlides, "size", new_callable=mocker.PropertyMock, return_value=size)
+    return app
+
+
+def test_moving_selection_reuses_slide_content(
+    app: MagicMock, console: Console, calls: list[int]
+) -> None:
+    ms = MiniSlides()
+
+    console.print(ms.render())
+    assert sorted(calls) == [0, 1, 2, 3]
+
+    app.current_slide_idx = 1
+    console.print(ms.render())
+    assert sorted(calls) == [0, 1, 2, 3]
+
+
+def test_thumbnails_are_cached(app: MagicMock, deck: Deck) -> None:
+    ms = MiniSlides()
+
+    assert ms.thumbnail(0, deck[0], is_active_slide=True, cell=CELL) is ms.thumbnail(
+        0, deck[0], is_active_slide=True, cell=CELL
+    )
+    assert ms.thumbnail(0, deck[0], is_active_slide=True, cell=CELL) is not ms.thumbnail(
+        0, deck[0], is_active_slide=False, cell=CELL
+    )
+
+
+def test_clear_thumbnails(app: MagicMock, deck: Deck, calls: list[int]) -> None:
+    ms = MiniSlides()
+
+    ms.thumbnail(0, deck[0], is_active_slide=True, cell=CELL)
+    ms.clear_thumbnails()
+    ms.thumbnail(0, deck[0], is_active_slide=True, cell=CELL)
+
+    assert calls == [0, 0]
+
+
+def test_failed_slide_thumbnail(app: MagicMock, console: Console, output: StringIO) -> None:
+    def content() -> RenderableType:
+        raise Exception("oops")
+
+    ms = MiniSlides()
+
+    console.print(ms.thumbnail(0, Slide(content=content), is_active_slide=True, cell=CELL))
+
+    assert "Failed to render slide 1 due to:" in output.getvalue()
+    assert "oops" in output.getvalue()
+
+
+def rendered_text(ms: MiniSlides, console: Console) -> list[str]:
+    with console.capture() as capture:
+        console.print(ms.render())
+    return capture.get().splitlines()
+
+
+def test_render_fills_widget(app: MagicMock, console: Console, size: Size) -> None:
+    lines = rendered_text(MiniSlides(), console)
+
+    assert len(lines) == size.height
+    assert "1 | 0" in lines[0]
+    assert "2 | 1" in lines[0]
+    assert "3 | 2" in lines[size.height // 2]
+
+
+def test_render_only_renders_visible_rows(
+    app: MagicMock, console: Console, deck: Deck, calls: list[int]
+) -> None:
+    def content() -> RenderableType:
+        calls.append(-1)
+        return Text("")
+
+    deck.add_slides(*(Slide(content=content) for _ in range(1000)))
+
+    ms = MiniSlides()
+    app.current_slide_idx = 2
+    ms.scroll_row = ms.target_row()
+    console.print(ms.render())
+
+    assert sorted(calls) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    ("current_slide_idx", "expected"),
+    [
+        (0, 0),
+        (1, 0),
+        (2, 0),
+        (3, 0),
+        (4, 1),
+        (5, 1),
+    ],
+)
+def test_target_row(app: MagicMock, current_slide_idx: int, expected: int) -> None:
+    app.current_slide_idx = current_slide_idx
+
+    assert MiniSlides().target_row() == expected
+
+
+def test_render_partially_scrolled(app: MagicMock, console: Console, size: Size) -> None:
+    ms = MiniSlides()
+    ms.scroll_row = 0.5
+
+    lines = rendered_text(ms, console)
+
+    assert len(lines) == size.height
+    assert "3 | 2" in lines[(size.height // 2) // 2]
+
+
+@pytest.mark.parametrize("size", [Size(20, 6)])
+def test_small_cells_only_show_titles(
+    app: MagicMock, console: Console, calls: list[int], size: Size
+) -> None:
+    lines = rendered_text(MiniSlides(), console)
+
+    assert any("1 | 0" in line for line in lines)
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    ("total", "parts", "expected"),
+    [
+        (10, 1, [10]),
+        (10, 2, [5, 5]),
+        (10, 3, [3, 3, 4]),
+        (2, 3, [0, 1, 1]),
+    ],
+)
+def test_split(total: int, parts: int, expected: list[int]) -> None:
+    assert split(total, parts) == expected
+
+
+def test_miniatures_are_rendered_at_full_size(
+    mocker: MockerFixture, app: MagicMock, console: Console, deck: Deck, size: Size
+) -> None:
+    app.deck_miniatures = True
+    render_lines = mocker.spy(Slide, "render_lines")
+
+    ms = MiniSlides()
+    result = ms.content(0, deck[0], cell=CELL)
+    assert result is not None
+    content, failed = result
+
+    assert isinstance(content.renderable, Miniature)
+    assert not failed
+    assert render_lines.call_args.kwargs["size"] == (size.width, size.height)
+
+    lines = rendered_text(ms, console)
+    assert len(lines) == size.height
+    assert "▀" in lines[1]
+
+
+@dataclass
+class NotReady:
+    """Renders as a placeholder until it is ready, like an image rendered in the background."""
+
+    ready: bool = False
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        if not self.ready:
+            quality.rendered_placeholder()
+        yield Text("ready" if self.ready else "not ready")
+
+
+@pytest.mark.parametrize("miniatures", [False, True])
+def test_content_with_placeholders_is_not_cached(app: MagicMock, miniatures: bool) -> None:
+    app.deck_miniatures = miniatures
+    not_ready = NotReady()
+    slide = Slide(content=lambda: not_ready)
+
+    ms = MiniSlides()
+
+    assert ms.content(0, slide, cell=CELL) is None
+    assert not ms._contents
+
+    not_ready.ready = True
+
+    assert ms.content(0, slide, cell=CELL) is not None
+    assert 0 in ms._contents
+
+
+async def test_thumbnails_are_rendered_in_executor(
+    app: MagicMock, console: Console, deck: Deck, calls: list[int]
+) -> None:
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        app.thumbnail_executor = executor
+        ms = MiniSlides()
+        refresh = MagicMock()
+        ms.refresh = refresh  # type: ignore[method-assign]
+
+        assert "Rendering..." in "\n".join(rendered_text(ms, console))
+
+        await asyncio.gather(*ms._pending.values())
+
+        assert not ms._pending
+        assert sorted(calls) == [0, 1, 2, 3]
+        assert refresh.call_count == 4
+
+        assert "Rendering..." not in "\n".join(rendered_text(ms, console))
+        assert sorted(calls) == [0, 1, 2, 3]
+
+
+async def test_clearing_thumbnails_discards_pending_renders(app: MagicMock, deck: Deck) -> None:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        app.thumbnail_executor = executor
+        ms = MiniSlides()
+
+        assert ms.content(0, deck[0], cell=CELL) is None
+        (future,) = ms._pending.values()
+
+        ms.clear_thumbnails()
+        await asyncio.wait([future])
+
+        assert not ms._contents
@@ -1,12 +1,19 @@
+import asyncio
+from unittest.mock import MagicMock
+
 import pytest
 from pytest import FixtureRequest
 from pytest_mock import MockerFixture
-from rich.console import RenderableType
+from rich.console import Console, RenderableType
 from rich.panel import Panel
 from rich.text import Text
+from textual.geometry import Size
 
-from spiel import Slide
-from spiel.widgets.slide import SlideWidget
+from spiel import Slide, Triggers, quality
+from spiel.quality import Quality
+from spiel.renderables.cached import RenderedLines
+from spiel.renderables.placeholder import PLACEHOLDER
+from spiel.widgets.slide import OVERRUNS_BEFORE_BACKGROUND, SlideWidget, prerender, render_frame
 
 
 @pytest.fixture(params=["", Text()])
@@ -33,6 +40,16 @@ def unrenderable_slide() -> Slide:
     return Slide(content=content)  # type: ignore[arg-type]
 
 
+@pytest.fixture()
+def app(mocker: MockerFixture) -> MagicMock:
+    app = MagicMock(
+        idle=False, slide_refresh_rate=1 / 10, fixed_triggers=None, show_performance=False
+    )
+    app.deck.render_budget = None
+    mocker.patch.object(SlideWidget, "app", new_callable=mocker.PropertyMock, return_value=app)
+    return app
+
+
 def mock(mocker: MockerFixture, slide: Slide) -> SlideWidget:
     sw = SlideWidget()
 
@@ -48,15 +65,15 @@ def mock(mocker: MockerFixture, slide: Slide) -> SlideWidget:
     return sw
 
 
-def test_render(mocker: MockerFixture, slide: Slide) -> None:
+def test_render(mocker: MockerFixture, app: MagicMock, slide: Slide) -> None:
     sw = mock(mocker, slide)
 
-    assert sw.render() == slide.render(triggers=sw.triggers)
+    assert sw.render() == slide.render_cached(triggers=sw.triggers, size=sw.size)
 
     assert "error" not in sw.classes
 
 
-def test_render_raises_exception(mocker: MockerFixture, error_slide: Slide) -> None:
+def test_render_raises_exception(mocker: MockerFixture, app: MagicMock, error_slide: Slide) -> None:
     sw = mock(mocker, error_slide)
 
     error = sw.render()
@@ -67,7 +84,9 @@ def test_render_raises_exception(mocker: MockerFixture, error_slide: Slide) -> N
     assert "error" in sw.classes
 
 
-def test_render_content_not_renderable(mocker: MockerFixture, unrenderable_slide: Slide) -> None:
+def test_render_content_not_renderable(
+    mocker: MockerFixture, app: MagicMock, unrenderable_slide: Slide
+) -> None:
     sw = mock(mocker, unrenderable_slide)
 
     error = sw.render()
@@ -87,3 +106,307 @@ def test_update_triggers() -> None:
 
     assert initial_triggers.now <= sw.triggers.now
     assert list(initial_triggers) == list(sw.triggers)
+
+
+def animated(triggers: Triggers) -> RenderableType:
+    return Text(str(triggers.now))
+
+
+def test_static_slide_is_not_scheduled(mocker: MockerFixture, app: MagicMock) -> None:
+    sw = mock(mocker, Slide(content=Text))
+
+    assert sw.next_frame_deadline(now=0) is None
+
+
+def test_animated_slide_is_scheduled_at_refresh_rate(mocker: MockerFixture, app: MagicMock) -> None:
+    sw = mock(mocker, Slide(content=animated))
+
+    assert sw.next_frame_deadline(now=0) == pytest.approx(1 / 10)
+
+
+def test_animated_slide_is_scheduled_at_its_fps(mocker: MockerFixture, app: MagicMock) -> None:
+    sw = mock(mocker, Slide(content=animated, fps=4))
+
+    assert sw.next_frame_deadline(now=0) == pytest.approx(1 / 4)
+
+
+def test_animated_slide_is_not_scheduled_while_idle(mocker: MockerFixture, app: MagicMock) -> None:
+    app.idle = True
+    sw = mock(mocker, Slide(content=animated))
+
+    assert sw.next_frame_deadline(now=0) is None
+
+
+@pytest.mark.parametrize(
+    ("next_change", "expected"),
+    [
+        (None, None),
+        (0, 1 / 10),  # the change is due immediately, but we still wait for the next frame
+        (5, 5),
+    ],
+)
+def test_animated_slide_is_scheduled_for_next_change(
+    mocker: MockerFixture, app: MagicMock, next_change: float | None, expected: float | None
+) -> None:
+    sw = mock(mocker, Slide(content=animated, next_change=lambda triggers: next_change))
+
+    assert sw.next_frame_deadline(now=0) == (
+        pytest.approx(expected) if expected is not None else None
+    )
+
+
+def test_prerender_fills_render_cache_of_static_slides(console: Console) -> None:
+    static = Slide(content=Text)
+    animated_slide = Slide(content=animated)
+
+    prerender([static, animated_slide], console=console, size=(20, 5))
+
+    assert set(static._render_cache) == {(20, 5)}
+    assert not animated_slide._render_cache
+
+
+def test_prerender_ignores_errors(console: Console, error_slide: Slide) -> None:
+    prerender([error_slide], console=console, size=(20, 5))
+
+    assert not error_slide._render_cache
+
+
+async def test_only_one_prefetch_runs_at_a_time(
+    mocker: MockerFixture, app: MagicMock, console: Console
+) -> None:
+    app.console = console
+    app.deck = [Slide(), Slide(), Slide()]
+    app.current_slide_idx = 1
+    prerender = mocker.patch("spiel.widgets.slide.prerender")
+    size = mocker.patch.object(
+        SlideWidget, "size", new_callable=mocker.PropertyMock, return_value=Size(20, 5)
+    )
+    sw = SlideWidget()
+
+    sw.prefetch()
+    first = sw._prefetch
+    assert first is not None
+
+    # e.g., while the terminal is being resized
+    for width in (30, 40, 50):
+        size.return_value = Size(width, 5)
+        sw.prefetch()
+    assert sw._prefetch is first
+
+    await first
+    await asyncio.sleep(0)  # let the done callback run
+
+    second = sw._prefetch
+    assert second is not None and second is not first
+    await second
+    await asyncio.sleep(0)
+
+    assert not sw._prefetch_again
+    assert [c.args[2] for c in prerender.call_args_list] == [(20, 5), (50, 5)]
+
+
+@pytest.mark.parametrize(
+    ("slide_budget", "deck_budget", "expected"),
+    [
+        (None, None, None),
+        (None, 1, 1),
+        (2, None, 2),
+        (2, 1, 2),
+    ],
+)
+def test_render_budget(
+    mocker: MockerFixture,
+    app: MagicMock,
+    slide_budget: float | None,
+    deck_budget: float | None,
+    expected: float | None,
+) -> None:
+    app.deck.render_budget = deck_budget
+    sw = mock(mocker, Slide(render_budget=slide_budget))
+
+    assert sw.render_budget == expected
+
+
+def test_render_within_budget(mocker: MockerFixture, app: MagicMock, console: Console) -> None:
+    app.console = console
+    slide = Slide(content=lambda: Text("hello"), render_budget=10)
+    sw = mock(mocker, slide)
+
+    assert isinstance(sw.render(), RenderedLines)
+    assert slide._overruns == 0
+    assert app.over_budget is False
+
+
+def test_slide_over_budget_moves_to_background(
+    mocker: MockerFixture, app: MagicMock, console: Console
+) -> None:
+    app.console = console
+    slide = Slide(content=lambda: Text("hello"), render_budget=0)
+    sw = mock(mocker, slide)
+
+    for _ in range(OVERRUNS_BEFORE_BACKGROUND - 1):
+        sw.render()
+
+    assert app.over_budget is True
+    assert slide._overruns == OVERRUNS_BEFORE_BACKGROUND - 1
+    app.set_message_temporarily.assert_not_called()
+
+    sw.render()
+
+    assert slide._render_in_background
+    app.set_message_temporarily.assert_called_once()
+
+
+async def test_render_in_background(
+    mocker: MockerFixture, app: MagicMock, console: Console
+) -> None:
+    app.console = console
+    slide = Slide(content=lambda: Text("hello"), render_budget=1)
+    slide._render_in_background = True
+    sw = mock(mocker, slide)
+    mocker.patch.object(
+        SlideWidget, "size", new_callable=mocker.PropertyMock, return_value=Size(20, 5)
+    )
+    refresh = mocker.patch.object(sw, "refresh")
+
+    assert sw.render() is PLACEHOLDER
+
+    task = sw._background_render
+    assert task is not None
+    await task
+    await asyncio.sleep(0)  # let the done callback run
+
+    refresh.assert_called_once()
+    assert sw._background_render is None
+
+    frame = sw.render()
+    assert isinstance(frame, RenderedLines)
+    assert "hello" in "".join(segment.text for segment in frame.lines[0])
+
+    # the triggers haven't changed, so there's no need to render again
+    assert sw._background_render is None
+
+
+async def test_render_in_background_again_after_settling(
+    mocker: MockerFixture, app: MagicMock, console: Console
+) -> None:
+    app.console = console
+    slide = Slide(content=lambda: Text("hello"), render_budget=1)
+    slide._render_in_background = True
+    sw = mock(mocker, slide)
+    mocker.patch.object(
+        SlideWidget, "size", new_callable=mocker.PropertyMock, return_value=Size(20, 5)
+    )
+    mocker.patch.object(sw, "refresh")
+
+    quality.set_settling(True)
+    try:
+        sw.render()
+        task = sw._background_render
+        assert task is not None
+        await task
+        await asyncio.sleep(0)  # let the done callback run
+
+        # nothing has changed, so there's no need to render again
+        sw.render()
+        assert sw._background_render is None
+    finally:
+        quality.set_settling(False)
+
+    rendered_at = sw._background_request
+    sw.render()
+    assert sw._background_request != rendered_at
+    assert sw._background_request is not None
+    assert sw._background_request[-1] is Quality.Full
+
+
+async def test_render_in_background_keeps_last_good_frame(
+    mocker: MockerFixture, app: MagicMock, console: Console
+) -> None:
+    app.console = console
+    fail = False
+
+    def content(triggers: Triggers) -> RenderableType:
+        if fail:
+            raise Exception("oops")
+        return Text("hello")
+
+    slide = Slide(content=content, render_budget=1)
+    slide._render_in_background = True
+    sw = mock(mocker, slide)
+    mocker.patch.object(
+        SlideWidget, "size", new_callable=mocker.PropertyMock, return_value=Size(20, 5)
+    )
+    mocker.patch.object(sw, "refresh")
+
+    for failing in (False, True):
+        fail = failing
+        sw.triggers = Triggers(now=sw.triggers.now + 1, _times=sw.triggers._times)
+        sw.render()
+        task = sw._background_render
+        assert task is not None
+        await task
+        await asyncio.sleep(0)  # let the done callback run
+
+    assert sw.has_class("error")
+
+    frame = sw.render()
+    assert isinstance(frame, RenderedLines)
+    assert "hello" in "".join(segment.text for segment in frame.lines[0])
+
+
+async def test_render_in_background_shows_failure_without_good_frame(
+    mocker: MockerFixture, app: MagicMock, console: Console, error_slide: Slide
+) -> None:
+    app.console = console
+    error_slide.render_budget = 1
+    error_slide._render_in_background = True
+    sw = mock(mocker, error_slide)
+    mocker.patch.object(
+        SlideWidget, "size", new_callable=mocker.PropertyMock, return_value=Size(40, 10)
+    )
+    mocker.patch.object(sw, "refresh")
+
+    sw.render()
+    task = sw._background_render
+    assert task is not None
+    await task
+    await asyncio.sleep(0)  # let the done callback run
+
+    assert sw.last_frame is None
+    frame = sw.render()
+    assert isinstance(frame, RenderedLines)
+    assert "Slide content failed to render" in "".join(
+        segment.text for line in frame.lines for segment in line
+    )
+
+
+def test_render_with_performance_overlay_records_frames(
+    mocker: MockerFixture, app: MagicMock, console: Console
+) -> None:
+    app.console = console
+    app.show_performance = True
+    slide = Slide(content=lambda: Text("hello"))
+    sw = mock(mocker, slide)
+    mocker.patch.object(
+        SlideWidget, "size", new_callable=mocker.PropertyMock, return_value=Size(20, 5)
+    )
+
+    assert isinstance(sw.render(), RenderedLines)
+
+    frame = sw.last_frame
+    assert frame is not None
+    assert not frame.failed
+    assert frame.segments > 0
+    assert frame.render_time == frame.content_time + frame.layout_time
+    assert sw.frame_rate.rate() > 0
+    assert slide._overruns == 0
+
+
+def test_render_frame_of_failing_slide(console: Console, error_slide: Slide) -> None:
+    frame = render_frame(error_slide, Triggers.new(), console, (40, 10))
+
+    assert frame.failed
+    assert "Slide content failed to render" in "".join(
+        segment.text for line in frame.lines for segment in line
+    )